@@ -1,11 +1,13 @@
 from flask import Flask
 from app.core import Config, init_app
 from app.utils import register_error_handlers, setup_logger
+from app.utils.google_ads_client import google_ads_clients
 
 
-def create_app():
+def create_app(**config_overrides):
     app = Flask(__name__)
     app.config.from_object(Config)
+    app.config.update(config_overrides)
     
     setup_logger(app)
     init_app(app)
@@ -15,4 +17,6 @@ def create_app():
     from app.api import api_v1_bp
     app.register_blueprint(api_v1_bp)
     
+    google_ads_clients.init_app(app)
+    
     return app
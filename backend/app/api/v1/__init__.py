@@ -2,6 +2,6 @@ from flask import Blueprint
 
 api_v1_bp = Blueprint('api_v1', __name__, url_prefix='/api/v1')
 
-from .endpoints import health, campaigns
+from .endpoints import health, campaigns, jobs, metrics, reports
 
 __all__ = ['api_v1_bp']
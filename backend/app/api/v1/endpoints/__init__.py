@@ -1,3 +1,3 @@
-from . import health, campaigns
+from . import health, campaigns, jobs, metrics, reports
 
-__all__ = ['health', 'campaigns']
+__all__ = ['health', 'campaigns', 'jobs', 'metrics', 'reports']
@@ -1,10 +1,18 @@
-from flask import jsonify, request
+import json
+import hashlib
+from flask import Response, current_app, jsonify, request, stream_with_context
 from marshmallow import ValidationError
 from app.api.v1 import api_v1_bp
-from app.core.extensions import db
+from app.core.extensions import db, job_queue, response_cache
+from app.core.database import read_from_primary, replica_reads
 from app.core.config import Config
-from app.services import CampaignService
-from app.schemas import campaign_schema, campaigns_schema
+from app.services import CampaignService, CampaignBusyError, JobService
+from app.schemas import (
+    campaign_schema, campaigns_schema, campaign_row_serializer, campaign_filter_schema, publish_job_schema
+)
+from app.constants import Pagination, Export, Publish, BulkStatus, BulkImport
+from app.utils import fast_json
+from app.utils.bulk_reader import iter_csv_records, iter_ndjson_records
 
 
 @api_v1_bp.route('/campaigns', methods=['POST'])
@@ -20,7 +28,7 @@ def create_campaign():
             'message': 'Campaign created successfully',
             'campaign': campaign_schema.dump(campaign)
         }), 201
-        
+    
     except ValidationError as err:
         return jsonify({'error': 'Validation error', 'messages': err.messages}), 400
     except Exception as e:
@@ -28,28 +36,148 @@ def create_campaign():
         return jsonify({'error': str(e)}), 500
 
 
-@api_v1_bp.route('/campaigns', methods=['GET'])
-def get_campaigns():
+@api_v1_bp.route('/campaigns/bulk', methods=['POST'])
+def bulk_import_campaigns():
     try:
-        status = request.args.get('status')
-        campaigns = CampaignService.get_all_campaigns(status)
+        if request.mimetype == BulkImport.CSV_MIMETYPE:
+            records = iter_csv_records(request.stream)
+        elif request.mimetype == Export.NDJSON_MIMETYPE:
+            records = iter_ndjson_records(request.stream)
+        else:
+            return jsonify({'error': f'Content-Type must be {BulkImport.CSV_MIMETYPE} or {Export.NDJSON_MIMETYPE}'}), 415
+        
+        summary = CampaignService.bulk_import(records)
         
         return jsonify({
-            'campaigns': campaigns_schema.dump(campaigns),
-            'count': len(campaigns)
+            'message': f"Imported {summary['imported']} campaigns, {summary['failed']} rows rejected",
+            **summary
         }), 200
+    
+    except UnicodeDecodeError:
+        db.session.rollback()
+        return jsonify({'error': 'Request body must be UTF-8 encoded'}), 400
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+
+def _fast_serialization() -> bool:
+    return current_app.config.get('FAST_SERIALIZATION', False)
+
+
+def _fill_cache_from_primary() -> None:
+    # A replica read right after a write could cache the old row, with a fresh ETag, for the whole CACHE_TTL.
+    if response_cache.enabled:
+        read_from_primary()
+
+
+def _campaign_etag(payloads, *extra) -> str:
+    versions = [f"{payload['id']}@{payload['updated_at']}" for payload in payloads]
+    versions.extend(str(part) for part in extra)
+    return hashlib.sha1(','.join(versions).encode()).hexdigest()
+
+
+def _conditional_response(payload, etag):
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    elif _fast_serialization():
+        response = fast_json.json_response(payload)
+    else:
+        response = jsonify(payload)
+    response.set_etag(etag)
+    return response
+
+
+def _parse_filters() -> dict:
+    return campaign_filter_schema.load(
+        {key: value for key, value in request.args.items() if key in campaign_filter_schema.fields}
+    )
+
+
+def _stream_campaigns(filters):
+    def generate():
+        for campaign in CampaignService.iter_campaigns(filters):
+            yield json.dumps(campaign_schema.dump(campaign)) + '\n'
+    
+    def generate_fast():
+        dump_row = campaign_row_serializer.dump_row
+        for row in CampaignService.iter_campaigns(filters, columns=campaign_row_serializer.columns):
+            yield fast_json.dumps(dump_row(row), sort_keys=False) + b'\n'
+    
+    if _fast_serialization():
+        return Response(stream_with_context(generate_fast()), mimetype=Export.NDJSON_MIMETYPE)
+    return Response(stream_with_context(generate()), mimetype=Export.NDJSON_MIMETYPE)
+
+
+@api_v1_bp.route('/campaigns', methods=['GET'])
+@replica_reads
+def get_campaigns():
+    try:
+        filters = _parse_filters()
+        if request.accept_mimetypes.best == Export.NDJSON_MIMETYPE:
+            return _stream_campaigns(filters)
+        
+        limit = request.args.get('limit', Pagination.DEFAULT_LIMIT, type=int)
+        cursor = request.args.get('cursor')
+        
+        key = response_cache.campaign_list_key(sorted(filters.items()), limit, cursor)
+        cached = response_cache.get(key)
+        if cached is None:
+            _fill_cache_from_primary()
+            if _fast_serialization():
+                rows, next_cursor = CampaignService.get_campaigns_page(
+                    filters, limit, cursor, columns=campaign_row_serializer.columns
+                )
+                campaigns_data = campaign_row_serializer.dump_rows(rows)
+            else:
+                campaigns, next_cursor = CampaignService.get_campaigns_page(filters, limit, cursor)
+                campaigns_data = campaigns_schema.dump(campaigns)
+            payload = {
+                'campaigns': campaigns_data,
+                'count': len(campaigns_data),
+                'next_cursor': next_cursor
+            }
+            cached = {'payload': payload, 'etag': _campaign_etag(payload['campaigns'], next_cursor)}
+            response_cache.set(key, cached)
+        
+        return _conditional_response(cached['payload'], cached['etag'])
+    except ValidationError as err:
+        return jsonify({'error': 'Validation error', 'messages': err.messages}), 400
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
+@api_v1_bp.route('/campaigns/export', methods=['GET'])
+@replica_reads
+def export_campaigns():
+    try:
+        return _stream_campaigns(_parse_filters())
+    except ValidationError as err:
+        return jsonify({'error': 'Validation error', 'messages': err.messages}), 400
+
+
 @api_v1_bp.route('/campaigns/<uuid:campaign_id>', methods=['GET'])
+@replica_reads
 def get_campaign(campaign_id):
     try:
-        campaign = CampaignService.get_campaign_by_id(campaign_id)
-        if not campaign:
-            return jsonify({'error': 'Campaign not found'}), 404
+        key = response_cache.campaign_key(campaign_id)
+        cached = response_cache.get(key)
+        if cached is None:
+            _fill_cache_from_primary()
+            campaign = CampaignService.get_campaign_by_id(campaign_id)
+            if not campaign:
+                return jsonify({'error': 'Campaign not found'}), 404
+            
+            if _fast_serialization():
+                payload = campaign_row_serializer.dump_object(campaign)
+            else:
+                payload = campaign_schema.dump(campaign)
+            cached = {'payload': payload, 'etag': _campaign_etag([payload])}
+            response_cache.set(key, cached)
         
-        return jsonify(campaign_schema.dump(campaign)), 200
+        return _conditional_response(cached['payload'], cached['etag'])
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -58,8 +186,21 @@ def get_campaign(campaign_id):
 def publish_campaign(campaign_id):
     try:
         customer_id = Config.GOOGLE_ADS_CUSTOMER_ID
-        if not customer_id:
-            return jsonify({'error': 'Google Ads customer ID not configured'}), 500
+        
+        if request.args.get('dry_run', 'false').lower() == 'true':
+            return jsonify({
+                'message': 'Dry run: nothing was sent to Google Ads',
+                **CampaignService.plan_publish(str(campaign_id), customer_id)
+            }), 200
+        
+        if request.args.get('async', 'false').lower() == 'true':
+            job = JobService.enqueue_publish(str(campaign_id), customer_id)
+            response = jsonify({
+                'message': 'Campaign publish queued',
+                'job': publish_job_schema.dump(job)
+            })
+            response.headers['Location'] = f'{api_v1_bp.url_prefix}/jobs/{job.id}'
+            return response, 202
         
         campaign, warnings = CampaignService.publish_campaign(str(campaign_id), customer_id)
         
@@ -71,7 +212,71 @@ def publish_campaign(campaign_id):
             response['warnings'] = warnings
         
         return jsonify(response), 200
+    
+    except CampaignBusyError as e:
+        return jsonify({'error': str(e)}), 409
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+
+@api_v1_bp.route('/campaigns/publish-batch', methods=['POST'])
+def publish_campaigns():
+    try:
+        customer_id = Config.GOOGLE_ADS_CUSTOMER_ID
+        
+        data = request.get_json(silent=True) or {}
+        campaign_ids = data.get('campaign_ids')
+        if not isinstance(campaign_ids, list) or not campaign_ids:
+            return jsonify({'error': 'campaign_ids must be a non-empty list'}), 400
+        if len(campaign_ids) > Publish.MAX_BATCH_SIZE:
+            return jsonify({'error': f'At most {Publish.MAX_BATCH_SIZE} campaigns can be published per batch'}), 400
+        
+        results = CampaignService.publish_campaigns(campaign_ids, customer_id)
+        
+        response_results = []
+        for result in results:
+            if 'campaign' in result:
+                result = dict(result, campaign=campaign_schema.dump(result['campaign']))
+            response_results.append(result)
+        
+        published = sum(1 for result in results if result['success'])
+        return jsonify({
+            'message': f'Published {published} of {len(results)} campaigns',
+            'published': published,
+            'failed': len(results) - published,
+            'results': response_results
+        }), 200
+    
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+
+@api_v1_bp.route('/campaigns/status', methods=['PUT'])
+def update_campaign_statuses():
+    try:
+        customer_id = Config.GOOGLE_ADS_CUSTOMER_ID
+        
+        data = request.get_json(silent=True) or {}
+        campaign_ids = data.get('campaign_ids')
+        if not isinstance(campaign_ids, list) or not campaign_ids:
+            return jsonify({'error': 'campaign_ids must be a non-empty list'}), 400
+        if len(campaign_ids) > BulkStatus.MAX_BATCH_SIZE:
+            return jsonify({'error': f'At most {BulkStatus.MAX_BATCH_SIZE} campaigns can be updated per request'}), 400
+        
+        results = CampaignService.update_campaign_statuses(campaign_ids, customer_id, data.get('status'))
         
+        updated = sum(1 for result in results if result['success'])
+        return jsonify({
+            'message': f'Updated {updated} of {len(results)} campaigns',
+            'updated': updated,
+            'failed': len(results) - updated,
+            'results': results
+        }), 200
+    
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
     except Exception as e:
@@ -79,12 +284,33 @@ def publish_campaign(campaign_id):
         return jsonify({'error': str(e)}), 500
 
 
+@api_v1_bp.route('/campaigns/reconcile', methods=['POST'])
+def reconcile_campaign_statuses():
+    try:
+        customer_id = Config.GOOGLE_ADS_CUSTOMER_ID
+        
+        only_customer_id = request.args.get('customer_id')
+        
+        if request.args.get('async', 'false').lower() == 'true':
+            job_queue.submit(CampaignService.run_reconcile_job, customer_id, only_customer_id)
+            return jsonify({'message': 'Status reconciliation queued'}), 202
+        
+        summary = CampaignService.reconcile_statuses(customer_id, only_customer_id)
+        
+        return jsonify({
+            'message': f"Reconciled {summary['checked']} campaigns in {summary['customers']} accounts, {summary['updated']} updated",
+            **summary
+        }), 200
+    
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+
 @api_v1_bp.route('/campaigns/<uuid:campaign_id>/enable', methods=['PUT'])
 def enable_campaign(campaign_id):
     try:
         customer_id = Config.GOOGLE_ADS_CUSTOMER_ID
-        if not customer_id:
-            return jsonify({'error': 'Google Ads customer ID not configured'}), 500
         
         campaign = CampaignService.enable_campaign(str(campaign_id), customer_id)
         
@@ -92,7 +318,9 @@ def enable_campaign(campaign_id):
             'message': 'Campaign enabled successfully',
             'campaign': campaign_schema.dump(campaign)
         }), 200
-        
+    
+    except CampaignBusyError as e:
+        return jsonify({'error': str(e)}), 409
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
     except Exception as e:
@@ -104,8 +332,6 @@ def enable_campaign(campaign_id):
 def pause_campaign(campaign_id):
     try:
         customer_id = Config.GOOGLE_ADS_CUSTOMER_ID
-        if not customer_id:
-            return jsonify({'error': 'Google Ads customer ID not configured'}), 500
         
         campaign = CampaignService.pause_campaign(str(campaign_id), customer_id)
         
@@ -113,7 +339,9 @@ def pause_campaign(campaign_id):
             'message': 'Campaign paused successfully',
             'campaign': campaign_schema.dump(campaign)
         }), 200
-        
+    
+    except CampaignBusyError as e:
+        return jsonify({'error': str(e)}), 409
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
     except Exception as e:
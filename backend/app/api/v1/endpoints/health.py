@@ -1,6 +1,16 @@
 from flask import jsonify
 from app.api.v1 import api_v1_bp
-from app.core import db
+from app.core import db, metrics
+from app.core.database import REPLICA_BIND
+
+
+def _check_engine(engine) -> str:
+    try:
+        with engine.connect() as connection:
+            connection.execute(db.text('SELECT 1'))
+        return 'healthy'
+    except Exception as e:
+        return f'unhealthy: {str(e)}'
 
 
 @api_v1_bp.route('/health')
@@ -11,10 +21,15 @@ def health_check():
     except Exception as e:
         db_status = f'unhealthy: {str(e)}'
     
-    return jsonify({
+    response = {
         'status': 'ok',
-        'database': db_status
-    })
+        'database': db_status,
+        'database_pools': metrics.db_pool_stats()
+    }
+    if REPLICA_BIND in db.engines:
+        response['replica'] = _check_engine(db.engines[REPLICA_BIND])
+    
+    return jsonify(response)
 
 
 @api_v1_bp.route('/')
@@ -24,6 +39,8 @@ def api_info():
         'version': '1.0.0',
         'endpoints': {
             'campaigns': '/api/v1/campaigns',
-            'health': '/api/v1/health'
+            'health': '/api/v1/health',
+            'metrics': '/api/v1/metrics',
+            'reports': '/api/v1/reports'
         }
     })
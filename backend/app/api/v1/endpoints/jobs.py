@@ -0,0 +1,16 @@
+from flask import jsonify
+from app.api.v1 import api_v1_bp
+from app.services import JobService
+from app.schemas import publish_job_schema
+
+
+@api_v1_bp.route('/jobs/<uuid:job_id>', methods=['GET'])
+def get_job(job_id):
+    try:
+        job = JobService.get_job(job_id)
+        if not job:
+            return jsonify({'error': 'Job not found'}), 404
+        
+        return jsonify(publish_job_schema.dump(job)), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
@@ -0,0 +1,8 @@
+from flask import Response
+from app.api.v1 import api_v1_bp
+from app.core import metrics
+
+
+@api_v1_bp.route('/metrics')
+def get_metrics():
+    return Response(metrics.render(), content_type=metrics.CONTENT_TYPE)
@@ -0,0 +1,83 @@
+from flask import jsonify, request
+from marshmallow import ValidationError
+from app.api.v1 import api_v1_bp
+from app.core.extensions import db, job_queue
+from app.core.database import replica_reads
+from app.services import CampaignService, ReportingService
+from app.schemas import (
+    report_range_schema,
+    daily_rollups_schema,
+    campaign_rollups_schema,
+    campaign_daily_metrics_schema,
+    metrics_sync_summaries_schema
+)
+from app.constants import Pagination
+
+
+@api_v1_bp.route('/reports/sync', methods=['POST'])
+def sync_metrics():
+    try:
+        customer_id = request.args.get('customer_id')
+        customer_ids = [customer_id] if customer_id else CampaignService.published_customer_ids()
+        
+        # Accounts sync one after another (also when queued): each run rebuilds the shared daily rollups for its window.
+        if request.args.get('async', 'false').lower() == 'true':
+            job_queue.submit(ReportingService.run_sync_job, customer_ids)
+            return jsonify({'message': f'Metrics sync queued for {len(customer_ids)} accounts'}), 202
+        
+        summaries = [ReportingService.sync_metrics(customer_id) for customer_id in customer_ids]
+        
+        return jsonify({
+            'message': f"Synced {sum(summary['rows'] for summary in summaries)} metric rows",
+            'syncs': metrics_sync_summaries_schema.dump(summaries)
+        }), 200
+    
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+
+@api_v1_bp.route('/reports/daily', methods=['GET'])
+@replica_reads
+def get_daily_report():
+    try:
+        date_range = report_range_schema.load(request.args)
+        rollups = ReportingService.get_daily_rollups(date_range['date_from'], date_range['date_to'])
+        
+        return jsonify({'days': daily_rollups_schema.dump(rollups), 'count': len(rollups)}), 200
+    except ValidationError as err:
+        return jsonify({'error': 'Validation error', 'messages': err.messages}), 400
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@api_v1_bp.route('/reports/campaigns', methods=['GET'])
+@replica_reads
+def get_campaigns_report():
+    try:
+        limit = request.args.get('limit', Pagination.DEFAULT_LIMIT, type=int)
+        rollups = ReportingService.get_campaign_rollups(limit)
+        
+        return jsonify({'campaigns': campaign_rollups_schema.dump(rollups), 'count': len(rollups)}), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@api_v1_bp.route('/reports/campaigns/<uuid:campaign_id>/daily', methods=['GET'])
+@replica_reads
+def get_campaign_daily_report(campaign_id):
+    try:
+        date_range = report_range_schema.load(request.args)
+        metrics = ReportingService.get_campaign_daily_metrics(
+            campaign_id, date_range['date_from'], date_range['date_to']
+        )
+        
+        return jsonify({'days': campaign_daily_metrics_schema.dump(metrics), 'count': len(metrics)}), 200
+    except ValidationError as err:
+        return jsonify({'error': 'Validation error', 'messages': err.messages}), 400
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
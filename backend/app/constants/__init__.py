@@ -1,3 +1,7 @@
-from .campaign_constants import CampaignStatus
+from .campaign_constants import (
+    CampaignStatus, CampaignOperation, Pagination, Export, Publish, PublishPlan, BulkStatus, BulkImport, JobStatus,
+    Reconcile, Reporting
+)
 
-__all__ = ['CampaignStatus']
+__all__ = ['CampaignStatus', 'CampaignOperation', 'Pagination', 'Export', 'Publish', 'PublishPlan', 'BulkStatus', 'BulkImport', 'JobStatus',
+           'Reconcile', 'Reporting']
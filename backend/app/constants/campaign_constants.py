@@ -3,7 +3,75 @@ class CampaignStatus:
     PUBLISHED = 'PUBLISHED'
     ENABLED = 'ENABLED'
     PAUSED = 'PAUSED'
+    REMOVED = 'REMOVED'
     
     @classmethod
     def all(cls):
-        return [cls.DRAFT, cls.PUBLISHED, cls.ENABLED, cls.PAUSED]
+        return [cls.DRAFT, cls.PUBLISHED, cls.ENABLED, cls.PAUSED, cls.REMOVED]
+
+
+class CampaignOperation:
+    """Operations that hold a campaign's lock while they call Google Ads."""
+    PUBLISH = 'PUBLISH'
+    ENABLE = 'ENABLE'
+    PAUSE = 'PAUSE'
+
+
+class Pagination:
+    DEFAULT_LIMIT = 50
+    MAX_LIMIT = 500
+
+
+class Export:
+    NDJSON_MIMETYPE = 'application/x-ndjson'
+    BATCH_SIZE = 1000
+
+
+class Publish:
+    MAX_BATCH_SIZE = 1000
+    # Checkpointed publish steps, in order; each stores its <step>_resource_name on the campaign.
+    STEPS = ('asset', 'budget', 'campaign', 'ad_group', 'ad')
+
+
+class PublishPlan:
+    # Bump when the plan layout or the text rules change; older stored plans are recompiled on publish.
+    VERSION = 1
+    HEADLINE_MAX_WIDTH = 30
+    DESCRIPTION_MAX_WIDTH = 90
+    NAME_MAX_LENGTH = 255
+    # Budgets are set in whole cents (the minimum currency unit for most account currencies).
+    BUDGET_MICROS_UNIT = 10000
+
+
+class BulkStatus:
+    MAX_BATCH_SIZE = 5000
+
+
+class BulkImport:
+    CSV_MIMETYPE = 'text/csv'
+    CHUNK_SIZE = 1000
+    MAX_REPORTED_ERRORS = 1000
+
+
+class JobStatus:
+    QUEUED = 'QUEUED'
+    RUNNING = 'RUNNING'
+    SUCCEEDED = 'SUCCEEDED'
+    FAILED = 'FAILED'
+    
+    @classmethod
+    def active(cls):
+        return [cls.QUEUED, cls.RUNNING]
+
+
+class Reconcile:
+    UPDATE_CHUNK_SIZE = 10000
+    MAX_REPORTED_CHANGES = 1000
+
+
+class Reporting:
+    INITIAL_SYNC_DAYS = 90
+    LOOKBACK_DAYS = 3
+    INSERT_BATCH_SIZE = 5000
+    ROLLUP_ID_CHUNK_SIZE = 1000
+    MAX_RANGE_DAYS = 366
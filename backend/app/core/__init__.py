@@ -1,4 +1,4 @@
 from .config import Config
-from .extensions import db, migrate, ma, cors, init_app
+from .extensions import db, migrate, ma, cors, job_queue, fan_out, response_cache, metrics, init_app
 
-__all__ = ['Config', 'db', 'migrate', 'ma', 'cors', 'init_app']
+__all__ = ['Config', 'db', 'migrate', 'ma', 'cors', 'job_queue', 'fan_out', 'response_cache', 'metrics', 'init_app']
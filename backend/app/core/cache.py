@@ -0,0 +1,153 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class NullCache:
+    def get(self, key: str) -> Optional[Any]:
+        return None
+    
+    def set(self, key: str, value: Any) -> None:
+        pass
+    
+    def delete(self, *keys: str) -> None:
+        pass
+    
+    def get_generation(self, name: str) -> int:
+        return 0
+    
+    def bump_generation(self, name: str) -> None:
+        pass
+
+
+class LRUCache:
+    """Bounded in-process cache; entries expire after ttl seconds."""
+    
+    def __init__(self, max_entries: int, ttl: int):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._generations = {}
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+    
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+    
+    def delete(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._data.pop(key, None)
+    
+    def get_generation(self, name: str) -> int:
+        return self._generations.get(name, 0)
+    
+    def bump_generation(self, name: str) -> None:
+        with self._lock:
+            self._generations[name] = self._generations.get(name, 0) + 1
+
+
+class RedisCache:
+    """Cache shared between processes through any Redis-compatible server."""
+    
+    def __init__(self, url: str, ttl: int, prefix: str = 'pathik:'):
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError("CACHE_BACKEND=redis requires the 'redis' package") from e
+        
+        self.ttl = ttl
+        self.prefix = prefix
+        self._redis = redis.Redis.from_url(url)
+    
+    def get(self, key: str) -> Optional[Any]:
+        value = self._redis.get(self.prefix + key)
+        return json.loads(value) if value is not None else None
+    
+    def set(self, key: str, value: Any) -> None:
+        self._redis.set(self.prefix + key, json.dumps(value), ex=self.ttl)
+    
+    def delete(self, *keys: str) -> None:
+        if keys:
+            self._redis.delete(*[self.prefix + key for key in keys])
+    
+    def get_generation(self, name: str) -> int:
+        return int(self._redis.get(f'{self.prefix}generation:{name}') or 0)
+    
+    def bump_generation(self, name: str) -> None:
+        self._redis.incr(f'{self.prefix}generation:{name}')
+
+
+class ResponseCache:
+    """Read-through cache for serialized campaign payloads."""
+    
+    LIST_GENERATION = 'campaign-lists'
+    
+    def __init__(self):
+        self.backend = NullCache()
+    
+    def init_app(self, app):
+        backend = app.config.get('CACHE_BACKEND', 'memory')
+        ttl = app.config.get('CACHE_TTL', 30)
+        if backend == 'redis':
+            self.backend = RedisCache(app.config['CACHE_REDIS_URL'], ttl)
+        elif backend == 'memory':
+            self.backend = LRUCache(app.config.get('CACHE_MAX_ENTRIES', 1024), ttl)
+        else:
+            self.backend = NullCache()
+        app.extensions['response_cache'] = self
+    
+    @property
+    def enabled(self) -> bool:
+        return not isinstance(self.backend, NullCache)
+    
+    def get(self, key: str) -> Optional[Any]:
+        try:
+            return self.backend.get(key)
+        except Exception as e:
+            logger.warning("Cache read failed: %s", e)
+            return None
+    
+    def set(self, key: str, value: Any) -> None:
+        try:
+            self.backend.set(key, value)
+        except Exception as e:
+            logger.warning("Cache write failed: %s", e)
+    
+    @staticmethod
+    def campaign_key(campaign_id) -> str:
+        return f'campaign:{campaign_id}'
+    
+    def campaign_list_key(self, *parts) -> str:
+        generation = self.backend.get_generation(self.LIST_GENERATION)
+        return f'campaigns:{generation}:' + ':'.join(str(part) for part in parts)
+    
+    def invalidate_campaigns(self, *campaign_ids) -> None:
+        try:
+            self.backend.delete(*[self.campaign_key(campaign_id) for campaign_id in campaign_ids])
+            self.backend.bump_generation(self.LIST_GENERATION)
+        except Exception as e:
+            logger.warning("Cache invalidation failed: %s", e)
+
+
+response_cache = ResponseCache()
@@ -12,6 +12,64 @@ class Config:
     
     SQLALCHEMY_DATABASE_URI = os.getenv('DATABASE_URL', '')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_size': int(os.getenv('DB_POOL_SIZE', 5)),
+        'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', 10)),
+        'pool_timeout': float(os.getenv('DB_POOL_TIMEOUT', 30)),
+        'pool_recycle': int(os.getenv('DB_POOL_RECYCLE', 1800)),
+        'pool_pre_ping': os.getenv('DB_POOL_PRE_PING', 'True').lower() == 'true',
+        'pool_logging_name': 'primary',
+    }
+    # Optional read replica for read-only endpoints; writes always go to DATABASE_URL.
+    DATABASE_REPLICA_URL = os.getenv('DATABASE_REPLICA_URL', '')
+    # Flask-SQLAlchemy only applies SQLALCHEMY_ENGINE_OPTIONS to the default engine, so the replica copies them.
+    SQLALCHEMY_BINDS = {
+        'replica': dict(SQLALCHEMY_ENGINE_OPTIONS, url=DATABASE_REPLICA_URL, pool_logging_name='replica')
+    } if DATABASE_REPLICA_URL else {}
     
     GOOGLE_ADS_YAML_PATH = os.getenv('GOOGLE_ADS_YAML_PATH', 'google-ads.yaml')
     GOOGLE_ADS_CUSTOMER_ID = os.getenv('GOOGLE_ADS_CUSTOMER_ID', '')
+    GOOGLE_ADS_LOGIN_CUSTOMER_ID = os.getenv('GOOGLE_ADS_LOGIN_CUSTOMER_ID', '')
+    GOOGLE_ADS_CUSTOMER_LOGIN_IDS = os.getenv('GOOGLE_ADS_CUSTOMER_LOGIN_IDS', '')
+    GOOGLE_ADS_FAN_OUT_WORKERS = int(os.getenv('GOOGLE_ADS_FAN_OUT_WORKERS', 8))
+    GOOGLE_ADS_WARM_UP = os.getenv('GOOGLE_ADS_WARM_UP', 'False').lower() == 'true'
+    GOOGLE_ADS_QPS = float(os.getenv('GOOGLE_ADS_QPS', 10))
+    GOOGLE_ADS_BURST = int(os.getenv('GOOGLE_ADS_BURST', 10))
+    GOOGLE_ADS_MAX_CONCURRENCY = int(os.getenv('GOOGLE_ADS_MAX_CONCURRENCY', 4))
+    GOOGLE_ADS_MAX_RETRIES = int(os.getenv('GOOGLE_ADS_MAX_RETRIES', 5))
+    GOOGLE_ADS_RETRY_BASE_DELAY = float(os.getenv('GOOGLE_ADS_RETRY_BASE_DELAY', 0.5))
+    GOOGLE_ADS_RETRY_MAX_DELAY = float(os.getenv('GOOGLE_ADS_RETRY_MAX_DELAY', 30))
+    
+    PUBLISH_WORKER_TYPE = os.getenv('PUBLISH_WORKER_TYPE', 'thread')
+    PUBLISH_WORKER_COUNT = int(os.getenv('PUBLISH_WORKER_COUNT', 4))
+    PUBLISH_JOB_TIMEOUT = int(os.getenv('PUBLISH_JOB_TIMEOUT', 900))
+    
+    CAMPAIGN_LOCKING = os.getenv('CAMPAIGN_LOCKING', 'True').lower() == 'true'
+    CAMPAIGN_LOCK_TTL = int(os.getenv('CAMPAIGN_LOCK_TTL', 900))
+    
+    ASSET_HTTP_POOL_SIZE = int(os.getenv('ASSET_HTTP_POOL_SIZE', 10))
+    ASSET_HTTP_RETRIES = int(os.getenv('ASSET_HTTP_RETRIES', 3))
+    ASSET_HTTP_TIMEOUT = int(os.getenv('ASSET_HTTP_TIMEOUT', 30))
+    ASSET_MAX_DOWNLOAD_BYTES = int(os.getenv('ASSET_MAX_DOWNLOAD_BYTES', 20 * 1024 * 1024))
+    ASSET_MAX_UPLOAD_BYTES = int(os.getenv('ASSET_MAX_UPLOAD_BYTES', 5 * 1024 * 1024))
+    ASSET_MAX_DIMENSION = int(os.getenv('ASSET_MAX_DIMENSION', 1200))
+    ASSET_MIN_DIMENSION = int(os.getenv('ASSET_MIN_DIMENSION', 128))
+    ASSET_MAX_PIXELS = int(os.getenv('ASSET_MAX_PIXELS', 50_000_000))
+    ASSET_IMAGE_WORKERS = int(os.getenv('ASSET_IMAGE_WORKERS', 2))
+    
+    CACHE_BACKEND = os.getenv('CACHE_BACKEND', 'memory')
+    CACHE_MAX_ENTRIES = int(os.getenv('CACHE_MAX_ENTRIES', 1024))
+    CACHE_TTL = int(os.getenv('CACHE_TTL', 30))
+    CACHE_REDIS_URL = os.getenv('CACHE_REDIS_URL', 'redis://localhost:6379/0')
+    
+    METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'True').lower() == 'true'
+    
+    LOG_QUEUE = os.getenv('LOG_QUEUE', 'False').lower() == 'true'
+    LOG_FORMAT = os.getenv('LOG_FORMAT', 'text')
+    LOG_ROTATION = os.getenv('LOG_ROTATION', 'none')
+    LOG_MAX_BYTES = int(os.getenv('LOG_MAX_BYTES', 10 * 1024 * 1024))
+    LOG_BACKUP_COUNT = int(os.getenv('LOG_BACKUP_COUNT', 5))
+    LOG_ROTATE_WHEN = os.getenv('LOG_ROTATE_WHEN', 'midnight')
+    LOG_DEBUG_SAMPLE_RATE = float(os.getenv('LOG_DEBUG_SAMPLE_RATE', 1.0))
+    
+    FAST_SERIALIZATION = os.getenv('FAST_SERIALIZATION', 'False').lower() == 'true'
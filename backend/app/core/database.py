@@ -0,0 +1,56 @@
+import time
+from functools import wraps
+from flask import g, has_app_context
+from flask_sqlalchemy.session import Session
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.sql import Select
+from app.core.metrics import metrics
+
+REPLICA_BIND = 'replica'
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waited for a connection."""
+    
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            metrics.observe_db_pool_checkout(self.logging_name, time.perf_counter() - start, timed_out=True)
+            raise
+        metrics.observe_db_pool_checkout(self.logging_name, time.perf_counter() - start)
+        return connection
+
+
+class RoutingSession(Session):
+    """Sends plain SELECTs to the read replica inside replica_reads views; everything else uses the primary."""
+    
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if (
+            bind is None
+            and not self._flushing
+            and isinstance(clause, Select)
+            and clause._for_update_arg is None
+            and has_app_context()
+            and g.get('_db_use_replica')
+        ):
+            engine = self._db.engines.get(REPLICA_BIND)
+            if engine is not None:
+                return engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def replica_reads(view):
+    """Route the view's queries to the read replica when one is configured (register below the route decorator)."""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        g._db_use_replica = True
+        return view(*args, **kwargs)
+    return wrapper
+
+
+def read_from_primary() -> None:
+    """Send the rest of the current view's queries to the primary, e.g. for results that are about to be cached."""
+    g._db_use_replica = False
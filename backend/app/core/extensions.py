@@ -2,8 +2,13 @@ from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 from flask_marshmallow import Marshmallow
 from flask_cors import CORS
+from app.core.job_queue import job_queue
+from app.core.fan_out import fan_out
+from app.core.cache import response_cache
+from app.core.metrics import metrics
+from app.core.database import InstrumentedQueuePool, RoutingSession
 
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={'class_': RoutingSession}, engine_options={'poolclass': InstrumentedQueuePool})
 migrate = Migrate()
 ma = Marshmallow()
 cors = CORS()
@@ -14,3 +19,7 @@ def init_app(app):
     migrate.init_app(app, db)
     ma.init_app(app)
     cors.init_app(app, resources={r"/api/*": {"origins": "*"}})
+    job_queue.init_app(app)
+    fan_out.init_app(app)
+    response_cache.init_app(app)
+    metrics.init_app(app)
@@ -0,0 +1,67 @@
+import os
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class FanOut:
+    """Bounded thread pool that runs one task per Google Ads account in parallel, each in its own app context."""
+    
+    def __init__(self):
+        self._app = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pid = None
+        self._lock = threading.Lock()
+    
+    def init_app(self, app):
+        self._app = app
+        app.extensions['fan_out'] = self
+    
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None or self._pid != os.getpid():
+            with self._lock:
+                if self._executor is None or self._pid != os.getpid():
+                    workers = self._app.config.get('GOOGLE_ADS_FAN_OUT_WORKERS', 8)
+                    self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='fan-out')
+                    self._pid = os.getpid()
+                    logger.info("Started %d fan-out workers", workers)
+        return self._executor
+    
+    def _run_in_app(self, func: Callable, key, items):
+        with self._app.app_context():
+            return func(key, items)
+    
+    def map(self, func: Callable, groups: dict) -> dict[Hashable, tuple]:
+        """Call func(key, items) for every group; returns {key: (result, None)} or {key: (None, exception)}.
+        
+        A single group runs inline in the caller's context, so one-account requests pay no thread hand-off.
+        """
+        if len(groups) <= 1:
+            outcomes = {}
+            for key, items in groups.items():
+                try:
+                    outcomes[key] = (func(key, items), None)
+                except Exception as e:
+                    outcomes[key] = (None, e)
+            return outcomes
+        
+        futures = {key: self.executor.submit(self._run_in_app, func, key, items) for key, items in groups.items()}
+        outcomes = {}
+        for key, future in futures.items():
+            try:
+                outcomes[key] = (future.result(), None)
+            except Exception as e:
+                outcomes[key] = (None, e)
+        return outcomes
+    
+    def shutdown(self, wait: bool = True):
+        if self._executor is not None and self._pid == os.getpid():
+            self._executor.shutdown(wait=wait)
+        self._executor = None
+
+
+fan_out = FanOut()
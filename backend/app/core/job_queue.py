@@ -0,0 +1,69 @@
+import os
+import logging
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+_worker_app = None
+
+
+def _init_worker_app():
+    global _worker_app
+    from app import create_app
+    _worker_app = create_app()
+
+
+def _run_in_worker_app(func: Callable, *args):
+    with _worker_app.app_context():
+        return func(*args)
+
+
+class JobQueue:
+    """In-process worker pool for background jobs; job state lives in the database."""
+    
+    def __init__(self):
+        self._app = None
+        self._executor: Optional[Executor] = None
+        self._pid = None
+        self._lock = threading.Lock()
+    
+    def init_app(self, app):
+        self._app = app
+        app.extensions['job_queue'] = self
+    
+    @property
+    def worker_type(self) -> str:
+        return self._app.config.get('PUBLISH_WORKER_TYPE', 'thread')
+    
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None or self._pid != os.getpid():
+            with self._lock:
+                if self._executor is None or self._pid != os.getpid():
+                    workers = self._app.config.get('PUBLISH_WORKER_COUNT', 4)
+                    if self.worker_type == 'process':
+                        self._executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker_app)
+                    else:
+                        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='publish-worker')
+                    self._pid = os.getpid()
+                    logger.info("Started %d %s publish workers", workers, self.worker_type)
+        return self._executor
+    
+    def submit(self, func: Callable, *args):
+        if self.worker_type == 'process':
+            return self.executor.submit(_run_in_worker_app, func, *args)
+        return self.executor.submit(self._run_in_app, func, *args)
+    
+    def _run_in_app(self, func: Callable, *args):
+        with self._app.app_context():
+            return func(*args)
+    
+    def shutdown(self, wait: bool = True):
+        if self._executor is not None and self._pid == os.getpid():
+            self._executor.shutdown(wait=wait)
+        self._executor = None
+
+
+job_queue = JobQueue()
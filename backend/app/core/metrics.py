@@ -0,0 +1,240 @@
+import bisect
+import threading
+import time
+from typing import Sequence
+
+from flask import current_app, g, has_app_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 25, 50, 100)
+POOL_WAIT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(label_names: Sequence[str], label_values: tuple, extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(label_names, label_values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._values = {}
+        self._lock = threading.Lock()
+    
+    def inc(self, *label_values, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+    
+    def render(self) -> list[str]:
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} counter']
+        with self._lock:
+            for label_values, value in sorted(self._values.items()):
+                lines.append(f'{self.name}{_format_labels(self.label_names, label_values)} {value}')
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(buckets)
+        self._series = {}
+        self._lock = threading.Lock()
+    
+    def observe(self, value: float, *label_values) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+    
+    def render(self) -> list[str]:
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} histogram']
+        with self._lock:
+            snapshot = sorted((labels, (list(counts), total, count)) for labels, (counts, total, count) in self._series.items())
+        for label_values, (counts, total, count) in snapshot:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                bucket_labels = _format_labels(self.label_names, label_values, f'le="{le}"')
+                lines.append(f'{self.name}_bucket{bucket_labels} {cumulative}')
+            labels = _format_labels(self.label_names, label_values)
+            lines.append(f'{self.name}_sum{labels} {total}')
+            lines.append(f'{self.name}_count{labels} {count}')
+        return lines
+
+
+class Gauge:
+    """Values read from collect() at scrape time, as {label_values: value}."""
+    
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str], collect):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self.collect = collect
+    
+    def render(self) -> list[str]:
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} gauge']
+        for label_values, value in sorted(self.collect().items()):
+            lines.append(f'{self.name}{_format_labels(self.label_names, label_values)} {value}')
+        return lines
+
+
+class Metrics:
+    """Process-local metrics registry rendered in the Prometheus text format."""
+    
+    CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+    
+    def __init__(self):
+        self.enabled = True
+        self.request_duration = Histogram(
+            'http_request_duration_seconds', 'API request latency.', ('endpoint', 'method', 'status')
+        )
+        self.request_sql_queries = Histogram(
+            'http_request_sql_queries', 'SQL queries executed per API request.', ('endpoint',), QUERY_COUNT_BUCKETS
+        )
+        self.request_sql_duration = Histogram(
+            'http_request_sql_duration_seconds', 'Time spent in SQL per API request.', ('endpoint',)
+        )
+        self.google_ads_duration = Histogram(
+            'google_ads_call_duration_seconds', 'Google Ads API call latency.', ('service', 'method')
+        )
+        self.google_ads_errors = Counter(
+            'google_ads_call_errors_total', 'Google Ads API calls that raised.', ('service', 'method', 'error')
+        )
+        self.google_ads_retries = Counter(
+            'google_ads_call_retries_total', 'Google Ads API calls retried after a transient error.',
+            ('service', 'method', 'code')
+        )
+        self.db_pool_checkout_wait = Histogram(
+            'db_pool_checkout_wait_seconds', 'Time spent getting a connection from the pool.', ('pool',),
+            POOL_WAIT_BUCKETS
+        )
+        self.db_pool_timeouts = Counter(
+            'db_pool_checkout_timeouts_total', 'Pool checkouts that gave up after pool_timeout.', ('pool',)
+        )
+        self.db_pool_connections = Gauge(
+            'db_pool_connections', 'Pooled connections by state (checked_out, idle, overflow) and the pool size.',
+            ('pool', 'state'), self._db_pool_connections
+        )
+        self._collectors = [
+            self.request_duration, self.request_sql_queries, self.request_sql_duration,
+            self.google_ads_duration, self.google_ads_errors, self.google_ads_retries,
+            self.db_pool_checkout_wait, self.db_pool_timeouts, self.db_pool_connections,
+        ]
+        self._sql_listeners_installed = False
+    
+    def init_app(self, app):
+        self.enabled = app.config.get('METRICS_ENABLED', True)
+        app.extensions['metrics'] = self
+        if not self.enabled:
+            return
+        
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+        if not self._sql_listeners_installed:
+            event.listen(Engine, 'before_cursor_execute', self._before_cursor_execute)
+            event.listen(Engine, 'after_cursor_execute', self._after_cursor_execute)
+            self._sql_listeners_installed = True
+    
+    def _before_request(self):
+        g._metrics_start = time.perf_counter()
+        g._metrics_sql_queries = 0
+        g._metrics_sql_seconds = 0.0
+    
+    def _after_request(self, response):
+        start = g.pop('_metrics_start', None)
+        if start is None or request.blueprint != 'api_v1':
+            return response
+        
+        endpoint = request.url_rule.rule if request.url_rule else 'unmatched'
+        self.request_duration.observe(time.perf_counter() - start, endpoint, request.method, response.status_code)
+        self.request_sql_queries.observe(g.get('_metrics_sql_queries', 0), endpoint)
+        self.request_sql_duration.observe(g.get('_metrics_sql_seconds', 0.0), endpoint)
+        return response
+    
+    @staticmethod
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('_metrics_query_start', []).append(time.perf_counter())
+    
+    @staticmethod
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get('_metrics_query_start')
+        if not starts:
+            return
+        elapsed = time.perf_counter() - starts.pop()
+        if g and '_metrics_sql_queries' in g:
+            g._metrics_sql_queries += 1
+            g._metrics_sql_seconds += elapsed
+    
+    def observe_google_ads_call(self, service: str, method: str, seconds: float, error: Exception = None) -> None:
+        if not self.enabled:
+            return
+        self.google_ads_duration.observe(seconds, service, method)
+        if error is not None:
+            self.google_ads_errors.inc(service, method, type(error).__name__)
+    
+    def observe_google_ads_retry(self, service: str, method: str, code: str) -> None:
+        if self.enabled:
+            self.google_ads_retries.inc(service, method, code)
+    
+    def observe_db_pool_checkout(self, pool: str, seconds: float, timed_out: bool = False) -> None:
+        if not self.enabled:
+            return
+        self.db_pool_checkout_wait.observe(seconds, pool or 'default')
+        if timed_out:
+            self.db_pool_timeouts.inc(pool or 'default')
+    
+    @staticmethod
+    def db_pool_stats() -> dict[str, dict]:
+        """Current size and usage of every queue pool of the app's engines, keyed by bind (primary, replica)."""
+        stats = {}
+        if not has_app_context() or 'sqlalchemy' not in current_app.extensions:
+            return stats
+        for bind_key, engine in current_app.extensions['sqlalchemy'].engines.items():
+            pool = engine.pool
+            if not isinstance(pool, QueuePool):
+                continue
+            checked_out = pool.checkedout()
+            capacity = pool.size() + max(pool._max_overflow, 0)
+            stats[bind_key or 'primary'] = {
+                'size': pool.size(),
+                'checked_out': checked_out,
+                'idle': pool.checkedin(),
+                'overflow': max(pool.overflow(), 0),
+                'utilization': checked_out / capacity if capacity else 0.0,
+            }
+        return stats
+    
+    def _db_pool_connections(self) -> dict:
+        values = {}
+        for name, stats in self.db_pool_stats().items():
+            for state in ('size', 'checked_out', 'idle', 'overflow'):
+                values[(name, state)] = stats[state]
+        return values
+    
+    def render(self) -> str:
+        lines = []
+        for collector in self._collectors:
+            lines.extend(collector.render())
+        return '\n'.join(lines) + '\n'
+
+
+metrics = Metrics()
@@ -0,0 +1,90 @@
+import os
+import logging
+from flask import Flask
+from app import create_app
+from app.core.config import Config
+from app.core.extensions import db, job_queue, fan_out
+from app.utils.google_ads_client import google_ads_clients, load_sdk
+from app.utils.image_processing import shutdown_image_pool
+from app.utils.logger import stop_log_listener
+
+logger = logging.getLogger(__name__)
+
+
+def default_workers() -> int:
+    return (os.cpu_count() or 1) * 2 + 1
+
+
+def reset_after_fork(app: Flask, warm_up: bool = False) -> None:
+    """Drop connections and clients inherited from the preloading master process."""
+    with app.app_context():
+        # close=False leaves the parent's sockets alone; the child just stops using them.
+        for engine in db.engines.values():
+            engine.dispose(close=False)
+    google_ads_clients.reset_after_fork()
+    
+    if warm_up:
+        try:
+            google_ads_clients.default.warm_up()
+        except Exception as e:
+            logger.warning("Google Ads client warm-up skipped: %s", e)
+
+
+def drain_background_work() -> None:
+    """Let queued and running background publishes finish, and write out queued log records, before the worker exits."""
+    job_queue.shutdown(wait=True)
+    fan_out.shutdown(wait=True)
+    shutdown_image_pool()
+    stop_log_listener()
+
+
+def run_production(host: str, port: int, workers: int, threads: int,
+                   timeout: int, graceful_timeout: int, max_requests: int = 0) -> None:
+    """Serve with gunicorn: a preforking master, `workers` processes with `threads` threads each.
+    
+    The app is built once in the master (preload) and inherited by the workers, which then rebuild their
+    database pool and Google Ads clients. On SIGTERM workers stop accepting requests and get
+    graceful_timeout seconds to finish in-flight requests and background publishes.
+    """
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        raise SystemExit('Production mode requires gunicorn: pip install gunicorn')
+    cache_backend = Config.CACHE_BACKEND
+    if workers > 1 and cache_backend == 'memory':
+        # Each worker would keep its own copy, and a write only invalidates the worker that handled it.
+        logger.warning("CACHE_BACKEND=memory is per process and cannot be invalidated across %d workers; "
+                       "serving without a response cache. Set CACHE_BACKEND=redis to cache.", workers)
+        cache_backend = 'none'
+    
+    class ProductionServer(BaseApplication):
+        def __init__(self):
+            self.application = None
+            super().__init__()
+        
+        def load_config(self):
+            options = {
+                'bind': f'{host}:{port}',
+                'workers': workers,
+                'worker_class': 'gthread',
+                'threads': threads,
+                'timeout': timeout,
+                'graceful_timeout': graceful_timeout,
+                'max_requests': max_requests,
+                'max_requests_jitter': max_requests // 10,
+                'preload_app': True,
+                'post_fork': lambda server, worker: reset_after_fork(self.application, Config.GOOGLE_ADS_WARM_UP),
+                'worker_exit': lambda server, worker: drain_background_work(),
+            }
+            for key, value in options.items():
+                self.cfg.set(key, value)
+        
+        def load(self):
+            if self.application is None:
+                # gRPC channels must not be opened before fork, so workers warm up their own clients.
+                self.application = create_app(GOOGLE_ADS_WARM_UP=False, CACHE_BACKEND=cache_backend)
+                # Importing the SDK is fork-safe, and workers share the modules instead of each importing them.
+                load_sdk()
+            return self.application
+    
+    ProductionServer().run()
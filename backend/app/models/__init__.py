@@ -1,3 +1,7 @@
 from app.models.campaign import Campaign
+from app.models.publish_job import PublishJob
+from app.models.image_asset_cache import ImageAssetCache
+from app.models.campaign_metric import CampaignDailyMetric, DailyMetricsRollup, CampaignMetricsRollup, MetricsSyncState
 
-__all__ = ['Campaign']
+__all__ = ['Campaign', 'PublishJob', 'ImageAssetCache', 'CampaignDailyMetric', 'DailyMetricsRollup',
+           'CampaignMetricsRollup', 'MetricsSyncState']
@@ -6,6 +6,16 @@ from app.core.extensions import db
 
 class Campaign(db.Model):
     __tablename__ = 'campaigns'
+    __table_args__ = (
+        db.Index('ix_campaigns_created_at_id', 'created_at', 'id'),
+        db.Index('ix_campaigns_status_created_at_id', 'status', 'created_at', 'id'),
+        db.Index('ix_campaigns_objective_created_at_id', 'objective', 'created_at', 'id'),
+        db.Index('ix_campaigns_campaign_type_created_at_id', 'campaign_type', 'created_at', 'id'),
+        db.Index('ix_campaigns_customer_id_created_at_id', 'customer_id', 'created_at', 'id'),
+        db.Index('ix_campaigns_start_date', 'start_date'),
+        db.Index('ix_campaigns_end_date', 'end_date'),
+        db.Index('ix_campaigns_name_trgm', 'name', postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}),
+    )
     
     id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = db.Column(db.String(255), nullable=False)
@@ -21,6 +31,18 @@ class Campaign(db.Model):
     final_url = db.Column(db.String(2048), nullable=False)
     asset_url = db.Column(db.String(2048), nullable=True)
     google_campaign_id = db.Column(db.String(255), nullable=True, unique=True)
+    customer_id = db.Column(db.String(20), nullable=True)
+    asset_resource_name = db.Column(db.String(255), nullable=True)
+    budget_resource_name = db.Column(db.String(255), nullable=True)
+    campaign_resource_name = db.Column(db.String(255), nullable=True)
+    ad_group_resource_name = db.Column(db.String(255), nullable=True)
+    ad_resource_name = db.Column(db.String(255), nullable=True)
+    # Publish payload compiled and validated at creation (see PublishPlanService); not loaded unless asked for.
+    publish_plan = db.deferred(db.Column(db.JSON, nullable=True))
+    # Set while a publish, enable or pause is calling Google Ads (see CampaignService._campaign_locks).
+    lock_token = db.Column(db.String(32), nullable=True)
+    lock_operation = db.Column(db.String(20), nullable=True)
+    locked_until = db.Column(db.DateTime, nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
@@ -0,0 +1,66 @@
+from datetime import datetime
+from sqlalchemy.dialects.postgresql import UUID
+from app.core.extensions import db
+
+
+class CampaignDailyMetric(db.Model):
+    __tablename__ = 'campaign_daily_metrics'
+    __table_args__ = (
+        db.Index('ix_campaign_daily_metrics_date', 'date'),
+    )
+    
+    campaign_id = db.Column(UUID(as_uuid=True), db.ForeignKey('campaigns.id'), primary_key=True)
+    date = db.Column(db.Date, primary_key=True)
+    impressions = db.Column(db.BigInteger, nullable=False, default=0)
+    clicks = db.Column(db.BigInteger, nullable=False, default=0)
+    cost_micros = db.Column(db.BigInteger, nullable=False, default=0)
+    conversions = db.Column(db.Float, nullable=False, default=0)
+    synced_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    
+    def __repr__(self):
+        return f'<CampaignDailyMetric {self.campaign_id} {self.date}>'
+
+
+class DailyMetricsRollup(db.Model):
+    __tablename__ = 'daily_metrics_rollups'
+    
+    date = db.Column(db.Date, primary_key=True)
+    campaigns = db.Column(db.Integer, nullable=False, default=0)
+    impressions = db.Column(db.BigInteger, nullable=False, default=0)
+    clicks = db.Column(db.BigInteger, nullable=False, default=0)
+    cost_micros = db.Column(db.BigInteger, nullable=False, default=0)
+    conversions = db.Column(db.Float, nullable=False, default=0)
+    
+    def __repr__(self):
+        return f'<DailyMetricsRollup {self.date}>'
+
+
+class CampaignMetricsRollup(db.Model):
+    __tablename__ = 'campaign_metrics_rollups'
+    __table_args__ = (
+        db.Index('ix_campaign_metrics_rollups_cost_micros', 'cost_micros'),
+    )
+    
+    campaign_id = db.Column(UUID(as_uuid=True), db.ForeignKey('campaigns.id'), primary_key=True)
+    first_date = db.Column(db.Date, nullable=False)
+    last_date = db.Column(db.Date, nullable=False)
+    impressions = db.Column(db.BigInteger, nullable=False, default=0)
+    clicks = db.Column(db.BigInteger, nullable=False, default=0)
+    cost_micros = db.Column(db.BigInteger, nullable=False, default=0)
+    conversions = db.Column(db.Float, nullable=False, default=0)
+    
+    campaign = db.relationship('Campaign', lazy='joined')
+    
+    def __repr__(self):
+        return f'<CampaignMetricsRollup {self.campaign_id}>'
+
+
+class MetricsSyncState(db.Model):
+    __tablename__ = 'metrics_sync_state'
+    
+    customer_id = db.Column(db.String(20), primary_key=True)
+    last_synced_date = db.Column(db.Date, nullable=False)
+    synced_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    
+    def __repr__(self):
+        return f'<MetricsSyncState {self.customer_id} {self.last_synced_date}>'
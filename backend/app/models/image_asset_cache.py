@@ -0,0 +1,24 @@
+from datetime import datetime
+from app.core.extensions import db
+
+
+class ImageAssetCache(db.Model):
+    __tablename__ = 'image_asset_cache'
+    __table_args__ = (
+        db.UniqueConstraint('customer_id', 'asset_url', name='uq_image_asset_cache_customer_url'),
+        db.Index('ix_image_asset_cache_customer_hash', 'customer_id', 'content_hash'),
+    )
+    
+    id = db.Column(db.Integer, primary_key=True)
+    customer_id = db.Column(db.String(20), nullable=False)
+    asset_url = db.Column(db.String(2048), nullable=False)
+    content_hash = db.Column(db.String(64), nullable=False)
+    etag = db.Column(db.String(255), nullable=True)
+    last_modified = db.Column(db.String(64), nullable=True)
+    asset_resource_name = db.Column(db.String(255), nullable=False)
+    file_size = db.Column(db.Integer, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    
+    def __repr__(self):
+        return f'<ImageAssetCache {self.customer_id} {self.content_hash[:12]}>'
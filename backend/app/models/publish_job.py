@@ -0,0 +1,23 @@
+from datetime import datetime
+from sqlalchemy.dialects.postgresql import UUID
+import uuid
+from app.core.extensions import db
+
+
+class PublishJob(db.Model):
+    __tablename__ = 'publish_jobs'
+    
+    id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    campaign_id = db.Column(UUID(as_uuid=True), db.ForeignKey('campaigns.id'), nullable=False, index=True)
+    status = db.Column(db.String(50), nullable=False, default='QUEUED')
+    warnings = db.Column(db.JSON, nullable=True)
+    error = db.Column(db.Text, nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    started_at = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    
+    campaign = db.relationship('Campaign', lazy='joined')
+    
+    def __repr__(self):
+        return f'<PublishJob {self.id} {self.status}>'
@@ -1,7 +1,20 @@
 from app.schemas.campaign_schema import (
     CampaignSchema,
     campaign_schema,
-    campaigns_schema
+    campaigns_schema,
+    campaign_row_serializer
+)
+from app.schemas.campaign_filter_schema import CampaignFilterSchema, campaign_filter_schema
+from app.schemas.job_schema import PublishJobSchema, publish_job_schema
+from app.schemas.report_schema import (
+    ReportRangeSchema,
+    report_range_schema,
+    daily_rollups_schema,
+    campaign_rollups_schema,
+    campaign_daily_metrics_schema,
+    metrics_sync_summaries_schema
 )
 
-__all__ = ['CampaignSchema', 'campaign_schema', 'campaigns_schema']
+__all__ = ['CampaignSchema', 'campaign_schema', 'campaigns_schema', 'campaign_row_serializer', 'CampaignFilterSchema', 'campaign_filter_schema', 'PublishJobSchema', 'publish_job_schema',
+           'ReportRangeSchema', 'report_range_schema', 'daily_rollups_schema', 'campaign_rollups_schema',
+           'campaign_daily_metrics_schema', 'metrics_sync_summaries_schema']
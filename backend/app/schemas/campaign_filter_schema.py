@@ -0,0 +1,29 @@
+from marshmallow import Schema, fields, validate, validates, post_load, ValidationError
+from app.constants import CampaignStatus
+
+
+class CampaignFilterSchema(Schema):
+    status = fields.String()
+    objective = fields.String(validate=validate.Length(max=100))
+    campaign_type = fields.String(validate=validate.Length(max=100))
+    name = fields.String(validate=validate.Length(min=1, max=255))
+    customer_id = fields.String(validate=validate.Regexp(r'^\d{10}$', error='Customer ID must be 10 digits'))
+    start_date_from = fields.Date()
+    start_date_to = fields.Date()
+    end_date_from = fields.Date()
+    end_date_to = fields.Date()
+    
+    @validates('status')
+    def validate_status(self, value):
+        invalid = [status for status in value.split(',') if status not in CampaignStatus.all()]
+        if invalid:
+            raise ValidationError(f"Unknown status: {', '.join(invalid)}")
+    
+    @post_load
+    def split_statuses(self, data, **kwargs):
+        if 'status' in data:
+            data['status'] = data['status'].split(',')
+        return data
+
+
+campaign_filter_schema = CampaignFilterSchema()
@@ -1,5 +1,7 @@
-from marshmallow import Schema, fields, validate, validates, ValidationError
+from marshmallow import Schema, fields, validate, validates, pre_load, ValidationError
 from datetime import date
+from app.models import Campaign
+from app.schemas.row_serializer import RowSerializer
 
 
 class CampaignSchema(Schema):
@@ -17,9 +19,21 @@ class CampaignSchema(Schema):
     final_url = fields.URL(required=True)
     asset_url = fields.URL(allow_none=True)
     google_campaign_id = fields.String(dump_only=True)
+    customer_id = fields.String(allow_none=True, validate=validate.Regexp(r'^\d{10}$', error='Customer ID must be 10 digits'))
+    asset_resource_name = fields.String(dump_only=True)
+    budget_resource_name = fields.String(dump_only=True)
+    campaign_resource_name = fields.String(dump_only=True)
+    ad_group_resource_name = fields.String(dump_only=True)
+    ad_resource_name = fields.String(dump_only=True)
     created_at = fields.DateTime(dump_only=True)
     updated_at = fields.DateTime(dump_only=True)
     
+    @pre_load
+    def strip_customer_id_dashes(self, data, **kwargs):
+        if isinstance(data, dict) and isinstance(data.get('customer_id'), str):
+            data = dict(data, customer_id=data['customer_id'].replace('-', '').strip() or None)
+        return data
+    
     @validates('start_date')
     def validate_start_date(self, value):
         if value < date.today():
@@ -28,3 +42,4 @@ class CampaignSchema(Schema):
 
 campaign_schema = CampaignSchema()
 campaigns_schema = CampaignSchema(many=True)
+campaign_row_serializer = RowSerializer(campaign_schema, Campaign)
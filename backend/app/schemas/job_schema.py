@@ -0,0 +1,31 @@
+from marshmallow import Schema, fields
+from app.constants import Publish
+
+
+class PublishJobSchema(Schema):
+    id = fields.UUID(dump_only=True)
+    campaign_id = fields.UUID(dump_only=True)
+    status = fields.String(dump_only=True)
+    warnings = fields.List(fields.String(), dump_only=True)
+    error = fields.String(dump_only=True)
+    created_at = fields.DateTime(dump_only=True)
+    started_at = fields.DateTime(dump_only=True)
+    finished_at = fields.DateTime(dump_only=True)
+    updated_at = fields.DateTime(dump_only=True)
+    progress = fields.Method('get_progress', dump_only=True)
+    
+    def get_progress(self, job):
+        """Publish steps the campaign has checkpointed; the asset step only counts when it has an asset_url."""
+        campaign = job.campaign
+        if campaign is None:
+            return None
+        steps = [step for step in Publish.STEPS if step != 'asset' or campaign.asset_url]
+        # Same rule as CampaignService.is_fully_published: campaigns published before checkpoints are done.
+        done = bool(campaign.google_campaign_id) and (
+            campaign.campaign_resource_name is None or campaign.ad_resource_name is not None
+        )
+        completed = [step for step in steps if done or getattr(campaign, f'{step}_resource_name')]
+        return {'completed_steps': completed, 'remaining_steps': [step for step in steps if step not in completed]}
+
+
+publish_job_schema = PublishJobSchema()
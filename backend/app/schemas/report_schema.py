@@ -0,0 +1,49 @@
+from marshmallow import Schema, fields
+
+
+class ReportRangeSchema(Schema):
+    date_from = fields.Date(required=True)
+    date_to = fields.Date(required=True)
+
+
+class DailyMetricsRollupSchema(Schema):
+    date = fields.Date(dump_only=True)
+    campaigns = fields.Integer(dump_only=True)
+    impressions = fields.Integer(dump_only=True)
+    clicks = fields.Integer(dump_only=True)
+    cost_micros = fields.Integer(dump_only=True)
+    conversions = fields.Float(dump_only=True)
+
+
+class CampaignMetricsRollupSchema(Schema):
+    campaign_id = fields.UUID(dump_only=True)
+    campaign_name = fields.String(attribute='campaign.name', dump_only=True)
+    first_date = fields.Date(dump_only=True)
+    last_date = fields.Date(dump_only=True)
+    impressions = fields.Integer(dump_only=True)
+    clicks = fields.Integer(dump_only=True)
+    cost_micros = fields.Integer(dump_only=True)
+    conversions = fields.Float(dump_only=True)
+
+
+class CampaignDailyMetricSchema(Schema):
+    date = fields.Date(dump_only=True)
+    impressions = fields.Integer(dump_only=True)
+    clicks = fields.Integer(dump_only=True)
+    cost_micros = fields.Integer(dump_only=True)
+    conversions = fields.Float(dump_only=True)
+
+
+class MetricsSyncSummarySchema(Schema):
+    customer_id = fields.String(dump_only=True)
+    date_from = fields.Date(dump_only=True)
+    date_to = fields.Date(dump_only=True)
+    rows = fields.Integer(dump_only=True)
+    campaigns = fields.Integer(dump_only=True)
+
+
+report_range_schema = ReportRangeSchema()
+daily_rollups_schema = DailyMetricsRollupSchema(many=True)
+campaign_rollups_schema = CampaignMetricsRollupSchema(many=True)
+campaign_daily_metrics_schema = CampaignDailyMetricSchema(many=True)
+metrics_sync_summaries_schema = MetricsSyncSummarySchema(many=True)
@@ -0,0 +1,49 @@
+from typing import Iterable
+from marshmallow import Schema, fields
+
+
+class RowSerializer:
+    """Precompiled dump-only serializer that matches a marshmallow schema's output.
+    
+    Reads plain column tuples (or ORM objects) and skips marshmallow's per-field
+    dispatch; only the field types used by our schemas are supported.
+    """
+    
+    def __init__(self, schema: Schema, model):
+        self.field_names = list(schema.dump_fields)
+        self.columns = [getattr(model, schema.dump_fields[name].attribute or name) for name in self.field_names]
+        
+        namespace = {}
+        items = []
+        for index, name in enumerate(self.field_names):
+            converter = self._converter(schema.dump_fields[name])
+            value = f'row[{index}]'
+            if converter is None:
+                items.append(f'{name!r}: {value}')
+            else:
+                namespace[f'_convert_{index}'] = converter
+                items.append(f'{name!r}: (None if {value} is None else _convert_{index}({value}))')
+        
+        source = 'def dump_row(row):\n    return {' + ', '.join(items) + '}\n'
+        exec(compile(source, f'<RowSerializer {type(schema).__name__}>', 'exec'), namespace)
+        self.dump_row = namespace['dump_row']
+        self._attributes = [column.key for column in self.columns]
+    
+    @staticmethod
+    def _converter(field: fields.Field):
+        if isinstance(field, fields.DateTime):
+            return field.SERIALIZATION_FUNCS[field.format or field.DEFAULT_FORMAT]
+        if isinstance(field, fields.UUID):
+            return str
+        if isinstance(field, fields.Integer):
+            return int
+        if isinstance(field, fields.String):
+            return None
+        raise TypeError(f'RowSerializer does not support {type(field).__name__}')
+    
+    def dump_rows(self, rows: Iterable[tuple]) -> list[dict]:
+        dump_row = self.dump_row
+        return [dump_row(row) for row in rows]
+    
+    def dump_object(self, obj) -> dict:
+        return self.dump_row([getattr(obj, attribute) for attribute in self._attributes])
@@ -1,4 +1,9 @@
-from .campaign_service import CampaignService
+from .campaign_service import CampaignService, CampaignBusyError
 from .google_ads_service import GoogleAdsService
+from .publish_plan_service import PublishPlanService
+from .asset_cache_service import AssetCacheService
+from .job_service import JobService
+from .reporting_service import ReportingService
 
-__all__ = ['CampaignService', 'GoogleAdsService']
+__all__ = ['CampaignService', 'CampaignBusyError', 'GoogleAdsService', 'PublishPlanService', 'AssetCacheService',
+           'JobService', 'ReportingService']
@@ -0,0 +1,52 @@
+import hashlib
+from typing import Optional
+from sqlalchemy.exc import IntegrityError
+from app.core.extensions import db
+from app.models import ImageAssetCache
+
+
+class DownloadedImage:
+    def __init__(self, data: bytes, content_type: str, etag: Optional[str] = None, last_modified: Optional[str] = None):
+        self.data = data
+        self.content_type = content_type
+        self.etag = etag
+        self.last_modified = last_modified
+        self.content_hash = hashlib.sha256(data).hexdigest()
+
+
+class AssetCacheService:
+    @staticmethod
+    def find_by_url(customer_id: str, asset_url: str) -> Optional[ImageAssetCache]:
+        return ImageAssetCache.query.filter_by(customer_id=customer_id, asset_url=asset_url).first()
+    
+    @staticmethod
+    def find_by_hash(customer_id: str, content_hash: str) -> Optional[ImageAssetCache]:
+        return ImageAssetCache.query.filter_by(customer_id=customer_id, content_hash=content_hash).first()
+    
+    @staticmethod
+    def remember(customer_id: str, asset_url: str, image: DownloadedImage, asset_resource_name: str,
+                 commit: bool = True) -> None:
+        """Record which asset an image URL was uploaded as; commit=False leaves the commit to the caller."""
+        values = {
+            'content_hash': image.content_hash,
+            'etag': image.etag,
+            'last_modified': image.last_modified,
+            'asset_resource_name': asset_resource_name,
+            'file_size': len(image.data),
+        }
+        entry = AssetCacheService.find_by_url(customer_id, asset_url)
+        if entry is None:
+            try:
+                with db.session.begin_nested():
+                    db.session.add(ImageAssetCache(customer_id=customer_id, asset_url=asset_url, **values))
+                if commit:
+                    db.session.commit()
+                return
+            except IntegrityError:
+                # A concurrent publish cached the same URL first; the savepoint keeps the rest of the session.
+                entry = AssetCacheService.find_by_url(customer_id, asset_url)
+        
+        for field, value in values.items():
+            setattr(entry, field, value)
+        if commit:
+            db.session.commit()
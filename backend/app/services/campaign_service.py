@@ -1,84 +1,632 @@
-from typing import List, Optional, Tuple
-from app.core.extensions import db
+import logging
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+from marshmallow import ValidationError
+from app.core.config import Config
+from app.core.extensions import db, fan_out, response_cache
 from app.models import Campaign
-from app.schemas import campaign_schema
-from app.constants import CampaignStatus
-from app.services.google_ads_service import GoogleAdsService
+from app.schemas import campaign_schema, campaigns_schema
+from app.constants import CampaignStatus, CampaignOperation, Pagination, Export, BulkImport, Reconcile
+from app.services.asset_cache_service import AssetCacheService
+from app.services.google_ads_service import BatchPublishResult, GoogleAdsService, PublishDraft
+from app.services.publish_plan_service import PublishPlanService
+from app.utils.google_ads_client import normalize_customer_id
+from app.utils.pagination import encode_cursor, decode_cursor
+
+logger = logging.getLogger(__name__)
+
+
+class CampaignBusyError(ValueError):
+    """Another publish, enable or pause of the campaign holds its lock."""
+    
+    def __init__(self, operation: Optional[str] = None):
+        in_progress = f'{operation.lower()} ' if operation else ''
+        super().__init__(f'Campaign is busy: a {in_progress}request for it is in progress')
 
 
 class CampaignService:
+    @staticmethod
+    def _default_customer_id() -> Optional[str]:
+        return normalize_customer_id(Config.GOOGLE_ADS_CUSTOMER_ID) or None
+    
     @staticmethod
     def create_campaign(data: dict) -> Campaign:
         validated_data = campaign_schema.load(data)
+        validated_data['customer_id'] = validated_data.get('customer_id') or CampaignService._default_customer_id()
+        validated_data['publish_plan'] = PublishPlanService.compile(validated_data)
         campaign = Campaign(**validated_data, status=CampaignStatus.DRAFT)
         
         db.session.add(campaign)
         db.session.commit()
+        response_cache.invalidate_campaigns()
         
         return campaign
     
     @staticmethod
-    def get_all_campaigns(status: Optional[str] = None) -> List[Campaign]:
-        query = Campaign.query
-        if status:
-            query = query.filter_by(status=status)
-        return query.order_by(Campaign.created_at.desc()).all()
+    def bulk_import(records: Iterable[Tuple[int, Union[dict, str]]], chunk_size: int = BulkImport.CHUNK_SIZE) -> dict:
+        """Validate and insert records chunk by chunk; invalid rows are reported, not fatal."""
+        summary = {'imported': 0, 'failed': 0, 'errors': [], 'errors_truncated': False}
+        default_customer_id = CampaignService._default_customer_id()
+        
+        def add_error(row_number, messages):
+            summary['failed'] += 1
+            if len(summary['errors']) < BulkImport.MAX_REPORTED_ERRORS:
+                summary['errors'].append({'row': row_number, 'messages': messages})
+            else:
+                summary['errors_truncated'] = True
+        
+        def flush(row_numbers, chunk):
+            try:
+                valid_rows = campaigns_schema.load(chunk)
+                errors = {}
+            except ValidationError as err:
+                valid_rows, errors = err.valid_data, err.messages
+            
+            rows = []
+            for index, row_number in enumerate(row_numbers):
+                if index in errors:
+                    add_error(row_number, errors[index])
+                    continue
+                row = valid_rows[index]
+                try:
+                    plan = PublishPlanService.compile(row)
+                except ValidationError as err:
+                    add_error(row_number, err.messages)
+                    continue
+                rows.append(dict(
+                    row, status=CampaignStatus.DRAFT, customer_id=row.get('customer_id') or default_customer_id,
+                    publish_plan=plan
+                ))
+            
+            if rows:
+                db.session.execute(db.insert(Campaign), rows)
+                db.session.commit()
+                summary['imported'] += len(rows)
+        
+        row_numbers, chunk = [], []
+        for row_number, record in records:
+            if isinstance(record, str):
+                add_error(row_number, {'_schema': [record]})
+                continue
+            row_numbers.append(row_number)
+            chunk.append(record)
+            if len(chunk) >= chunk_size:
+                flush(row_numbers, chunk)
+                row_numbers, chunk = [], []
+        if chunk:
+            flush(row_numbers, chunk)
+        
+        if summary['imported']:
+            response_cache.invalidate_campaigns()
+        return summary
+    
+    @staticmethod
+    def _apply_filters(query, filters: Optional[dict]):
+        if not filters:
+            return query
+        if filters.get('status'):
+            query = query.filter(Campaign.status.in_(filters['status']))
+        if filters.get('objective'):
+            query = query.filter(Campaign.objective == filters['objective'])
+        if filters.get('campaign_type'):
+            query = query.filter(Campaign.campaign_type == filters['campaign_type'])
+        if filters.get('customer_id'):
+            query = query.filter(Campaign.customer_id == filters['customer_id'])
+        if filters.get('start_date_from'):
+            query = query.filter(Campaign.start_date >= filters['start_date_from'])
+        if filters.get('start_date_to'):
+            query = query.filter(Campaign.start_date <= filters['start_date_to'])
+        if filters.get('end_date_from'):
+            query = query.filter(Campaign.end_date >= filters['end_date_from'])
+        if filters.get('end_date_to'):
+            query = query.filter(Campaign.end_date <= filters['end_date_to'])
+        if filters.get('name'):
+            pattern = filters['name'].replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            query = query.filter(Campaign.name.ilike(f'%{pattern}%', escape='\\'))
+        return query
+    
+    @staticmethod
+    def get_campaigns_page(filters: Optional[dict] = None, limit: int = Pagination.DEFAULT_LIMIT,
+                           cursor: Optional[str] = None, columns: Optional[list] = None) -> Tuple[list, Optional[str]]:
+        """Return one page of campaigns, newest first; with columns, rows are plain tuples of those columns."""
+        limit = max(1, min(limit, Pagination.MAX_LIMIT))
+        
+        query = db.session.query(*columns) if columns else Campaign.query
+        query = CampaignService._apply_filters(query, filters)
+        if cursor:
+            created_at, campaign_id = decode_cursor(cursor)
+            query = query.filter(
+                db.tuple_(Campaign.created_at, Campaign.id) < db.tuple_(created_at, campaign_id)
+            )
+        
+        campaigns = query.order_by(Campaign.created_at.desc(), Campaign.id.desc()).limit(limit + 1).all()
+        
+        next_cursor = None
+        if len(campaigns) > limit:
+            campaigns = campaigns[:limit]
+            last = campaigns[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+        
+        return campaigns, next_cursor
+    
+    @staticmethod
+    def iter_campaigns(filters: Optional[dict] = None, batch_size: int = Export.BATCH_SIZE,
+                       columns: Optional[list] = None) -> Iterator:
+        query = db.session.query(*columns) if columns else Campaign.query
+        query = CampaignService._apply_filters(query, filters)
+        query = query.order_by(Campaign.created_at.desc(), Campaign.id.desc())
+        return query.yield_per(batch_size)
     
     @staticmethod
     def get_campaign_by_id(campaign_id: str) -> Optional[Campaign]:
         return Campaign.query.get(campaign_id)
     
     @staticmethod
-    def publish_campaign(campaign_id: str, customer_id: str) -> Tuple[Campaign, List[str]]:
-        campaign = Campaign.query.get(campaign_id)
+    def customer_clause(customer_id: str):
+        """SQL condition for campaigns owned by customer_id; campaigns without one belong to the default account."""
+        if customer_id == CampaignService._default_customer_id():
+            return db.or_(Campaign.customer_id == customer_id, Campaign.customer_id.is_(None))
+        return Campaign.customer_id == customer_id
+    
+    @staticmethod
+    def published_customer_ids() -> List[str]:
+        rows = db.session.query(Campaign.customer_id).filter(Campaign.google_campaign_id.isnot(None)).distinct()
+        default_customer_id = CampaignService._default_customer_id()
+        return sorted({customer_id or default_customer_id for customer_id, in rows} - {None})
+    
+    @staticmethod
+    def _campaign_customer_id(campaign: Campaign, default_customer_id: Optional[str]) -> str:
+        # The default comes from configuration and may be dashed; stored ids never are.
+        customer_id = campaign.customer_id or normalize_customer_id(default_customer_id)
+        if not customer_id:
+            raise ValueError('Google Ads customer ID not configured')
+        return customer_id
+    
+    @staticmethod
+    def _group_by_customer(campaigns: List[Campaign], default_customer_id: Optional[str], results: dict) -> dict:
+        """Group campaigns by Google Ads account; campaigns without one get an error result."""
+        groups = {}
+        default_customer_id = normalize_customer_id(default_customer_id)
+        for campaign in campaigns:
+            customer_id = campaign.customer_id or default_customer_id
+            if customer_id:
+                groups.setdefault(customer_id, []).append(campaign)
+            else:
+                key = str(campaign.id)
+                results[key] = {'id': key, 'success': False, 'error': 'Google Ads customer ID not configured'}
+        return groups
+    
+    @staticmethod
+    def is_fully_published(campaign: Campaign) -> bool:
+        """Published with every step done; campaigns published before step checkpoints count as done."""
+        if not campaign.google_campaign_id:
+            return False
+        return campaign.campaign_resource_name is None or campaign.ad_resource_name is not None
+    
+    @staticmethod
+    def _mark_published(campaign: Campaign, google_campaign_id: str, customer_id: str) -> None:
+        campaign.google_campaign_id = google_campaign_id
+        campaign.customer_id = customer_id
+        # A resumed publish only adds missing ad groups/ads, so an enabled or paused campaign keeps its status.
+        if campaign.status == CampaignStatus.DRAFT:
+            campaign.status = CampaignStatus.PUBLISHED
+    
+    @staticmethod
+    def _unlocked(now: datetime):
+        """Rows no publish, enable or pause holds: never locked, released or expired."""
+        return db.or_(Campaign.locked_until.is_(None), Campaign.locked_until < now)
+    
+    @staticmethod
+    @contextmanager
+    def _campaign_locks(campaign_ids: list, operation: str) -> Iterator[Optional[str]]:
+        """Lock the campaigns for the duration of operation and yield the lock token (None with locking off).
+        
+        One conditional UPDATE takes the rows whose lock is free or expired, so of two concurrent requests for a
+        campaign only one gets it; callers load campaigns afterwards and check them with _check_lock. The lock
+        outlives the checkpoint commits of a publish and expires after CAMPAIGN_LOCK_TTL if the process dies.
+        """
+        if not Config.CAMPAIGN_LOCKING:
+            yield None
+            return
+        
+        token = uuid.uuid4().hex
+        now = datetime.utcnow()
+        Campaign.query.filter(Campaign.id.in_(campaign_ids), CampaignService._unlocked(now)).update({
+            Campaign.lock_token: token,
+            Campaign.lock_operation: operation,
+            Campaign.locked_until: now + timedelta(seconds=Config.CAMPAIGN_LOCK_TTL),
+            Campaign.updated_at: Campaign.updated_at
+        }, synchronize_session=False)
+        db.session.commit()
+        
+        try:
+            yield token
+        except Exception:
+            db.session.rollback()
+            raise
+        finally:
+            Campaign.query.filter(Campaign.id.in_(campaign_ids), Campaign.lock_token == token).update({
+                Campaign.lock_token: None,
+                Campaign.lock_operation: None,
+                Campaign.locked_until: None,
+                Campaign.updated_at: Campaign.updated_at
+            }, synchronize_session=False)
+            db.session.commit()
+            # The commit expired the campaigns the caller returns; reload them in one query instead of one each.
+            Campaign.query.filter(Campaign.id.in_(campaign_ids)).all()
+    
+    @staticmethod
+    def _check_lock(campaign: Campaign, token: Optional[str]) -> None:
+        if token is not None and campaign.lock_token != token:
+            raise CampaignBusyError(campaign.lock_operation)
+    
+    @staticmethod
+    def _get_campaign_for_publish(campaign_id: str, token: Optional[str] = None) -> Campaign:
+        campaign = Campaign.query.options(db.undefer(Campaign.publish_plan)).get(uuid.UUID(str(campaign_id)))
         if not campaign:
             raise ValueError('Campaign not found')
         
-        if campaign.status == CampaignStatus.PUBLISHED:
+        CampaignService._check_lock(campaign, token)
+        if CampaignService.is_fully_published(campaign):
             raise ValueError('Campaign already published')
         
-        result = GoogleAdsService.publish_campaign(campaign, customer_id)
-        
-        campaign.google_campaign_id = result.campaign_id
-        campaign.status = CampaignStatus.PUBLISHED
-        db.session.commit()
+        PublishPlanService.plan_for(campaign)
+        return campaign
+    
+    @staticmethod
+    def plan_publish(campaign_id: str, default_customer_id: Optional[str]) -> dict:
+        """Dry run: the steps a publish would run and the plan it would send, without calling Google Ads."""
+        campaign = CampaignService._get_campaign_for_publish(campaign_id)
+        steps = ['asset'] if campaign.asset_url and not campaign.asset_resource_name else []
+        steps += [step for step in ('budget', 'campaign', 'ad_group', 'ad') if not getattr(campaign, f'{step}_resource_name')]
+        return {
+            'id': str(campaign.id),
+            'customer_id': CampaignService._campaign_customer_id(campaign, default_customer_id),
+            'steps': steps,
+            'plan': campaign.publish_plan,
+        }
+    
+    @staticmethod
+    def publish_campaign(campaign_id: str, default_customer_id: Optional[str]) -> Tuple[Campaign, List[str]]:
+        with CampaignService._campaign_locks([uuid.UUID(str(campaign_id))], CampaignOperation.PUBLISH) as token:
+            campaign = CampaignService._get_campaign_for_publish(campaign_id, token)
+            customer_id = CampaignService._campaign_customer_id(campaign, default_customer_id)
+            campaign.customer_id = customer_id
+            
+            def checkpoint():
+                db.session.commit()
+                response_cache.invalidate_campaigns(campaign.id)
+            
+            result = GoogleAdsService.publish_campaign(campaign, customer_id, checkpoint)
+            
+            CampaignService._mark_published(campaign, result.campaign_id, customer_id)
+            db.session.commit()
+            response_cache.invalidate_campaigns(campaign.id)
         
         return campaign, result.warnings
     
     @staticmethod
-    def enable_campaign(campaign_id: str, customer_id: str) -> Campaign:
-        campaign = Campaign.query.get(campaign_id)
-        if not campaign:
-            raise ValueError('Campaign not found')
+    def _load_campaigns_by_ids(campaign_ids: List[str], with_plan: bool = False) -> Tuple[dict, dict]:
+        """Load campaigns in one query; results holds an error entry for every id that cannot be used."""
+        results = {}
+        valid_ids = []
+        for campaign_id in campaign_ids:
+            try:
+                key = str(uuid.UUID(str(campaign_id)))
+            except ValueError:
+                results[str(campaign_id)] = {'id': str(campaign_id), 'success': False, 'error': 'Invalid campaign ID'}
+                continue
+            if key not in results:
+                results[key] = None
+                valid_ids.append(key)
         
-        if not campaign.google_campaign_id:
-            raise ValueError('Campaign not published to Google Ads')
+        campaigns = []
+        if valid_ids:
+            query = Campaign.query.filter(Campaign.id.in_([uuid.UUID(key) for key in valid_ids]))
+            if with_plan:
+                query = query.options(db.undefer(Campaign.publish_plan))
+            campaigns = query.all()
+        by_id = {str(campaign.id): campaign for campaign in campaigns}
         
-        if campaign.status == CampaignStatus.ENABLED:
-            raise ValueError('Campaign already enabled')
+        found = {}
+        for key in valid_ids:
+            if key in by_id:
+                found[key] = by_id[key]
+            else:
+                results[key] = {'id': key, 'success': False, 'error': 'Campaign not found'}
         
-        GoogleAdsService.enable_campaign(campaign.google_campaign_id, customer_id)
+        return results, found
+    
+    @staticmethod
+    def _apply_created_resources(campaigns: List[Campaign], customer_id: str, batch: BatchPublishResult) -> None:
+        """Write a batch's new resource names and asset cache entries on the current session, without committing."""
+        by_key = {str(campaign.id): campaign for campaign in campaigns}
+        for key, resource_names in batch.resource_names.items():
+            for step, resource_name in resource_names.items():
+                setattr(by_key[key], step, resource_name)
+        for asset_url, image, asset_resource_name in batch.cached_assets:
+            AssetCacheService.remember(customer_id, asset_url, image, asset_resource_name, commit=False)
+    
+    @staticmethod
+    def publish_campaigns(campaign_ids: List[str], default_customer_id: Optional[str]) -> List[dict]:
+        """Publish campaigns with one batch per Google Ads account, running the accounts in parallel.
         
-        campaign.status = CampaignStatus.ENABLED
-        db.session.commit()
+        Resource names created along the way are committed even for campaigns that fail, so a retry resumes them.
+        """
+        results, found = CampaignService._load_campaigns_by_ids(campaign_ids, with_plan=True)
+        
+        campaign_uuids = [campaign.id for campaign in found.values()]
+        with CampaignService._campaign_locks(campaign_uuids, CampaignOperation.PUBLISH) as token:
+            if token is not None:
+                # Taking the locks committed and expired the campaigns; reload them in one query.
+                Campaign.query.filter(Campaign.id.in_(campaign_uuids)).options(db.undefer(Campaign.publish_plan)).all()
+            
+            to_publish = []
+            for key, campaign in found.items():
+                try:
+                    CampaignService._check_lock(campaign, token)
+                except CampaignBusyError as e:
+                    results[key] = {'id': key, 'success': False, 'error': str(e)}
+                    continue
+                if CampaignService.is_fully_published(campaign):
+                    results[key] = {'id': key, 'success': False, 'error': 'Campaign already published'}
+                    continue
+                try:
+                    PublishPlanService.plan_for(campaign)
+                except ValueError as e:
+                    results[key] = {'id': key, 'success': False, 'error': str(e)}
+                    continue
+                to_publish.append(campaign)
+            
+            groups = CampaignService._group_by_customer(to_publish, default_customer_id, results)
+            if groups:
+                # The accounts run on fan-out threads, which get plain drafts and return plain results; the
+                # campaigns and the asset cache are only written here, on this session.
+                drafts = {customer_id: [PublishDraft(campaign) for campaign in campaigns]
+                          for customer_id, campaigns in groups.items()}
+                outcomes = fan_out.map(
+                    lambda customer_id, drafts: GoogleAdsService.publish_campaigns(drafts, customer_id), drafts
+                )
+                
+                touched_ids = []
+                for customer_id, campaigns in groups.items():
+                    batch, error = outcomes[customer_id]
+                    created = batch if error is None else getattr(error, 'batch', None)
+                    if created is not None:
+                        CampaignService._apply_created_resources(campaigns, customer_id, created)
+                    for campaign in campaigns:
+                        key = str(campaign.id)
+                        campaign.customer_id = customer_id
+                        touched_ids.append(campaign.id)
+                        if error is None and key in batch.published:
+                            publish_result = batch.published[key]
+                            CampaignService._mark_published(campaign, publish_result.campaign_id, customer_id)
+                            results[key] = {
+                                'id': key,
+                                'success': True,
+                                'campaign': campaign,
+                                'warnings': publish_result.warnings
+                            }
+                        elif error is not None:
+                            results[key] = {'id': key, 'success': False, 'error': str(error)}
+                        else:
+                            results[key] = {'id': key, 'success': False, 'error': batch.failed.get(key, 'Campaign not published')}
+                
+                db.session.commit()
+                if touched_ids:
+                    response_cache.invalidate_campaigns(*touched_ids)
+        
+        return list(results.values())
+    
+    @staticmethod
+    def enable_campaign(campaign_id: str, default_customer_id: Optional[str]) -> Campaign:
+        key = uuid.UUID(str(campaign_id))
+        with CampaignService._campaign_locks([key], CampaignOperation.ENABLE) as token:
+            campaign = Campaign.query.get(key)
+            if not campaign:
+                raise ValueError('Campaign not found')
+            
+            CampaignService._check_lock(campaign, token)
+            if not campaign.google_campaign_id:
+                raise ValueError('Campaign not published to Google Ads')
+            
+            if campaign.status == CampaignStatus.ENABLED:
+                raise ValueError('Campaign already enabled')
+            
+            customer_id = CampaignService._campaign_customer_id(campaign, default_customer_id)
+            GoogleAdsService.enable_campaign(campaign.google_campaign_id, customer_id)
+            
+            campaign.status = CampaignStatus.ENABLED
+            db.session.commit()
+            response_cache.invalidate_campaigns(campaign.id)
         
         return campaign
     
     @staticmethod
-    def pause_campaign(campaign_id: str, customer_id: str) -> Campaign:
-        campaign = Campaign.query.get(campaign_id)
-        if not campaign:
-            raise ValueError('Campaign not found')
+    def pause_campaign(campaign_id: str, default_customer_id: Optional[str]) -> Campaign:
+        key = uuid.UUID(str(campaign_id))
+        with CampaignService._campaign_locks([key], CampaignOperation.PAUSE) as token:
+            campaign = Campaign.query.get(key)
+            if not campaign:
+                raise ValueError('Campaign not found')
+            
+            CampaignService._check_lock(campaign, token)
+            if not campaign.google_campaign_id:
+                raise ValueError('Campaign not published to Google Ads')
+            
+            if campaign.status == CampaignStatus.PAUSED:
+                raise ValueError('Campaign already paused')
+            
+            customer_id = CampaignService._campaign_customer_id(campaign, default_customer_id)
+            GoogleAdsService.pause_campaign(campaign.google_campaign_id, customer_id)
+            
+            campaign.status = CampaignStatus.PAUSED
+            db.session.commit()
+            response_cache.invalidate_campaigns(campaign.id)
         
-        if not campaign.google_campaign_id:
-            raise ValueError('Campaign not published to Google Ads')
+        return campaign
+    
+    @staticmethod
+    def update_campaign_statuses(campaign_ids: List[str], default_customer_id: Optional[str],
+                                 target_status: str) -> List[dict]:
+        if target_status not in (CampaignStatus.ENABLED, CampaignStatus.PAUSED):
+            raise ValueError(f'Status must be {CampaignStatus.ENABLED} or {CampaignStatus.PAUSED}')
         
-        if campaign.status == CampaignStatus.PAUSED:
-            raise ValueError('Campaign already paused')
+        results, found = CampaignService._load_campaigns_by_ids(campaign_ids)
         
-        GoogleAdsService.pause_campaign(campaign.google_campaign_id, customer_id)
+        operation = CampaignOperation.ENABLE if target_status == CampaignStatus.ENABLED else CampaignOperation.PAUSE
+        campaign_uuids = [campaign.id for campaign in found.values()]
+        with CampaignService._campaign_locks(campaign_uuids, operation) as token:
+            if token is not None:
+                # Taking the locks committed and expired the campaigns; reload them in one query.
+                Campaign.query.filter(Campaign.id.in_(campaign_uuids)).all()
+            
+            to_update = []
+            for key, campaign in found.items():
+                if token is not None and campaign.lock_token != token:
+                    results[key] = {'id': key, 'success': False, 'error': str(CampaignBusyError(campaign.lock_operation))}
+                elif not campaign.google_campaign_id:
+                    results[key] = {'id': key, 'success': False, 'error': 'Campaign not published to Google Ads'}
+                elif campaign.status == target_status:
+                    results[key] = {'id': key, 'success': False, 'error': f'Campaign already {target_status.lower()}'}
+                else:
+                    to_update.append(campaign)
+            
+            groups = CampaignService._group_by_customer(to_update, default_customer_id, results)
+            if groups:
+                google_campaign_ids = {
+                    customer_id: [campaign.google_campaign_id for campaign in campaigns]
+                    for customer_id, campaigns in groups.items()
+                }
+                outcomes = fan_out.map(
+                    lambda customer_id, gids: GoogleAdsService.update_campaign_statuses(gids, customer_id, target_status),
+                    google_campaign_ids
+                )
+                
+                updated_ids = []
+                for customer_id, campaigns in groups.items():
+                    errors, error = outcomes[customer_id]
+                    for campaign in campaigns:
+                        key = str(campaign.id)
+                        if error is not None:
+                            results[key] = {'id': key, 'success': False, 'error': str(error)}
+                        elif campaign.google_campaign_id in errors:
+                            results[key] = {'id': key, 'success': False, 'error': errors[campaign.google_campaign_id]}
+                        else:
+                            updated_ids.append(campaign.id)
+                            results[key] = {'id': key, 'success': True, 'status': target_status}
+                
+                if updated_ids:
+                    Campaign.query.filter(Campaign.id.in_(updated_ids)).update(
+                        {Campaign.status: target_status, Campaign.updated_at: datetime.utcnow()},
+                        synchronize_session=False
+                    )
+                    db.session.commit()
+                    response_cache.invalidate_campaigns(*updated_ids)
         
-        campaign.status = CampaignStatus.PAUSED
-        db.session.commit()
+        return list(results.values())
+    
+    @staticmethod
+    def _reconciled_status(local_status: str, remote_status: str) -> str:
+        if remote_status == CampaignStatus.ENABLED:
+            return CampaignStatus.ENABLED
+        if remote_status == CampaignStatus.PAUSED:
+            # Published campaigns are created paused, so PUBLISHED already means paused on Google Ads.
+            return local_status if local_status == CampaignStatus.PUBLISHED else CampaignStatus.PAUSED
+        if remote_status == CampaignStatus.REMOVED:
+            return CampaignStatus.REMOVED
+        return local_status
+    
+    @staticmethod
+    def _diff_statuses(customer_id: str, local: dict) -> Tuple[dict, int]:
+        """Stream one account's remote statuses and return ({new_status: [(campaign_id, old_status)]}, rows matched)."""
+        changes = {}
+        seen = 0
+        for google_campaign_id, remote_status in GoogleAdsService.stream_campaign_statuses(customer_id):
+            if google_campaign_id not in local:
+                continue
+            seen += 1
+            campaign_id, local_status = local[google_campaign_id]
+            status = CampaignService._reconciled_status(local_status, remote_status)
+            if status != local_status:
+                changes.setdefault(status, []).append((campaign_id, local_status))
+        return changes, seen
+    
+    @staticmethod
+    def reconcile_statuses(default_customer_id: Optional[str], customer_id: Optional[str] = None) -> dict:
+        """Align local statuses with Google Ads: one search_stream per account, in parallel, then one UPDATE per status."""
+        default_customer_id = normalize_customer_id(default_customer_id)
+        customer_id = normalize_customer_id(customer_id) or None
+        local_by_customer = {}
+        for campaign_id, google_campaign_id, status, campaign_customer_id in db.session.query(
+            Campaign.id, Campaign.google_campaign_id, Campaign.status, Campaign.customer_id
+        ).filter(Campaign.google_campaign_id.isnot(None)):
+            owner = campaign_customer_id or default_customer_id
+            if owner and (customer_id is None or owner == customer_id):
+                local_by_customer.setdefault(owner, {})[google_campaign_id] = (campaign_id, status)
         
-        return campaign
+        outcomes = fan_out.map(CampaignService._diff_statuses, local_by_customer)
+        
+        errors = {owner: str(error) for owner, (_, error) in outcomes.items() if error is not None}
+        if errors and len(errors) == len(outcomes):
+            raise Exception(next(iter(errors.values())))
+        
+        changes = {}
+        checked = seen = 0
+        for owner, (outcome, error) in outcomes.items():
+            if error is not None:
+                continue
+            account_changes, account_seen = outcome
+            checked += len(local_by_customer[owner])
+            seen += account_seen
+            for status, campaigns in account_changes.items():
+                changes.setdefault(status, []).extend(campaigns)
+        
+        transitions = {}
+        for status, campaigns in changes.items():
+            for campaign_id, previous in campaigns:
+                transitions.setdefault((previous, status), []).append(campaign_id)
+        
+        # Campaigns a publish, enable or pause holds, or whose status changed since it was read, are skipped;
+        # the next run picks them up. Each UPDATE repeats both conditions, so the check and the write are atomic.
+        now = datetime.utcnow()
+        applied = []
+        for (previous, status), ids in transitions.items():
+            for start in range(0, len(ids), Reconcile.UPDATE_CHUNK_SIZE):
+                chunk = [Campaign.id.in_(ids[start:start + Reconcile.UPDATE_CHUNK_SIZE]),
+                         Campaign.status == previous, CampaignService._unlocked(now)]
+                chunk_ids = [campaign_id for campaign_id, in db.session.query(Campaign.id).filter(*chunk)]
+                if not chunk_ids:
+                    continue
+                Campaign.query.filter(Campaign.id.in_(chunk_ids), *chunk[1:]).update(
+                    {Campaign.status: status, Campaign.updated_at: now},
+                    synchronize_session=False
+                )
+                applied.extend((campaign_id, previous, status) for campaign_id in chunk_ids)
+        updated_ids = [campaign_id for campaign_id, _, _ in applied]
+        if updated_ids:
+            db.session.commit()
+            response_cache.invalidate_campaigns(*updated_ids)
+        
+        reported = [{'id': str(campaign_id), 'from': previous, 'to': status} for campaign_id, previous, status in applied]
+        return {
+            'customers': len(outcomes),
+            'checked': checked,
+            'updated': len(updated_ids),
+            'missing': checked - seen,
+            'skipped': sum(len(ids) for ids in transitions.values()) - len(updated_ids),
+            'changes': reported[:Reconcile.MAX_REPORTED_CHANGES],
+            'errors': errors
+        }
+    
+    @staticmethod
+    def run_reconcile_job(default_customer_id: Optional[str], customer_id: Optional[str] = None) -> None:
+        try:
+            summary = CampaignService.reconcile_statuses(default_customer_id, customer_id)
+            logger.info("Reconciled %d campaigns across %d accounts, %d updated",
+                        summary['checked'], summary['customers'], summary['updated'])
+        except Exception as e:
+            db.session.rollback()
+            logger.error("Status reconciliation failed: %s", e)
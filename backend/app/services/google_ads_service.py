@@ -1,8 +1,17 @@
 import uuid
-import requests
-from google.ads.googleads.errors import GoogleAdsException
-from app.utils.google_ads_client import google_ads_client
+from datetime import date
+from typing import Callable, Iterator, Optional
+from app.constants import Publish
+from app.core.config import Config
+from app.utils.google_ads_client import google_ads_clients, google_ads_exception
+from app.utils.http_session import get_http_session
+from app.utils.image_processing import prepare_image, read_capped
 from app.models import Campaign
+from app.services.asset_cache_service import AssetCacheService, DownloadedImage
+from app.services.publish_plan_service import PublishPlanService
+
+# Campaign columns holding the resource name each publish step created, in publish order.
+PUBLISH_STEPS = tuple(f'{step}_resource_name' for step in Publish.STEPS)
 
 
 class PublishResult:
@@ -15,48 +24,161 @@ class PublishResult:
         self.warnings.append(warning)
 
 
+class PublishDraft:
+    """What a batch publish reads from a campaign, copied on the request thread so the batch can run on another."""
+    
+    def __init__(self, campaign: Campaign):
+        self.key = str(campaign.id)
+        self.asset_url = campaign.asset_url
+        self.plan = PublishPlanService.plan_for(campaign)
+        self.resource_names = {step: getattr(campaign, step) for step in PUBLISH_STEPS}
+
+
+class BatchPublishResult:
+    def __init__(self):
+        self.published: dict[str, PublishResult] = {}
+        self.failed: dict[str, str] = {}
+        # Written by the caller on its own session: new resource names by campaign key, and
+        # (asset_url, image, asset_resource_name) entries for the image asset cache.
+        self.resource_names: dict[str, dict[str, str]] = {}
+        self.cached_assets: list[tuple[str, DownloadedImage, str]] = []
+    
+    def created(self, draft: PublishDraft, step: str, resource_name: str):
+        draft.resource_names[step] = resource_name
+        self.resource_names.setdefault(draft.key, {})[step] = resource_name
+
+
+class BatchPublishError(Exception):
+    """A batch publish that failed partway; batch holds what was created before the failure."""
+    
+    def __init__(self, message: str, batch: BatchPublishResult):
+        super().__init__(message)
+        self.batch = batch
+
+
 class GoogleAdsService:
     @staticmethod
-    def create_image_asset(customer_id: str, asset_url: str, asset_name: str) -> str:
-        client = google_ads_client.client
-        asset_service = client.get_service("AssetService")
+    def _google_ads_error_message(ex: Exception) -> str:
+        error_msg = f"Google Ads API error: {ex.error.code().name}"
+        if ex.failure and ex.failure.errors:
+            error_msg += f" - {ex.failure.errors[0].message}"
+        return error_msg
+    
+    @staticmethod
+    def _mutate_with_partial_failure(client, customer_id: str, service_name: str, method_name: str,
+                                     request_type: str, operations: list) -> tuple[list[str], dict[int, str]]:
+        """Send all operations in one request and map failures back to operation indexes."""
+        service = client.get_service(service_name)
+        request = client.get_type(request_type)
+        request.customer_id = customer_id
+        request.operations = operations
+        request.partial_failure = True
+        
+        response = getattr(service, method_name)(request=request)
+        resource_names = [result.resource_name for result in response.results]
         
-        response = requests.get(asset_url, timeout=30)
-        response.raise_for_status()
-        image_data = response.content
+        errors = {}
+        partial_failure = getattr(response, 'partial_failure_error', None)
+        if partial_failure and partial_failure.code != 0:
+            failure_type = type(client.get_type("GoogleAdsFailure"))
+            for detail in partial_failure.details:
+                failure = failure_type.deserialize(detail.value)
+                for error in failure.errors:
+                    index = error.location.field_path_elements[0].index
+                    errors.setdefault(index, error.message)
         
-        content_type = response.headers.get('Content-Type', '').lower()
+        return resource_names, errors
+    
+    @staticmethod
+    def _fetch_image(customer_id: str, asset_url: str) -> tuple[Optional[str], Optional[DownloadedImage]]:
+        """Look the URL up in the asset cache and download it; does not write to the cache.
+        
+        Returns (resource_name, None) when the cached asset is still current, (resource_name, image) when the
+        image is already uploaded under another URL (the caller records this URL), and (None, image) when the
+        image still has to be uploaded.
+        """
+        cached = AssetCacheService.find_by_url(customer_id, asset_url)
+        headers = {}
+        if cached and cached.etag:
+            headers['If-None-Match'] = cached.etag
+        if cached and cached.last_modified:
+            headers['If-Modified-Since'] = cached.last_modified
+        
+        with get_http_session().get(
+            asset_url, headers=headers, timeout=Config.ASSET_HTTP_TIMEOUT, stream=True
+        ) as response:
+            if cached and response.status_code == 304:
+                return cached.asset_resource_name, None
+            response.raise_for_status()
+            
+            image = DownloadedImage(
+                read_capped(response, Config.ASSET_MAX_DOWNLOAD_BYTES),
+                response.headers.get('Content-Type', '').lower(),
+                etag=response.headers.get('ETag'),
+                last_modified=response.headers.get('Last-Modified')
+            )
         
+        # Matched on the downloaded bytes, so a known image is not resized again.
+        existing = AssetCacheService.find_by_hash(customer_id, image.content_hash)
+        if existing:
+            return existing.asset_resource_name, image
+        
+        image.data, image.content_type = prepare_image(image.data)
+        return None, image
+    
+    @staticmethod
+    def _build_image_asset_operation(client, image: DownloadedImage, asset_name: str):
         asset_operation = client.get_type("AssetOperation")
         asset = asset_operation.create
         asset.name = asset_name[:255]
         asset.type_ = client.enums.AssetTypeEnum.IMAGE
-        asset.image_asset.data = image_data
-        asset.image_asset.file_size = len(image_data)
+        asset.image_asset.data = image.data
+        asset.image_asset.file_size = len(image.data)
         
-        if 'png' in content_type:
+        if 'png' in image.content_type:
             asset.image_asset.mime_type = client.enums.MimeTypeEnum.IMAGE_PNG
-        elif 'gif' in content_type:
+        elif 'gif' in image.content_type:
             asset.image_asset.mime_type = client.enums.MimeTypeEnum.IMAGE_GIF
         else:
             asset.image_asset.mime_type = client.enums.MimeTypeEnum.IMAGE_JPEG
         
+        return asset_operation
+    
+    @staticmethod
+    def create_image_asset(customer_id: str, asset_url: str, asset_name: str) -> str:
+        cached_resource_name, image = GoogleAdsService._fetch_image(customer_id, asset_url)
+        if cached_resource_name:
+            if image is not None:
+                AssetCacheService.remember(customer_id, asset_url, image, cached_resource_name)
+            return cached_resource_name
+        
+        client = google_ads_clients.for_customer(customer_id)
+        asset_service = client.get_service("AssetService")
+        
+        asset_operation = GoogleAdsService._build_image_asset_operation(client, image, asset_name)
+        
         asset_response = asset_service.mutate_assets(
             customer_id=customer_id,
             operations=[asset_operation]
         )
         
-        return asset_response.results[0].resource_name
+        asset_resource_name = asset_response.results[0].resource_name
+        AssetCacheService.remember(customer_id, asset_url, image, asset_resource_name)
+        return asset_resource_name
     
     @staticmethod
-    def _create_budget(client, customer_id: str, campaign_name: str, daily_budget: int) -> str:
-        budget_service = client.get_service("CampaignBudgetService")
-        
+    def _build_budget_operation(client, plan: dict):
         budget_operation = client.get_type("CampaignBudgetOperation")
         budget = budget_operation.create
-        budget.name = f"Budget {campaign_name} {uuid.uuid4()}"
-        budget.amount_micros = daily_budget
+        budget.name = f"{plan['budget']['name']} {uuid.uuid4()}"
+        budget.amount_micros = plan['budget']['amount_micros']
         budget.delivery_method = client.enums.BudgetDeliveryMethodEnum.STANDARD
+        return budget_operation
+    
+    @staticmethod
+    def _create_budget(client, customer_id: str, plan: dict) -> str:
+        budget_service = client.get_service("CampaignBudgetService")
+        budget_operation = GoogleAdsService._build_budget_operation(client, plan)
         
         response = budget_service.mutate_campaign_budgets(
             customer_id=customer_id,
@@ -65,12 +187,11 @@ class GoogleAdsService:
         return response.results[0].resource_name
     
     @staticmethod
-    def _create_google_campaign(client, customer_id: str, campaign: Campaign, budget_resource_name: str) -> str:
-        campaign_service = client.get_service("CampaignService")
-        
+    def _build_campaign_operation(client, plan: dict, budget_resource_name: str):
+        campaign_plan = plan['campaign']
         campaign_operation = client.get_type("CampaignOperation")
         google_campaign = campaign_operation.create
-        google_campaign.name = campaign.name
+        google_campaign.name = campaign_plan['name']
         google_campaign.campaign_budget = budget_resource_name
         google_campaign.status = client.enums.CampaignStatusEnum.PAUSED
         google_campaign.advertising_channel_type = client.enums.AdvertisingChannelTypeEnum.SEARCH
@@ -85,9 +206,16 @@ class GoogleAdsService:
             client.enums.EuPoliticalAdvertisingStatusEnum.DOES_NOT_CONTAIN_EU_POLITICAL_ADVERTISING
         )
         
-        google_campaign.start_date = campaign.start_date.strftime("%Y%m%d")
-        if campaign.end_date:
-            google_campaign.end_date = campaign.end_date.strftime("%Y%m%d")
+        google_campaign.start_date = campaign_plan['start_date']
+        if campaign_plan['end_date']:
+            google_campaign.end_date = campaign_plan['end_date']
+        
+        return campaign_operation
+    
+    @staticmethod
+    def _create_google_campaign(client, customer_id: str, plan: dict, budget_resource_name: str) -> str:
+        campaign_service = client.get_service("CampaignService")
+        campaign_operation = GoogleAdsService._build_campaign_operation(client, plan, budget_resource_name)
         
         response = campaign_service.mutate_campaigns(
             customer_id=customer_id,
@@ -96,110 +224,267 @@ class GoogleAdsService:
         return response.results[0].resource_name
     
     @staticmethod
-    def _create_ad_group_with_ad(client, customer_id: str, campaign: Campaign, campaign_resource_name: str, result: PublishResult):
-        ad_group_service = client.get_service("AdGroupService")
-        ad_group_ad_service = client.get_service("AdGroupAdService")
-        
+    def _build_ad_group_operation(client, plan: dict, campaign_resource_name: str):
         ad_group_operation = client.get_type("AdGroupOperation")
         ad_group = ad_group_operation.create
-        ad_group.name = campaign.ad_group_name or f"Ad Group - {campaign.name}"
+        ad_group.name = plan['ad_group']['name']
         ad_group.campaign = campaign_resource_name
         ad_group.status = client.enums.AdGroupStatusEnum.ENABLED
         ad_group.type_ = client.enums.AdGroupTypeEnum.SEARCH_STANDARD
         ad_group.cpc_bid_micros = 1000000
-        
-        ad_group_response = ad_group_service.mutate_ad_groups(
-            customer_id=customer_id,
-            operations=[ad_group_operation]
-        )
-        ad_group_resource_name = ad_group_response.results[0].resource_name
-        
+        return ad_group_operation
+    
+    @staticmethod
+    def _build_ad_group_ad_operation(client, plan: dict, ad_group_resource_name: str):
         ad_group_ad_operation = client.get_type("AdGroupAdOperation")
         ad_group_ad = ad_group_ad_operation.create
         ad_group_ad.ad_group = ad_group_resource_name
         ad_group_ad.status = client.enums.AdGroupAdStatusEnum.ENABLED
         
+        ad_plan = plan['ad']
         ad = ad_group_ad.ad
-        ad.final_urls.append(campaign.final_url)
-        
-        headlines_text = [
-            (campaign.ad_headline[:30] if campaign.ad_headline else campaign.name[:30]),
-            f"{campaign.name[:20]} - Learn More",
-            f"Discover {campaign.name[:20]}"
-        ]
-        for text in headlines_text:
+        ad.final_urls.append(ad_plan['final_url'])
+        
+        for text in ad_plan['headlines']:
             headline = client.get_type("AdTextAsset")
-            headline.text = text[:30]
+            headline.text = text
             ad.responsive_search_ad.headlines.append(headline)
         
-        descriptions_text = [
-            (campaign.ad_description[:90] if campaign.ad_description else f"Learn more about {campaign.name}."),
-            f"Visit our website to learn more about {campaign.name}."[:90]
-        ]
-        for text in descriptions_text:
+        for text in ad_plan['descriptions']:
             description = client.get_type("AdTextAsset")
-            description.text = text[:90]
+            description.text = text
             ad.responsive_search_ad.descriptions.append(description)
         
-        ad_group_ad_service.mutate_ad_group_ads(
+        return ad_group_ad_operation
+    
+    @staticmethod
+    def _create_ad_group(client, customer_id: str, plan: dict, campaign_resource_name: str) -> str:
+        ad_group_service = client.get_service("AdGroupService")
+        ad_group_operation = GoogleAdsService._build_ad_group_operation(client, plan, campaign_resource_name)
+        
+        response = ad_group_service.mutate_ad_groups(
+            customer_id=customer_id,
+            operations=[ad_group_operation]
+        )
+        return response.results[0].resource_name
+    
+    @staticmethod
+    def _create_ad_group_ad(client, customer_id: str, plan: dict, ad_group_resource_name: str) -> str:
+        ad_group_ad_service = client.get_service("AdGroupAdService")
+        ad_group_ad_operation = GoogleAdsService._build_ad_group_ad_operation(client, plan, ad_group_resource_name)
+        
+        response = ad_group_ad_service.mutate_ad_group_ads(
             customer_id=customer_id,
             operations=[ad_group_ad_operation]
         )
+        return response.results[0].resource_name
     
     @staticmethod
-    def publish_campaign(campaign: Campaign, customer_id: str) -> PublishResult:
+    def publish_campaign(campaign: Campaign, customer_id: str,
+                         checkpoint: Optional[Callable[[], None]] = None) -> PublishResult:
+        """Run the publish steps that have no resource name on the campaign yet, replaying its publish plan.
+        
+        Each created resource name is written to the campaign and checkpoint() is called, so a publish that
+        fails partway resumes after the last completed step instead of creating duplicates.
+        """
+        def complete(attribute: str, resource_name: str):
+            setattr(campaign, attribute, resource_name)
+            if checkpoint:
+                checkpoint()
+        
+        plan = PublishPlanService.plan_for(campaign)
         try:
-            client = google_ads_client.client
+            client = google_ads_clients.for_customer(customer_id)
             
-            asset_resource_name = None
             asset_warning = None
-            if campaign.asset_url:
+            if campaign.asset_url and not campaign.asset_resource_name:
                 try:
-                    asset_name = f"Asset {campaign.name} {uuid.uuid4()}"
-                    asset_resource_name = GoogleAdsService.create_image_asset(
+                    asset_name = f"{plan['asset']['name']} {uuid.uuid4()}"
+                    complete('asset_resource_name', GoogleAdsService.create_image_asset(
                         customer_id, campaign.asset_url, asset_name
-                    )
+                    ))
                 except Exception as asset_error:
                     asset_warning = f"Asset creation failed: {str(asset_error)}"
             
-            budget_resource_name = GoogleAdsService._create_budget(
-                client, customer_id, campaign.name, campaign.daily_budget
-            )
+            if not campaign.budget_resource_name:
+                complete('budget_resource_name', GoogleAdsService._create_budget(client, customer_id, plan))
             
-            campaign_resource_name = GoogleAdsService._create_google_campaign(
-                client, customer_id, campaign, budget_resource_name
-            )
+            if not campaign.campaign_resource_name:
+                complete('campaign_resource_name', GoogleAdsService._create_google_campaign(
+                    client, customer_id, plan, campaign.budget_resource_name
+                ))
             
-            campaign_id = campaign_resource_name.split('/')[-1]
+            campaign_id = campaign.campaign_resource_name.split('/')[-1]
             result = PublishResult(campaign_id)
             
-            if asset_resource_name:
-                result.asset_resource_name = asset_resource_name
+            if campaign.asset_resource_name:
+                result.asset_resource_name = campaign.asset_resource_name
             elif asset_warning:
                 result.add_warning(asset_warning)
             
             try:
-                GoogleAdsService._create_ad_group_with_ad(
-                    client, customer_id, campaign, campaign_resource_name, result
-                )
+                if not campaign.ad_group_resource_name:
+                    complete('ad_group_resource_name', GoogleAdsService._create_ad_group(
+                        client, customer_id, plan, campaign.campaign_resource_name
+                    ))
+                if not campaign.ad_resource_name:
+                    complete('ad_resource_name', GoogleAdsService._create_ad_group_ad(
+                        client, customer_id, plan, campaign.ad_group_resource_name
+                    ))
             except Exception as ad_error:
                 result.add_warning(f"Ad Group/Ad creation failed: {str(ad_error)}")
             
             return result
-            
-        except GoogleAdsException as ex:
-            error_msg = f"Google Ads API error: {ex.error.code().name}"
-            if ex.failure and ex.failure.errors:
-                error_msg += f" - {ex.failure.errors[0].message}"
-            raise Exception(error_msg)
+        
+        except google_ads_exception() as ex:
+            raise Exception(GoogleAdsService._google_ads_error_message(ex))
         except Exception as e:
             raise Exception(f"Failed to publish campaign: {str(e)}")
     
     @staticmethod
-    def _update_campaign_status(google_campaign_id: str, customer_id: str, status) -> None:
-        client = google_ads_client.client
-        campaign_service = client.get_service("CampaignService")
+    def publish_campaigns(drafts: list[PublishDraft], customer_id: str) -> BatchPublishResult:
+        """Publish many campaigns with one mutate call per resource type.
         
+        Steps that already have a resource name on a draft are skipped. Runs on fan-out threads, so it touches
+        no campaign rows: new resource names and asset cache entries are returned on the result (or on the
+        BatchPublishError's batch when a call fails outright) for the caller to write and commit.
+        """
+        batch = BatchPublishResult()
+        try:
+            client = google_ads_clients.for_customer(customer_id)
+            pending = {draft.key: draft for draft in drafts}
+            
+            asset_warnings = {}
+            uploads = {}
+            for key, draft in pending.items():
+                if not draft.asset_url or draft.resource_names['asset_resource_name']:
+                    continue
+                try:
+                    cached_resource_name, image = GoogleAdsService._fetch_image(customer_id, draft.asset_url)
+                except Exception as asset_error:
+                    asset_warnings[key] = f"Asset creation failed: {str(asset_error)}"
+                    continue
+                if cached_resource_name:
+                    batch.created(draft, 'asset_resource_name', cached_resource_name)
+                    if image is not None:
+                        batch.cached_assets.append((draft.asset_url, image, cached_resource_name))
+                else:
+                    uploads.setdefault(image.content_hash, (image, []))[1].append(key)
+            
+            if uploads:
+                content_hashes = list(uploads)
+                try:
+                    names, errors = GoogleAdsService._mutate_with_partial_failure(
+                        client, customer_id, "AssetService", "mutate_assets", "MutateAssetsRequest",
+                        [GoogleAdsService._build_image_asset_operation(
+                            client, image, f"{pending[keys[0]].plan['asset']['name']} {uuid.uuid4()}"
+                        ) for image, keys in (uploads[content_hash] for content_hash in content_hashes)]
+                    )
+                    for index, content_hash in enumerate(content_hashes):
+                        image, keys = uploads[content_hash]
+                        for key in keys:
+                            if index in errors:
+                                asset_warnings[key] = f"Asset creation failed: {errors[index]}"
+                            else:
+                                batch.created(pending[key], 'asset_resource_name', names[index])
+                                batch.cached_assets.append((pending[key].asset_url, image, names[index]))
+                except Exception as asset_error:
+                    for _, keys in uploads.values():
+                        for key in keys:
+                            asset_warnings[key] = f"Asset creation failed: {str(asset_error)}"
+            
+            budget_keys = [key for key, draft in pending.items() if not draft.resource_names['budget_resource_name']]
+            if budget_keys:
+                names, errors = GoogleAdsService._mutate_with_partial_failure(
+                    client, customer_id, "CampaignBudgetService", "mutate_campaign_budgets",
+                    "MutateCampaignBudgetsRequest",
+                    [GoogleAdsService._build_budget_operation(client, pending[key].plan) for key in budget_keys]
+                )
+                for index, key in enumerate(budget_keys):
+                    if index in errors:
+                        batch.failed[key] = f"Budget creation failed: {errors[index]}"
+                    else:
+                        batch.created(pending[key], 'budget_resource_name', names[index])
+            
+            campaign_keys = [
+                key for key, draft in pending.items()
+                if draft.resource_names['budget_resource_name'] and not draft.resource_names['campaign_resource_name']
+            ]
+            if campaign_keys:
+                names, errors = GoogleAdsService._mutate_with_partial_failure(
+                    client, customer_id, "CampaignService", "mutate_campaigns",
+                    "MutateCampaignsRequest",
+                    [GoogleAdsService._build_campaign_operation(
+                        client, pending[key].plan, pending[key].resource_names['budget_resource_name']
+                    ) for key in campaign_keys]
+                )
+                for index, key in enumerate(campaign_keys):
+                    if index in errors:
+                        batch.failed[key] = f"Campaign creation failed: {errors[index]}"
+                    else:
+                        batch.created(pending[key], 'campaign_resource_name', names[index])
+            
+            for key, draft in pending.items():
+                campaign_resource_name = draft.resource_names['campaign_resource_name']
+                if not campaign_resource_name:
+                    continue
+                result = PublishResult(campaign_resource_name.split('/')[-1])
+                if draft.resource_names['asset_resource_name']:
+                    result.asset_resource_name = draft.resource_names['asset_resource_name']
+                elif key in asset_warnings:
+                    result.add_warning(asset_warnings[key])
+                batch.published[key] = result
+            
+            ad_group_keys = [key for key in batch.published if not pending[key].resource_names['ad_group_resource_name']]
+            if ad_group_keys:
+                try:
+                    names, errors = GoogleAdsService._mutate_with_partial_failure(
+                        client, customer_id, "AdGroupService", "mutate_ad_groups",
+                        "MutateAdGroupsRequest",
+                        [GoogleAdsService._build_ad_group_operation(
+                            client, pending[key].plan, pending[key].resource_names['campaign_resource_name']
+                        ) for key in ad_group_keys]
+                    )
+                    for index, key in enumerate(ad_group_keys):
+                        if index in errors:
+                            batch.published[key].add_warning(f"Ad Group/Ad creation failed: {errors[index]}")
+                        else:
+                            batch.created(pending[key], 'ad_group_resource_name', names[index])
+                except Exception as ad_error:
+                    for key in ad_group_keys:
+                        batch.published[key].add_warning(f"Ad Group/Ad creation failed: {str(ad_error)}")
+            
+            ad_keys = [
+                key for key in batch.published
+                if pending[key].resource_names['ad_group_resource_name'] and not pending[key].resource_names['ad_resource_name']
+            ]
+            if ad_keys:
+                try:
+                    names, errors = GoogleAdsService._mutate_with_partial_failure(
+                        client, customer_id, "AdGroupAdService", "mutate_ad_group_ads",
+                        "MutateAdGroupAdsRequest",
+                        [GoogleAdsService._build_ad_group_ad_operation(
+                            client, pending[key].plan, pending[key].resource_names['ad_group_resource_name']
+                        ) for key in ad_keys]
+                    )
+                    for index, key in enumerate(ad_keys):
+                        if index in errors:
+                            batch.published[key].add_warning(f"Ad Group/Ad creation failed: {errors[index]}")
+                        else:
+                            batch.created(pending[key], 'ad_resource_name', names[index])
+                except Exception as ad_error:
+                    for key in ad_keys:
+                        batch.published[key].add_warning(f"Ad Group/Ad creation failed: {str(ad_error)}")
+            
+            return batch
+        
+        except google_ads_exception() as ex:
+            raise BatchPublishError(GoogleAdsService._google_ads_error_message(ex), batch)
+        except Exception as e:
+            raise BatchPublishError(f"Failed to publish campaigns: {str(e)}", batch)
+    
+    @staticmethod
+    def _build_status_operation(client, customer_id: str, google_campaign_id: str, status):
         resource_name = f"customers/{customer_id}/campaigns/{google_campaign_id}"
         
         campaign_operation = client.get_type("CampaignOperation")
@@ -207,6 +492,14 @@ class GoogleAdsService:
         campaign.resource_name = resource_name
         campaign.status = status
         campaign_operation.update_mask.paths.append("status")
+        return campaign_operation
+    
+    @staticmethod
+    def _update_campaign_status(google_campaign_id: str, customer_id: str, status) -> None:
+        client = google_ads_clients.for_customer(customer_id)
+        campaign_service = client.get_service("CampaignService")
+        
+        campaign_operation = GoogleAdsService._build_status_operation(client, customer_id, google_campaign_id, status)
         
         response = campaign_service.mutate_campaigns(
             customer_id=customer_id,
@@ -219,33 +512,82 @@ class GoogleAdsService:
     @staticmethod
     def enable_campaign(google_campaign_id: str, customer_id: str) -> None:
         try:
-            client = google_ads_client.client
+            client = google_ads_clients.for_customer(customer_id)
             GoogleAdsService._update_campaign_status(
                 google_campaign_id, 
                 customer_id, 
                 client.enums.CampaignStatusEnum.ENABLED
             )
-        except GoogleAdsException as ex:
-            error_msg = f"Google Ads API error: {ex.error.code().name}"
-            if ex.failure and ex.failure.errors:
-                error_msg += f" - {ex.failure.errors[0].message}"
-            raise Exception(error_msg)
+        except google_ads_exception() as ex:
+            raise Exception(GoogleAdsService._google_ads_error_message(ex))
         except Exception as e:
             raise Exception(f"Failed to enable campaign: {str(e)}")
     
     @staticmethod
     def pause_campaign(google_campaign_id: str, customer_id: str) -> None:
         try:
-            client = google_ads_client.client
+            client = google_ads_clients.for_customer(customer_id)
             GoogleAdsService._update_campaign_status(
                 google_campaign_id, 
                 customer_id, 
                 client.enums.CampaignStatusEnum.PAUSED
             )
-        except GoogleAdsException as ex:
-            error_msg = f"Google Ads API error: {ex.error.code().name}"
-            if ex.failure and ex.failure.errors:
-                error_msg += f" - {ex.failure.errors[0].message}"
-            raise Exception(error_msg)
+        except google_ads_exception() as ex:
+            raise Exception(GoogleAdsService._google_ads_error_message(ex))
         except Exception as e:
             raise Exception(f"Failed to pause campaign: {str(e)}")
+    
+    @staticmethod
+    def update_campaign_statuses(google_campaign_ids: list[str], customer_id: str, status_name: str) -> dict[str, str]:
+        """Set the status of many campaigns with one mutate call; returns errors keyed by Google campaign ID."""
+        try:
+            client = google_ads_clients.for_customer(customer_id)
+            status = getattr(client.enums.CampaignStatusEnum, status_name)
+            
+            _, errors = GoogleAdsService._mutate_with_partial_failure(
+                client, customer_id, "CampaignService", "mutate_campaigns", "MutateCampaignsRequest",
+                [GoogleAdsService._build_status_operation(client, customer_id, google_campaign_id, status)
+                 for google_campaign_id in google_campaign_ids]
+            )
+            
+            return {google_campaign_ids[index]: message for index, message in errors.items()}
+        except google_ads_exception() as ex:
+            raise Exception(GoogleAdsService._google_ads_error_message(ex))
+        except Exception as e:
+            raise Exception(f"Failed to update campaign statuses: {str(e)}")
+    
+    @staticmethod
+    def stream_campaign_metrics(customer_id: str, date_from: date, date_to: date) -> Iterator[tuple]:
+        """Yield (google_campaign_id, date, impressions, clicks, cost_micros, conversions) for every campaign and day."""
+        query = f"""
+            SELECT campaign.id, segments.date, metrics.impressions, metrics.clicks,
+                   metrics.cost_micros, metrics.conversions
+            FROM campaign
+            WHERE segments.date BETWEEN '{date_from.isoformat()}' AND '{date_to.isoformat()}'
+        """
+        try:
+            ga_service = google_ads_clients.for_customer(customer_id).get_service("GoogleAdsService")
+            for batch in ga_service.search_stream(customer_id=customer_id, query=query):
+                for row in batch.results:
+                    yield (
+                        str(row.campaign.id),
+                        date.fromisoformat(row.segments.date),
+                        row.metrics.impressions,
+                        row.metrics.clicks,
+                        row.metrics.cost_micros,
+                        row.metrics.conversions
+                    )
+        except google_ads_exception() as ex:
+            raise Exception(GoogleAdsService._google_ads_error_message(ex))
+    
+    @staticmethod
+    def stream_campaign_statuses(customer_id: str) -> Iterator[tuple[str, str]]:
+        """Yield (google_campaign_id, status name) for every campaign of the customer, removed ones included."""
+        query = "SELECT campaign.id, campaign.status FROM campaign"
+        try:
+            ga_service = google_ads_clients.for_customer(customer_id).get_service("GoogleAdsService")
+            for batch in ga_service.search_stream(customer_id=customer_id, query=query):
+                for row in batch.results:
+                    yield str(row.campaign.id), row.campaign.status.name
+        except google_ads_exception() as ex:
+            raise Exception(GoogleAdsService._google_ads_error_message(ex))
@@ -0,0 +1,84 @@
+import uuid
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+from app.core.config import Config
+from app.core.extensions import db, job_queue
+from app.models import Campaign, PublishJob
+from app.constants import JobStatus
+from app.services.campaign_service import CampaignService
+from app.utils.logger import bind_log_context
+
+logger = logging.getLogger(__name__)
+
+
+class JobService:
+    @staticmethod
+    def _expire_stale_jobs(campaign_id: uuid.UUID) -> None:
+        """Fail active jobs untouched for PUBLISH_JOB_TIMEOUT; their worker crashed, restarted or was killed."""
+        now = datetime.utcnow()
+        expired = PublishJob.query.filter(
+            PublishJob.campaign_id == campaign_id,
+            PublishJob.status.in_(JobStatus.active()),
+            PublishJob.updated_at < now - timedelta(seconds=Config.PUBLISH_JOB_TIMEOUT)
+        ).update({
+            PublishJob.status: JobStatus.FAILED,
+            PublishJob.error: 'Job timed out: its worker stopped before finishing',
+            PublishJob.finished_at: now
+        }, synchronize_session=False)
+        if expired:
+            db.session.commit()
+            logger.warning("Marked %s stale publish job(s) for campaign %s as failed", expired, campaign_id)
+    
+    @staticmethod
+    def enqueue_publish(campaign_id: str, customer_id: str) -> PublishJob:
+        campaign = db.session.get(Campaign, uuid.UUID(str(campaign_id)))
+        if not campaign:
+            raise ValueError('Campaign not found')
+        
+        if CampaignService.is_fully_published(campaign):
+            raise ValueError('Campaign already published')
+        
+        JobService._expire_stale_jobs(campaign.id)
+        active_job = PublishJob.query.filter(
+            PublishJob.campaign_id == campaign.id,
+            PublishJob.status.in_(JobStatus.active())
+        ).first()
+        if active_job:
+            return active_job
+        
+        job = PublishJob(campaign_id=campaign.id, status=JobStatus.QUEUED)
+        db.session.add(job)
+        db.session.commit()
+        
+        job_queue.submit(JobService.run_publish_job, job.id, customer_id)
+        
+        return job
+    
+    @staticmethod
+    def get_job(job_id: str) -> Optional[PublishJob]:
+        return db.session.get(PublishJob, uuid.UUID(str(job_id)))
+    
+    @staticmethod
+    def run_publish_job(job_id: uuid.UUID, customer_id: str) -> None:
+        job = db.session.get(PublishJob, uuid.UUID(str(job_id)))
+        if not job or job.status != JobStatus.QUEUED:
+            return
+        
+        bind_log_context(campaign_id=str(job.campaign_id), job_id=str(job.id))
+        job.status = JobStatus.RUNNING
+        job.started_at = datetime.utcnow()
+        db.session.commit()
+        
+        try:
+            _, warnings = CampaignService.publish_campaign(str(job.campaign_id), customer_id)
+            job.status = JobStatus.SUCCEEDED
+            job.warnings = warnings
+        except Exception as e:
+            db.session.rollback()
+            job.status = JobStatus.FAILED
+            job.error = str(e)
+            logger.warning("Publish job %s failed: %s", job.id, e)
+        
+        job.finished_at = datetime.utcnow()
+        db.session.commit()
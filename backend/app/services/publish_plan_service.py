@@ -0,0 +1,121 @@
+import unicodedata
+from marshmallow import ValidationError
+from app.constants import PublishPlan
+from app.models import Campaign
+
+PLAN_FIELDS = ('name', 'daily_budget', 'start_date', 'end_date', 'ad_group_name', 'ad_headline', 'ad_description',
+               'final_url', 'asset_url')
+# Budget and asset names get a uuid appended when the resource is created; keep room for it.
+UNIQUE_SUFFIX_LENGTH = 37
+LEARN_MORE_SUFFIX = ' - Learn More'
+DISCOVER_PREFIX = 'Discover '
+LEARN_MORE_PREFIX = 'Learn more about '
+VISIT_PREFIX = 'Visit our website to learn more about '
+
+
+class PublishPlanService:
+    """Compiles a campaign into the exact payload publishing sends, once, when the campaign is created.
+    
+    The plan is stored on the campaign row; publish, batch publish and dry runs replay it instead of redoing the
+    text fallbacks, truncation and date formatting, and problems Google Ads would reject surface at creation.
+    """
+    
+    @staticmethod
+    def _char_width(char: str) -> int:
+        return 2 if unicodedata.east_asian_width(char) in ('W', 'F') else 1
+    
+    @staticmethod
+    def text_width(text: str) -> int:
+        """Width as Google Ads counts it for text limits: full-width (e.g. CJK) characters count as two."""
+        return sum(PublishPlanService._char_width(char) for char in text)
+    
+    @staticmethod
+    def fit_width(text: str, max_width: int) -> str:
+        """Longest prefix of text that fits in max_width."""
+        if len(text) * 2 <= max_width:
+            return text
+        width = 0
+        for index, char in enumerate(text):
+            width += PublishPlanService._char_width(char)
+            if width > max_width:
+                return text[:index]
+        return text
+    
+    @staticmethod
+    def _headlines(name: str, ad_headline: str) -> list:
+        fit, width = PublishPlanService.fit_width, PublishPlanService.text_width
+        limit = PublishPlan.HEADLINE_MAX_WIDTH
+        first = ad_headline if ad_headline and ad_headline.strip() else name
+        return [
+            fit(first, limit),
+            fit(name, limit - width(LEARN_MORE_SUFFIX)) + LEARN_MORE_SUFFIX,
+            DISCOVER_PREFIX + fit(name, limit - width(DISCOVER_PREFIX)),
+        ]
+    
+    @staticmethod
+    def _descriptions(name: str, ad_description: str) -> list:
+        fit, width = PublishPlanService.fit_width, PublishPlanService.text_width
+        limit = PublishPlan.DESCRIPTION_MAX_WIDTH
+        if ad_description and ad_description.strip():
+            first = fit(ad_description, limit)
+        else:
+            first = LEARN_MORE_PREFIX + fit(name, limit - width(LEARN_MORE_PREFIX) - 1) + '.'
+        return [first, VISIT_PREFIX + fit(name, limit - width(VISIT_PREFIX) - 1) + '.']
+    
+    @staticmethod
+    def _has_duplicates(texts: list) -> bool:
+        return len({text.casefold() for text in texts}) < len(texts)
+    
+    @staticmethod
+    def compile(fields: dict) -> dict:
+        """Build the plan from validated campaign fields; raises ValidationError for what Google Ads would reject."""
+        name = fields['name']
+        start_date, end_date = fields['start_date'], fields.get('end_date')
+        errors = {}
+        
+        if not name.strip():
+            errors['name'] = ['Name must not be blank']
+        if end_date and end_date < start_date:
+            errors['end_date'] = ['End date cannot be before start date']
+        if fields['daily_budget'] % PublishPlan.BUDGET_MICROS_UNIT:
+            errors['daily_budget'] = [
+                f'Daily budget must be a multiple of {PublishPlan.BUDGET_MICROS_UNIT} micros (whole cents)'
+            ]
+        
+        headlines = PublishPlanService._headlines(name, fields.get('ad_headline'))
+        if PublishPlanService._has_duplicates(headlines):
+            errors['ad_headline'] = [f'Headline must differ from the generated headlines "{headlines[1]}" and '
+                                     f'"{headlines[2]}"']
+        descriptions = PublishPlanService._descriptions(name, fields.get('ad_description'))
+        if PublishPlanService._has_duplicates(descriptions):
+            errors['ad_description'] = [f'Description must differ from the generated description "{descriptions[1]}"']
+        
+        if errors:
+            raise ValidationError(errors)
+        
+        name_room = PublishPlan.NAME_MAX_LENGTH - UNIQUE_SUFFIX_LENGTH
+        return {
+            'v': PublishPlan.VERSION,
+            'asset': {'name': f'Asset {name}'[:name_room]} if fields.get('asset_url') else None,
+            'budget': {'name': f'Budget {name}'[:name_room], 'amount_micros': fields['daily_budget']},
+            'campaign': {
+                'name': name,
+                'start_date': start_date.strftime('%Y%m%d'),
+                'end_date': end_date.strftime('%Y%m%d') if end_date else None,
+            },
+            'ad_group': {'name': (fields.get('ad_group_name') or f'Ad Group - {name}')[:PublishPlan.NAME_MAX_LENGTH]},
+            'ad': {'final_url': fields['final_url'], 'headlines': headlines, 'descriptions': descriptions},
+        }
+    
+    @staticmethod
+    def plan_for(campaign: Campaign) -> dict:
+        """The campaign's stored plan; compiled and stored on the campaign when missing or from an older version."""
+        plan = campaign.publish_plan
+        if plan is None or plan.get('v') != PublishPlan.VERSION:
+            try:
+                plan = PublishPlanService.compile({field: getattr(campaign, field) for field in PLAN_FIELDS})
+            except ValidationError as err:
+                details = '; '.join(f"{field}: {' '.join(messages)}" for field, messages in err.messages.items())
+                raise ValueError(f'Campaign cannot be published: {details}')
+            campaign.publish_plan = plan
+        return plan
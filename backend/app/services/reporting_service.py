@@ -0,0 +1,177 @@
+import logging
+from datetime import date, datetime, timedelta
+from typing import Iterator, List, Optional, Tuple
+from app.core.extensions import db
+from app.models import Campaign, CampaignDailyMetric, DailyMetricsRollup, CampaignMetricsRollup, MetricsSyncState
+from app.constants import Pagination, Reporting
+from app.services.campaign_service import CampaignService
+from app.services.google_ads_service import GoogleAdsService
+
+logger = logging.getLogger(__name__)
+
+
+class ReportingService:
+    @staticmethod
+    def _sync_window(customer_id: str, today: date) -> Tuple[date, date]:
+        """Resume a few days before the high-water mark, since Google Ads restates recent days."""
+        state = MetricsSyncState.query.get(customer_id)
+        if state:
+            date_from = state.last_synced_date - timedelta(days=Reporting.LOOKBACK_DAYS)
+        else:
+            date_from = today - timedelta(days=Reporting.INITIAL_SYNC_DAYS)
+        return date_from, today
+    
+    @staticmethod
+    def _iter_chunks(items: list, size: int) -> Iterator[list]:
+        for start in range(0, len(items), size):
+            yield items[start:start + size]
+    
+    @staticmethod
+    def _campaign_ids_in_window(customer_campaigns, date_from: date, date_to: date) -> set:
+        rows = db.session.query(CampaignDailyMetric.campaign_id).filter(
+            CampaignDailyMetric.campaign_id.in_(customer_campaigns),
+            CampaignDailyMetric.date.between(date_from, date_to)
+        ).distinct()
+        return {campaign_id for campaign_id, in rows}
+    
+    @staticmethod
+    def _rebuild_rollups(date_from: date, date_to: date, campaign_ids: set) -> None:
+        db.session.execute(db.delete(DailyMetricsRollup).where(DailyMetricsRollup.date.between(date_from, date_to)))
+        db.session.execute(db.insert(DailyMetricsRollup).from_select(
+            ['date', 'campaigns', 'impressions', 'clicks', 'cost_micros', 'conversions'],
+            db.select(
+                CampaignDailyMetric.date,
+                db.func.count(CampaignDailyMetric.campaign_id),
+                db.func.sum(CampaignDailyMetric.impressions),
+                db.func.sum(CampaignDailyMetric.clicks),
+                db.func.sum(CampaignDailyMetric.cost_micros),
+                db.func.sum(CampaignDailyMetric.conversions)
+            ).where(CampaignDailyMetric.date.between(date_from, date_to)).group_by(CampaignDailyMetric.date)
+        ))
+        
+        for chunk in ReportingService._iter_chunks(list(campaign_ids), Reporting.ROLLUP_ID_CHUNK_SIZE):
+            db.session.execute(db.delete(CampaignMetricsRollup).where(CampaignMetricsRollup.campaign_id.in_(chunk)))
+            db.session.execute(db.insert(CampaignMetricsRollup).from_select(
+                ['campaign_id', 'first_date', 'last_date', 'impressions', 'clicks', 'cost_micros', 'conversions'],
+                db.select(
+                    CampaignDailyMetric.campaign_id,
+                    db.func.min(CampaignDailyMetric.date),
+                    db.func.max(CampaignDailyMetric.date),
+                    db.func.sum(CampaignDailyMetric.impressions),
+                    db.func.sum(CampaignDailyMetric.clicks),
+                    db.func.sum(CampaignDailyMetric.cost_micros),
+                    db.func.sum(CampaignDailyMetric.conversions)
+                ).where(CampaignDailyMetric.campaign_id.in_(chunk)).group_by(CampaignDailyMetric.campaign_id)
+            ))
+    
+    @staticmethod
+    def sync_metrics(customer_id: str, today: Optional[date] = None) -> dict:
+        """Refetch daily metrics from the high-water mark onwards and rebuild the affected rollups in one transaction."""
+        today = today or date.today()
+        date_from, date_to = ReportingService._sync_window(customer_id, today)
+        
+        customer_clause = CampaignService.customer_clause(customer_id)
+        customer_campaigns = db.select(Campaign.id).where(customer_clause)
+        local_ids = dict(
+            db.session.query(Campaign.google_campaign_id, Campaign.id).filter(
+                Campaign.google_campaign_id.isnot(None), customer_clause
+            )
+        )
+        
+        try:
+            # The window is refetched in full, so stale rows (including days that dropped to zero) are replaced.
+            touched_ids = ReportingService._campaign_ids_in_window(customer_campaigns, date_from, date_to)
+            db.session.execute(
+                db.delete(CampaignDailyMetric).where(
+                    CampaignDailyMetric.campaign_id.in_(customer_campaigns),
+                    CampaignDailyMetric.date.between(date_from, date_to)
+                )
+            )
+            
+            synced_at = datetime.utcnow()
+            rows_synced = 0
+            batch = []
+            for google_campaign_id, day, impressions, clicks, cost_micros, conversions in \
+                    GoogleAdsService.stream_campaign_metrics(customer_id, date_from, date_to):
+                campaign_id = local_ids.get(google_campaign_id)
+                if campaign_id is None:
+                    continue
+                touched_ids.add(campaign_id)
+                batch.append({
+                    'campaign_id': campaign_id,
+                    'date': day,
+                    'impressions': impressions,
+                    'clicks': clicks,
+                    'cost_micros': cost_micros,
+                    'conversions': conversions,
+                    'synced_at': synced_at
+                })
+                if len(batch) >= Reporting.INSERT_BATCH_SIZE:
+                    db.session.execute(db.insert(CampaignDailyMetric), batch)
+                    rows_synced += len(batch)
+                    batch = []
+            if batch:
+                db.session.execute(db.insert(CampaignDailyMetric), batch)
+                rows_synced += len(batch)
+            
+            ReportingService._rebuild_rollups(date_from, date_to, touched_ids)
+            
+            state = MetricsSyncState.query.get(customer_id)
+            if state is None:
+                state = MetricsSyncState(customer_id=customer_id)
+                db.session.add(state)
+            state.last_synced_date = date_to
+            
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        
+        return {
+            'customer_id': customer_id,
+            'date_from': date_from,
+            'date_to': date_to,
+            'rows': rows_synced,
+            'campaigns': len(touched_ids)
+        }
+    
+    @staticmethod
+    def run_sync_job(customer_ids: List[str]) -> None:
+        """Sync the accounts one after another; each run rebuilds the shared daily rollups for its window."""
+        for customer_id in customer_ids:
+            try:
+                summary = ReportingService.sync_metrics(customer_id)
+                logger.info("Synced %s metric rows for customer %s", summary['rows'], customer_id)
+            except Exception as e:
+                db.session.rollback()
+                logger.error("Metrics sync failed for customer %s: %s", customer_id, e)
+    
+    @staticmethod
+    def _check_range(date_from: date, date_to: date) -> None:
+        if date_from > date_to:
+            raise ValueError('date_from must not be after date_to')
+        if (date_to - date_from).days >= Reporting.MAX_RANGE_DAYS:
+            raise ValueError(f'Date range must not exceed {Reporting.MAX_RANGE_DAYS} days')
+    
+    @staticmethod
+    def get_daily_rollups(date_from: date, date_to: date) -> List[DailyMetricsRollup]:
+        ReportingService._check_range(date_from, date_to)
+        return DailyMetricsRollup.query.filter(
+            DailyMetricsRollup.date.between(date_from, date_to)
+        ).order_by(DailyMetricsRollup.date).all()
+    
+    @staticmethod
+    def get_campaign_rollups(limit: int = Pagination.DEFAULT_LIMIT) -> List[CampaignMetricsRollup]:
+        """Campaigns with the highest lifetime spend first."""
+        limit = max(1, min(limit, Pagination.MAX_LIMIT))
+        return CampaignMetricsRollup.query.order_by(
+            CampaignMetricsRollup.cost_micros.desc(), CampaignMetricsRollup.campaign_id
+        ).limit(limit).all()
+    
+    @staticmethod
+    def get_campaign_daily_metrics(campaign_id: str, date_from: date, date_to: date) -> List[CampaignDailyMetric]:
+        ReportingService._check_range(date_from, date_to)
+        return CampaignDailyMetric.query.filter(
+            CampaignDailyMetric.campaign_id == campaign_id,
+            CampaignDailyMetric.date.between(date_from, date_to)
+        ).order_by(CampaignDailyMetric.date).all()
@@ -0,0 +1,25 @@
+import csv
+import io
+import json
+from typing import IO, Iterator, Tuple, Union
+
+
+def iter_csv_records(stream: IO[bytes]) -> Iterator[Tuple[int, Union[dict, str]]]:
+    """Yield (row_number, record) from a CSV byte stream; empty cells become None."""
+    reader = csv.DictReader(io.TextIOWrapper(stream, encoding='utf-8-sig', newline=''))
+    for record in reader:
+        if None in record:
+            yield reader.line_num, 'Row has more values than the header'
+            continue
+        yield reader.line_num, {key: (value if value != '' else None) for key, value in record.items()}
+
+
+def iter_ndjson_records(stream: IO[bytes]) -> Iterator[Tuple[int, Union[dict, str]]]:
+    """Yield (line_number, record) from an NDJSON byte stream; unparsable lines yield an error string."""
+    for line_number, line in enumerate(io.TextIOWrapper(stream, encoding='utf-8'), start=1):
+        if not line.strip():
+            continue
+        try:
+            yield line_number, json.loads(line)
+        except ValueError as e:
+            yield line_number, f'Invalid JSON: {str(e)}'
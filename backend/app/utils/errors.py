@@ -11,12 +11,12 @@ def register_error_handlers(app):
     
     @app.errorhandler(500)
     def internal_error(error):
-        logger.error(f"Internal error: {str(error)}")
+        logger.error("Internal error: %s", error)
         return jsonify({'error': 'Internal server error'}), 500
     
     @app.errorhandler(Exception)
     def handle_exception(error):
-        logger.error(f"Unhandled exception: {str(error)}")
+        logger.error("Unhandled exception: %s", error, exc_info=error)
         if app.debug:
             raise
         return jsonify({'error': 'An error occurred'}), 500
@@ -0,0 +1,18 @@
+import json
+from flask import Response
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj, sort_keys: bool = True) -> bytes:
+    """Compact JSON; uses orjson when installed (UTF-8 output instead of ASCII escapes)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+    return json.dumps(obj, separators=(',', ':'), sort_keys=sort_keys).encode()
+
+
+def json_response(payload, status: int = 200) -> Response:
+    return Response(dumps(payload), status=status, mimetype='application/json')
@@ -1,29 +1,298 @@
-from google.ads.googleads.client import GoogleAdsClient
 from pathlib import Path
+import os
+import threading
+import time
 import logging
+from app.core.metrics import metrics
+from app.utils.logger import note_google_ads_call
+from app.utils.rate_limiter import CustomerRateLimiter
+from app.utils.retry import RetryPolicy, google_ads_exception, status_code
 
 logger = logging.getLogger(__name__)
 
+WARM_UP_SERVICES = (
+    "AssetService",
+    "CampaignBudgetService",
+    "CampaignService",
+    "AdGroupService",
+    "AdGroupAdService",
+)
+
+WARM_UP_TYPES = (
+    "AssetOperation",
+    "CampaignBudgetOperation",
+    "CampaignOperation",
+    "AdGroupOperation",
+    "AdGroupAdOperation",
+    "AdTextAsset",
+    "ManualCpc",
+)
+
+
+def _customer_id(kwargs: dict) -> str:
+    request = kwargs.get('request')
+    customer_id = kwargs.get('customer_id') or getattr(request, 'customer_id', None)
+    return customer_id or 'default'
+
+
+def load_sdk() -> None:
+    """Import the Google Ads SDK now instead of on first use, e.g. in a preforking master so workers share it."""
+    google_ads_exception()
+    from google.ads.googleads import client  # noqa: F401
+
+
+class InstrumentedService:
+    """Proxy around a service stub that rate-limits and retries API calls and records latency and errors."""
+    
+    def __init__(self, service, service_name: str, limiter: CustomerRateLimiter, retry_policy: RetryPolicy):
+        self._service = service
+        self._service_name = service_name
+        self._limiter = limiter
+        self._retry_policy = retry_policy
+    
+    def _attempt(self, name: str, attr, args, kwargs):
+        start = time.perf_counter()
+        try:
+            with self._limiter.limit(_customer_id(kwargs)):
+                result = attr(*args, **kwargs)
+        except Exception as e:
+            self._observe(name, time.perf_counter() - start, e)
+            raise
+        self._observe(name, time.perf_counter() - start)
+        return result
+    
+    def _observe(self, name: str, seconds: float, error: Exception = None) -> None:
+        metrics.observe_google_ads_call(self._service_name, name, seconds, error)
+        note_google_ads_call(seconds)
+        if logger.isEnabledFor(logging.DEBUG):
+            call = f'{self._service_name}.{name}'
+            logger.debug("Google Ads %s took %.1f ms", call, seconds * 1000,
+                         extra={'sampled': True, 'google_ads_call': call, 'duration_ms': round(seconds * 1000, 3)})
+    
+    def _backoff(self, name: str, attempt: int, error: Exception) -> bool:
+        delay = self._retry_policy.delay(attempt, error)
+        if delay is None:
+            return False
+        code = status_code(error)
+        reason = code.name if code else type(error).__name__
+        metrics.observe_google_ads_retry(self._service_name, name, reason)
+        logger.warning("Retrying %s.%s in %.2fs after %s", self._service_name, name, delay, reason)
+        self._retry_policy.sleep(delay)
+        return True
+    
+    def _call(self, name: str, attr, args, kwargs):
+        attempt = 0
+        while True:
+            try:
+                return self._attempt(name, attr, args, kwargs)
+            except Exception as e:
+                if not self._backoff(name, attempt, e):
+                    raise
+                attempt += 1
+    
+    def _stream(self, name: str, attr, args, kwargs):
+        # A stream can only be restarted safely before its first batch has been handed to the caller.
+        attempt = 0
+        while True:
+            started = False
+            try:
+                for batch in self._attempt(name, attr, args, kwargs):
+                    started = True
+                    yield batch
+                return
+            except Exception as e:
+                if started or not self._backoff(name, attempt, e):
+                    raise
+                attempt += 1
+    
+    def __getattr__(self, name):
+        attr = getattr(self._service, name)
+        if name.startswith('_') or not callable(attr):
+            return attr
+        
+        if name == 'search_stream':
+            def call(*args, **kwargs):
+                return self._stream(name, attr, args, kwargs)
+        else:
+            def call(*args, **kwargs):
+                return self._call(name, attr, args, kwargs)
+        
+        setattr(self, name, call)
+        return call
+
+
+def normalize_customer_id(customer_id) -> str:
+    return str(customer_id or '').replace('-', '').strip()
+
+
+def parse_customer_login_ids(value: str) -> dict[str, str]:
+    """Parse 'customer:login,customer:login' into {customer_id: login_customer_id}."""
+    mapping = {}
+    for pair in (value or '').split(','):
+        if not pair.strip():
+            continue
+        customer_id, _, login_customer_id = pair.partition(':')
+        mapping[normalize_customer_id(customer_id)] = normalize_customer_id(login_customer_id)
+    return mapping
+
 
 class GoogleAdsClientWrapper:
-    def __init__(self, config_path='google-ads.yaml'):
+    def __init__(self, config_path='google-ads.yaml', login_customer_id: str = None,
+                 limiter: CustomerRateLimiter = None, retry_policy: RetryPolicy = None):
         self.config_path = config_path
+        self.login_customer_id = login_customer_id
         self._client = None
+        self._services = {}
+        self._types = {}
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self.limiter = limiter or CustomerRateLimiter()
+        self.retry_policy = retry_policy or RetryPolicy()
+    
+    def init_app(self, app):
+        self.config_path = app.config.get('GOOGLE_ADS_YAML_PATH', self.config_path)
+        self.limiter.configure(
+            app.config.get('GOOGLE_ADS_QPS', 10.0),
+            app.config.get('GOOGLE_ADS_BURST', 10),
+            app.config.get('GOOGLE_ADS_MAX_CONCURRENCY', 4)
+        )
+        self.retry_policy.configure(
+            app.config.get('GOOGLE_ADS_MAX_RETRIES', 5),
+            app.config.get('GOOGLE_ADS_RETRY_BASE_DELAY', 0.5),
+            app.config.get('GOOGLE_ADS_RETRY_MAX_DELAY', 30.0)
+        )
+        if app.config.get('GOOGLE_ADS_WARM_UP'):
+            try:
+                self.warm_up()
+            except Exception as e:
+                logger.warning("Google Ads client warm-up skipped: %s", e)
+    
+    def _reset_after_fork(self):
+        # gRPC channels must not be shared across a fork, so children rebuild them.
+        if self._pid != os.getpid():
+            self._client = None
+            self._services = {}
+            self._types = {}
+            self._pid = os.getpid()
+            self._lock = threading.Lock()
+            self.limiter.reset()
+    
+    def set_client(self, client):
+        """Use an already constructed client (e.g. a fake in benchmarks) and drop cached handles."""
+        with self._lock:
+            self._client = client
+            self._services = {}
+            self._types = {}
     
     @property
     def client(self):
+        self._reset_after_fork()
         if self._client is None:
-            config_file = Path(self.config_path)
-            if not config_file.exists():
-                raise FileNotFoundError(f"Google Ads config not found: {self.config_path}")
-            
-            self._client = GoogleAdsClient.load_from_storage(str(config_file))
-            logger.info("Google Ads client initialized")
+            with self._lock:
+                if self._client is None:
+                    config_file = Path(self.config_path)
+                    if not config_file.exists():
+                        raise FileNotFoundError(f"Google Ads config not found: {self.config_path}")
+                    
+                    from google.ads.googleads.client import GoogleAdsClient
+                    
+                    client = GoogleAdsClient.load_from_storage(str(config_file))
+                    if self.login_customer_id:
+                        client.login_customer_id = self.login_customer_id
+                    self._client = client
+                    logger.info("Google Ads client initialized (login customer %s)", client.login_customer_id or 'none')
         
         return self._client
     
-    def get_service(self, service_name, version='v18'):
-        return self.client.get_service(service_name, version=version)
+    @property
+    def enums(self):
+        return self.client.enums
+    
+    def get_service(self, service_name, version=None):
+        self._reset_after_fork()
+        key = (service_name, version)
+        service = self._services.get(key)
+        if service is None:
+            client = self.client
+            service = client.get_service(service_name, version=version) if version else client.get_service(service_name)
+            service = InstrumentedService(service, service_name, self.limiter, self.retry_policy)
+            self._services[key] = service
+        return service
+    
+    def get_type(self, type_name):
+        """Return a fresh message, built from a cached class instead of a per-call type lookup."""
+        self._reset_after_fork()
+        message_class = self._types.get(type_name)
+        if message_class is None:
+            message_class = type(self.client.get_type(type_name))
+            self._types[type_name] = message_class
+        return message_class()
+    
+    def warm_up(self, services=WARM_UP_SERVICES, types=WARM_UP_TYPES):
+        for service_name in services:
+            self.get_service(service_name)
+        for type_name in types:
+            self.get_type(type_name)
+        logger.info("Google Ads client warmed up (%d services, %d types)", len(services), len(types))
+
+
+class GoogleAdsClientPool:
+    """Clients and their cached service handles per login-customer-id, resolved from the operating customer.
+    
+    Accounts without an explicit manager in GOOGLE_ADS_CUSTOMER_LOGIN_IDS use GOOGLE_ADS_LOGIN_CUSTOMER_ID,
+    or the default client (login_customer_id from google-ads.yaml) when neither is set. All clients share
+    one per-customer rate limiter and retry policy.
+    """
+    
+    def __init__(self, default: GoogleAdsClientWrapper):
+        self.default = default
+        self.default_login_customer_id = None
+        self.customer_login_ids = {}
+        self._wrappers = {}
+        self._client_override = None
+        self._lock = threading.Lock()
+    
+    def init_app(self, app):
+        self.default.init_app(app)
+        self.default_login_customer_id = normalize_customer_id(app.config.get('GOOGLE_ADS_LOGIN_CUSTOMER_ID')) or None
+        self.customer_login_ids = parse_customer_login_ids(app.config.get('GOOGLE_ADS_CUSTOMER_LOGIN_IDS', ''))
+        self._wrappers = {}
+    
+    def login_customer_id_for(self, customer_id: str) -> str:
+        return self.customer_login_ids.get(normalize_customer_id(customer_id), self.default_login_customer_id)
+    
+    def for_customer(self, customer_id: str) -> GoogleAdsClientWrapper:
+        login_customer_id = self.login_customer_id_for(customer_id)
+        if not login_customer_id:
+            return self.default
+        
+        wrapper = self._wrappers.get(login_customer_id)
+        if wrapper is None:
+            with self._lock:
+                wrapper = self._wrappers.get(login_customer_id)
+                if wrapper is None:
+                    wrapper = GoogleAdsClientWrapper(
+                        self.default.config_path, login_customer_id, self.default.limiter, self.default.retry_policy
+                    )
+                    if self._client_override is not None:
+                        wrapper.set_client(self._client_override)
+                    self._wrappers[login_customer_id] = wrapper
+        return wrapper
+    
+    def reset_after_fork(self):
+        self._lock = threading.Lock()
+        self.default._reset_after_fork()
+        for wrapper in self._wrappers.values():
+            wrapper._reset_after_fork()
+    
+    def set_client(self, client):
+        """Route every customer to an already constructed client (e.g. a fake in benchmarks)."""
+        with self._lock:
+            self._client_override = client
+            self.default.set_client(client)
+            for wrapper in self._wrappers.values():
+                wrapper.set_client(client)
 
 
 google_ads_client = GoogleAdsClientWrapper()
+google_ads_clients = GoogleAdsClientPool(google_ads_client)
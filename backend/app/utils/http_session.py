@@ -0,0 +1,41 @@
+import os
+import threading
+from app.core.config import Config
+
+_session = None
+_session_pid = None
+_lock = threading.Lock()
+
+
+def _build_session():
+    # requests is imported here so that only processes which download assets pay for it.
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    retry = Retry(
+        total=Config.ASSET_HTTP_RETRIES,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=['GET', 'HEAD']
+    )
+    adapter = HTTPAdapter(
+        pool_connections=Config.ASSET_HTTP_POOL_SIZE,
+        pool_maxsize=Config.ASSET_HTTP_POOL_SIZE,
+        max_retries=retry
+    )
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def get_http_session():
+    """Return the process-wide keep-alive session, rebuilding it after a fork."""
+    global _session, _session_pid
+    if _session is None or _session_pid != os.getpid():
+        with _lock:
+            if _session is None or _session_pid != os.getpid():
+                _session = _build_session()
+                _session_pid = os.getpid()
+    return _session
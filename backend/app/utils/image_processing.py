@@ -0,0 +1,169 @@
+import importlib.util
+import os
+import struct
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from typing import Optional
+from app.core.config import Config
+
+MIME_TYPES = {'jpeg': 'image/jpeg', 'png': 'image/png', 'gif': 'image/gif'}
+JPEG_QUALITIES = (85, 75, 65, 50)
+# Start-of-frame markers carry the image size; DHT (C4), JPG (C8) and DAC (CC) share the range but do not.
+JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+CHUNK_SIZE = 64 * 1024
+
+_pool = None
+_pool_pid = None
+_lock = threading.Lock()
+
+
+def read_capped(response, max_bytes: int) -> bytes:
+    """Read a streamed response body, failing as soon as it exceeds max_bytes instead of buffering all of it."""
+    length = response.headers.get('Content-Length')
+    if length and length.isdigit() and int(length) > max_bytes:
+        raise ValueError(f"Image is {int(length)} bytes; the limit is {max_bytes}")
+    
+    chunks = []
+    received = 0
+    for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+        received += len(chunk)
+        if received > max_bytes:
+            raise ValueError(f"Image is larger than the {max_bytes} byte limit")
+        chunks.append(chunk)
+    return b''.join(chunks)
+
+
+def sniff_format(data: bytes) -> Optional[str]:
+    """The image format from the file's magic bytes: jpeg, png, gif, or None for anything else."""
+    if data.startswith(b'\xff\xd8\xff'):
+        return 'jpeg'
+    if data.startswith(b'\x89PNG\r\n\x1a\n'):
+        return 'png'
+    if data[:6] in (b'GIF87a', b'GIF89a'):
+        return 'gif'
+    return None
+
+
+def _jpeg_size(data: bytes) -> Optional[tuple[int, int]]:
+    index = 2
+    while index + 9 < len(data):
+        if data[index] != 0xFF:
+            return None
+        marker = data[index + 1]
+        if marker == 0xFF:
+            index += 1
+            continue
+        if marker in JPEG_SOF_MARKERS:
+            height, width = struct.unpack('>HH', data[index + 5:index + 9])
+            return width, height
+        if 0xD0 <= marker <= 0xD9 or marker == 0x01:
+            index += 2
+            continue
+        index += 2 + struct.unpack('>H', data[index + 2:index + 4])[0]
+    return None
+
+
+def image_size(data: bytes, image_format: str) -> Optional[tuple[int, int]]:
+    """Width and height read from the image header, without decoding the pixels."""
+    if image_format == 'png' and len(data) >= 24:
+        return struct.unpack('>II', data[16:24])
+    if image_format == 'gif' and len(data) >= 10:
+        return struct.unpack('<HH', data[6:10])
+    if image_format == 'jpeg':
+        return _jpeg_size(data)
+    return None
+
+
+def _encode_jpeg(image, max_bytes: int) -> bytes:
+    data = b''
+    for quality in JPEG_QUALITIES:
+        output = BytesIO()
+        image.save(output, format='JPEG', quality=quality, optimize=True)
+        data = output.getvalue()
+        if len(data) <= max_bytes:
+            break
+    return data
+
+
+def _shrink(data: bytes, max_dimension: int, max_bytes: int) -> tuple[bytes, str]:
+    """Downscale to max_dimension and re-encode until the image fits in max_bytes; runs in the image pool."""
+    from PIL import Image
+    
+    with Image.open(BytesIO(data)) as image:
+        if getattr(image, 'n_frames', 1) > 1:
+            raise ValueError("Animated GIF exceeds the asset size limits and cannot be downscaled")
+        if image.format == 'JPEG':
+            # Lets the decoder skip detail the thumbnail would throw away.
+            image.draft('RGB', (max_dimension, max_dimension))
+        image.thumbnail((max_dimension, max_dimension))
+        
+        if image.format == 'JPEG':
+            return _encode_jpeg(image.convert('RGB'), max_bytes), 'jpeg'
+        
+        output = BytesIO()
+        image.save(output, format='PNG', optimize=True)
+        if output.tell() <= max_bytes:
+            return output.getvalue(), 'png'
+        if image.mode in ('RGBA', 'LA', 'PA') or 'transparency' in image.info:
+            raise ValueError(f"Image with transparency is still larger than {max_bytes} bytes after downscaling")
+        return _encode_jpeg(image.convert('RGB'), max_bytes), 'jpeg'
+
+
+def get_image_pool() -> Optional[ProcessPoolExecutor]:
+    """Return the process-wide pool that resizes images, or None when ASSET_IMAGE_WORKERS is 0."""
+    global _pool, _pool_pid
+    if Config.ASSET_IMAGE_WORKERS <= 0:
+        return None
+    if _pool is None or _pool_pid != os.getpid():
+        with _lock:
+            if _pool is None or _pool_pid != os.getpid():
+                _pool = ProcessPoolExecutor(max_workers=Config.ASSET_IMAGE_WORKERS)
+                _pool_pid = os.getpid()
+    return _pool
+
+
+def shutdown_image_pool() -> None:
+    global _pool
+    if _pool is not None and _pool_pid == os.getpid():
+        _pool.shutdown(wait=True)
+    _pool = None
+
+
+def prepare_image(data: bytes) -> tuple[bytes, str]:
+    """Check a downloaded image against the asset limits and return the bytes to upload and their MIME type.
+    
+    Raises ValueError for data that is not a JPEG, PNG or GIF image, or whose dimensions Google Ads would
+    reject. Images over ASSET_MAX_DIMENSION or ASSET_MAX_UPLOAD_BYTES are downscaled in the image pool.
+    """
+    image_format = sniff_format(data)
+    if image_format is None:
+        raise ValueError("Asset URL did not return a JPEG, PNG or GIF image")
+    size = image_size(data, image_format)
+    if size is None:
+        raise ValueError(f"Could not read the dimensions of the {image_format.upper()} image")
+    
+    width, height = size
+    if min(width, height) < Config.ASSET_MIN_DIMENSION:
+        raise ValueError(f"Image is {width}x{height}; both sides must be at least {Config.ASSET_MIN_DIMENSION} pixels")
+    if width * height > Config.ASSET_MAX_PIXELS:
+        raise ValueError(f"Image is {width}x{height}; the limit is {Config.ASSET_MAX_PIXELS} pixels")
+    if max(width, height) <= Config.ASSET_MAX_DIMENSION and len(data) <= Config.ASSET_MAX_UPLOAD_BYTES:
+        return data, MIME_TYPES[image_format]
+    
+    # Checked without importing Pillow, which only the pool processes load.
+    if importlib.util.find_spec('PIL') is None:
+        raise ValueError(f"Image is {width}x{height} and {len(data)} bytes, over the asset limits; "
+                         f"install Pillow to downscale it")
+    
+    args = (data, Config.ASSET_MAX_DIMENSION, Config.ASSET_MAX_UPLOAD_BYTES)
+    pool = get_image_pool()
+    if pool is None:
+        data, image_format = _shrink(*args)
+    else:
+        data, image_format = pool.submit(_shrink, *args).result(timeout=Config.ASSET_HTTP_TIMEOUT)
+    
+    if len(data) > Config.ASSET_MAX_UPLOAD_BYTES:
+        raise ValueError(f"Image is still {len(data)} bytes after downscaling; the limit is "
+                         f"{Config.ASSET_MAX_UPLOAD_BYTES}")
+    return data, MIME_TYPES[image_format]
@@ -1,21 +1,181 @@
+import atexit
+import copy
 import logging
+import os
+import queue
+import random
+import uuid
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler, TimedRotatingFileHandler
 from pathlib import Path
+from flask import g, has_app_context, has_request_context, request
+from app.utils.fast_json import dumps
 
 logger = logging.getLogger('pathik')
 
+TEXT_FORMAT = '[%(asctime)s] %(levelname)s: %(message)s'
+REQUEST_ID_HEADER = 'X-Request-ID'
+# Attributes the context filter and log calls (via extra=) add to records; JSON output includes the ones set.
+CONTEXT_FIELDS = ('request_id', 'campaign_id', 'job_id', 'google_ads_calls', 'google_ads_ms',
+                  'google_ads_call', 'duration_ms')
+
+_listener = None
+
+
+class ContextFilter(logging.Filter):
+    """Stamps records with the request id, campaign id and Google Ads time of the request or job that logged them.
+    
+    Runs on the thread that logs, before the record is queued, because the Flask context is thread-local.
+    """
+    
+    def filter(self, record):
+        if hasattr(record, 'request_id') or not has_app_context():
+            return True
+        fields = g.get('_log_context', {})
+        record.request_id = fields.get('request_id')
+        record.campaign_id = getattr(record, 'campaign_id', None) or fields.get('campaign_id')
+        if record.campaign_id is None and has_request_context() and request.view_args:
+            campaign_id = request.view_args.get('campaign_id')
+            record.campaign_id = str(campaign_id) if campaign_id else None
+        if 'job_id' in fields:
+            record.job_id = fields['job_id']
+        if g.get('_google_ads_calls'):
+            record.google_ads_calls = g._google_ads_calls
+            record.google_ads_ms = round(g._google_ads_seconds * 1000, 3)
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps a fraction of the DEBUG records logged with extra={'sampled': True} (hot-path records)."""
+    
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+    
+    def filter(self, record):
+        if record.levelno > logging.DEBUG or not getattr(record, 'sampled', False) or self.rate >= 1:
+            return True
+        if not hasattr(record, '_sample_kept'):
+            # Decided once per record so every handler keeps or drops the same ones.
+            record._sample_kept = random.random() < self.rate
+        return record._sample_kept
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: timestamp, level, logger, message, context fields and exception."""
+    
+    def format(self, record):
+        entry = {
+            'timestamp': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        for field in CONTEXT_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return dumps(entry, sort_keys=False).decode()
+
+
+class DeferredQueueHandler(QueueHandler):
+    def prepare(self, record):
+        # Only merge the arguments into the message now (they may change once the call returns);
+        # formatting, tracebacks included, happens on the listener thread.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def bind_log_context(**fields) -> None:
+    """Attach fields (e.g. campaign_id, job_id) to every record logged in the current app context."""
+    g._log_context = dict(g.get('_log_context', {}), **fields)
+
+
+def note_google_ads_call(seconds: float) -> None:
+    """Add a Google Ads call to the running total that the current request's or job's records carry."""
+    if has_app_context():
+        g._google_ads_calls = g.get('_google_ads_calls', 0) + 1
+        g._google_ads_seconds = g.get('_google_ads_seconds', 0.0) + seconds
+
+
+def _assign_request_id():
+    request_id = request.headers.get(REQUEST_ID_HEADER, '')
+    if not request_id or len(request_id) > 128 or not request_id.isprintable():
+        request_id = uuid.uuid4().hex
+    bind_log_context(request_id=request_id)
+
+
+def _echo_request_id(response):
+    request_id = g.get('_log_context', {}).get('request_id')
+    if request_id:
+        response.headers[REQUEST_ID_HEADER] = request_id
+    return response
+
+
+def _file_handler(config, path: Path) -> logging.Handler:
+    rotation = config['LOG_ROTATION']
+    if rotation == 'size':
+        return RotatingFileHandler(path, maxBytes=config['LOG_MAX_BYTES'], backupCount=config['LOG_BACKUP_COUNT'])
+    if rotation == 'time':
+        return TimedRotatingFileHandler(path, when=config['LOG_ROTATE_WHEN'], backupCount=config['LOG_BACKUP_COUNT'])
+    return logging.FileHandler(path)
+
+
+def _start_listener(handlers: list) -> QueueHandler:
+    global _listener
+    _listener = QueueListener(queue.SimpleQueue(), *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_log_listener)
+    os.register_at_fork(after_in_child=_restart_listener_after_fork)
+    return DeferredQueueHandler(_listener.queue)
+
+
+def _restart_listener_after_fork() -> None:
+    # A forked child (gunicorn worker, process publish worker) inherits the queue but not the listener thread.
+    global _listener
+    if _listener is None:
+        return
+    _listener = QueueListener(queue.SimpleQueue(), *_listener.handlers, respect_handler_level=True)
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, DeferredQueueHandler):
+            handler.queue = _listener.queue
+    _listener.start()
+
+
+def stop_log_listener() -> None:
+    """Write out the queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
 
 def setup_logger(app):
-    log_dir = Path(app.root_path).parent / 'logs'
-    log_dir.mkdir(exist_ok=True)
-    
-    logging.basicConfig(
-        level=logging.DEBUG if app.debug else logging.INFO,
-        format='[%(asctime)s] %(levelname)s: %(message)s',
-        handlers=[
-            logging.FileHandler(log_dir / 'app.log'),
-            logging.StreamHandler()
-        ]
-    )
-    
-    logger.setLevel(logging.DEBUG if app.debug else logging.INFO)
+    level = logging.DEBUG if app.debug else logging.INFO
+    
+    # Like basicConfig, only the first app in the process configures the root logger.
+    if not logging.getLogger().handlers:
+        log_dir = Path(app.root_path).parent / 'logs'
+        log_dir.mkdir(exist_ok=True)
+        
+        formatter = JsonFormatter() if app.config['LOG_FORMAT'] == 'json' else logging.Formatter(TEXT_FORMAT)
+        handlers = [_file_handler(app.config, log_dir / 'app.log'), logging.StreamHandler()]
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        if app.config['LOG_QUEUE']:
+            handlers = [_start_listener(handlers)]
+        
+        for handler in handlers:
+            handler.addFilter(SamplingFilter(app.config['LOG_DEBUG_SAMPLE_RATE']))
+            handler.addFilter(ContextFilter())
+        logging.basicConfig(level=level, handlers=handlers)
+    
+    app.before_request(_assign_request_id)
+    app.after_request(_echo_request_id)
+    
+    logger.setLevel(level)
     app.logger.info('Application starting...')
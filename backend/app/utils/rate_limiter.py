@@ -0,0 +1,76 @@
+import threading
+import time
+from contextlib import contextmanager
+
+
+class TokenBucket:
+    """Thread-safe token bucket; callers reserve a token and sleep until it is due, outside the lock."""
+    
+    def __init__(self, rate: float, burst: int, clock=time.monotonic, sleep=time.sleep):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> float:
+        """Take one token, waiting if needed; returns the seconds waited."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            self._sleep(wait)
+        return wait
+
+
+class CustomerRateLimiter:
+    """Per-customer QPS (token bucket) and concurrency (semaphore) limits shared by all threads of a process."""
+    
+    def __init__(self, qps: float = 10.0, burst: int = 10, max_concurrency: int = 4,
+                 clock=time.monotonic, sleep=time.sleep):
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self.configure(qps, burst, max_concurrency)
+    
+    def reset(self) -> None:
+        """Drop all per-customer state; used after a fork, when inherited locks may be held."""
+        self._lock = threading.Lock()
+        self._customers = {}
+    
+    def configure(self, qps: float, burst: int, max_concurrency: int) -> None:
+        with self._lock:
+            self.qps = qps
+            self.burst = burst
+            self.max_concurrency = max_concurrency
+            self._customers = {}
+    
+    def _limits(self, customer_id: str):
+        limits = self._customers.get(customer_id)
+        if limits is None:
+            with self._lock:
+                limits = self._customers.get(customer_id)
+                if limits is None:
+                    bucket = TokenBucket(self.qps, self.burst, self._clock, self._sleep) if self.qps > 0 else None
+                    semaphore = threading.BoundedSemaphore(self.max_concurrency) if self.max_concurrency > 0 else None
+                    limits = self._customers[customer_id] = (bucket, semaphore)
+        return limits
+    
+    @contextmanager
+    def limit(self, customer_id: str):
+        """Hold one of the customer's concurrency slots and spend one token for the duration of a call."""
+        bucket, semaphore = self._limits(customer_id)
+        if semaphore is not None:
+            semaphore.acquire()
+        try:
+            if bucket is not None:
+                bucket.acquire()
+            yield
+        finally:
+            if semaphore is not None:
+                semaphore.release()
@@ -0,0 +1,75 @@
+import random
+import time
+from typing import Optional
+
+# grpc.StatusCode names. DEADLINE_EXCEEDED is left out on purpose: the mutate may already have been applied,
+# and mutates are not idempotent.
+RETRYABLE_CODES = frozenset({
+    'RESOURCE_EXHAUSTED',
+    'INTERNAL',
+    'UNAVAILABLE',
+})
+
+
+def google_ads_exception() -> type:
+    """GoogleAdsException, imported on first use so that loading the app does not pull in the SDK."""
+    from google.ads.googleads.errors import GoogleAdsException
+    return GoogleAdsException
+
+
+def status_code(error: Exception):
+    """The grpc.StatusCode of a Google Ads or gRPC error, or None for anything else."""
+    import grpc
+    
+    if isinstance(error, google_ads_exception()):
+        return error.error.code()
+    if isinstance(error, grpc.RpcError) and callable(getattr(error, 'code', None)):
+        return error.code()
+    return None
+
+
+def retry_delay_hint(error: Exception) -> float:
+    """Largest retry_delay the API attached to a quota error, in seconds (0 when there is none)."""
+    failure = getattr(error, 'failure', None)
+    if not failure:
+        return 0.0
+    hint = 0.0
+    for failure_error in failure.errors:
+        delay = failure_error.details.quota_error_details.retry_delay
+        if hasattr(delay, 'total_seconds'):
+            seconds = delay.total_seconds()
+        else:
+            seconds = delay.seconds + delay.nanos / 1e9
+        hint = max(hint, seconds)
+    return hint
+
+
+class RetryPolicy:
+    """Jittered exponential backoff for transient Google Ads errors that respects server retry hints."""
+    
+    def __init__(self, max_retries: int = 5, base_delay: float = 0.5, max_delay: float = 30.0,
+                 sleep=time.sleep, rng: random.Random = None):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.sleep = sleep
+        self._random = rng or random.Random()
+    
+    def configure(self, max_retries: int, base_delay: float, max_delay: float) -> None:
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+    
+    def delay(self, attempt: int, error: Exception) -> Optional[float]:
+        """Seconds to wait before retry number attempt + 1, or None when the error should be raised."""
+        code = status_code(error)
+        if attempt >= self.max_retries or code is None or code.name not in RETRYABLE_CODES:
+            return None
+        
+        hint = retry_delay_hint(error)
+        if hint > self.max_delay:
+            # The quota will not recover within a request's lifetime; fail now instead of blocking a worker.
+            return None
+        
+        ceiling = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return max(hint, self._random.uniform(ceiling / 2, ceiling))
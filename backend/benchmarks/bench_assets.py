@@ -0,0 +1,65 @@
+"""Image preprocessing before asset upload: header checks, and downscaling inline vs in the image process pool.
+
+Publish threads each prepare oversized JPEGs at the same time, as concurrent publishes would. bytes_in/bytes_out
+show how much less is uploaded. Needs Pillow to generate the images.
+"""
+import importlib.util
+import os
+import threading
+
+from benchmarks.common import timed
+
+
+def _jpeg(width: int, height: int) -> bytes:
+    from io import BytesIO
+    from PIL import Image
+    
+    image = Image.frombytes('RGB', (width, height), os.urandom(width * height * 3))
+    output = BytesIO()
+    image.save(output, format='JPEG', quality=90)
+    return output.getvalue()
+
+
+def _prepare_concurrently(images: list, threads: int) -> int:
+    from app.utils.image_processing import prepare_image
+    
+    sizes = []
+    
+    def worker(offset: int):
+        for data in images[offset::threads]:
+            sizes.append(len(prepare_image(data)[0]))
+    
+    workers = [threading.Thread(target=worker, args=(offset,)) for offset in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return sum(sizes)
+
+
+def run(images: int = 16, threads: int = 4, pool_sizes: tuple = (0, 2, 4)) -> dict:
+    if importlib.util.find_spec('PIL') is None:
+        return {'skipped': 'Pillow is not installed'}
+    
+    from app.core.config import Config
+    from app.utils.image_processing import image_size, shutdown_image_pool, sniff_format
+    
+    oversized = [_jpeg(3000, 2000) for _ in range(images)]
+    within_limits = _jpeg(1200, 628)
+    results = {'images': images, 'threads': threads, 'bytes_in': sum(map(len, oversized))}
+    
+    results['header_check'] = timed(lambda: image_size(within_limits, sniff_format(within_limits)), 10000)
+    
+    workers_before = Config.ASSET_IMAGE_WORKERS
+    try:
+        for workers in pool_sizes:
+            Config.ASSET_IMAGE_WORKERS = workers
+            shutdown_image_pool()
+            bytes_out = []
+            name = 'downscale_inline' if workers == 0 else f'downscale_pool_{workers}'
+            results[name] = timed(lambda: bytes_out.append(_prepare_concurrently(oversized, threads)))
+            results[name]['bytes_out'] = bytes_out[0]
+    finally:
+        shutdown_image_pool()
+        Config.ASSET_IMAGE_WORKERS = workers_before
+    return results
@@ -0,0 +1,29 @@
+"""CampaignService create and list paths against a seeded campaigns table.
+
+full_table_load is the unpaginated query the list used to run, kept as the baseline for the paged reads.
+"""
+from benchmarks.common import campaign_payload, seed_campaigns, timed
+
+
+def run(app, rows=(1000, 100000, 1000000), creates: int = 200) -> dict:
+    from app.models import Campaign
+    from app.services import CampaignService
+    
+    results = {'create_campaign': None, 'list': {}}
+    with app.app_context():
+        counter = iter(range(10 ** 9))
+        results['create_campaign'] = timed(
+            lambda: CampaignService.create_campaign(campaign_payload(next(counter))), creates
+        )
+        
+        for size in sorted(rows):
+            seed_campaigns(size)
+            _, cursor = CampaignService.get_campaigns_page()
+            results['list'][str(size)] = {
+                'full_table_load': timed(
+                    lambda: Campaign.query.order_by(Campaign.created_at.desc()).all(), 1 if size > 100000 else 3
+                ),
+                'get_campaigns_page_first': timed(CampaignService.get_campaigns_page, 20),
+                'get_campaigns_page_next': timed(lambda: CampaignService.get_campaigns_page(cursor=cursor), 20),
+            }
+    return results
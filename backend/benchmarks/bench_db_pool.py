@@ -0,0 +1,84 @@
+"""Read-replica routing and pool checkout waits, with two local databases standing in for primary and replica.
+
+Reader threads list campaigns (routed to the replica) while writer threads create campaigns (primary).
+The pools are kept small so checkout waits show up in db_pool_checkout_wait_seconds.
+"""
+import os
+import tempfile
+import threading
+
+from benchmarks.common import campaign_payload, campaign_row, timed
+
+
+def _pool_totals(metrics) -> dict:
+    totals = {}
+    for (pool,), (_, seconds, count) in metrics.db_pool_checkout_wait._series.items():
+        totals[pool] = (seconds, count)
+    return totals
+
+
+def run(readers: int = 8, writers: int = 2, requests: int = 50, rows: int = 1000, pool_size: int = 2,
+        primary_url: str = None, replica_url: str = None) -> dict:
+    from app import create_app
+    from app.core import Config, db, metrics
+    from app.core.database import REPLICA_BIND
+    from app.models import Campaign
+    
+    directory = tempfile.mkdtemp(prefix='pathik-bench-')
+    primary_url = primary_url or f"sqlite:///{os.path.join(directory, 'primary.db')}"
+    replica_url = replica_url or f"sqlite:///{os.path.join(directory, 'replica.db')}"
+    engine_options = dict(Config.SQLALCHEMY_ENGINE_OPTIONS, pool_size=pool_size, max_overflow=0)
+    app = create_app(
+        SQLALCHEMY_DATABASE_URI=primary_url,
+        SQLALCHEMY_BINDS={REPLICA_BIND: dict(engine_options, url=replica_url, pool_logging_name=REPLICA_BIND)},
+        SQLALCHEMY_ENGINE_OPTIONS=engine_options,
+        CACHE_BACKEND='none'
+    )
+    
+    with app.app_context():
+        db.create_all()
+        db.metadata.create_all(db.engines[REPLICA_BIND])
+        seed = [campaign_row(index) for index in range(rows)]
+        for engine in (db.engines[None], db.engines[REPLICA_BIND]):
+            with engine.begin() as connection:
+                connection.execute(db.insert(Campaign), seed)
+    
+    client = app.test_client()
+    errors = []
+    
+    def reader():
+        for _ in range(requests):
+            if client.get('/api/v1/campaigns?limit=50').status_code != 200:
+                errors.append('read')
+    
+    def writer():
+        for index in range(requests):
+            if client.post('/api/v1/campaigns', json=campaign_payload(index)).status_code != 201:
+                errors.append('write')
+    
+    def load():
+        threads = [threading.Thread(target=reader) for _ in range(readers)]
+        threads += [threading.Thread(target=writer) for _ in range(writers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    
+    before = _pool_totals(metrics)
+    results = {'readers': readers, 'writers': writers, 'requests_per_thread': requests, 'pool_size': pool_size}
+    results['mixed_load'] = timed(load)
+    results['mixed_load']['errors'] = len(errors)
+    
+    for pool, (seconds, count) in _pool_totals(metrics).items():
+        seconds -= before.get(pool, (0.0, 0))[0]
+        count -= before.get(pool, (0.0, 0))[1]
+        results[f'{pool}_checkouts'] = count
+        results[f'{pool}_mean_checkout_wait_ms'] = seconds / count * 1000 if count else None
+    
+    with app.app_context():
+        for name, engine in (('primary', db.engines[None]), ('replica', db.engines[REPLICA_BIND])):
+            with engine.connect() as connection:
+                results[f'{name}_rows'] = connection.execute(db.select(db.func.count()).select_from(Campaign)).scalar()
+    
+    return results
+
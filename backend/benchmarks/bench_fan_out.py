@@ -0,0 +1,42 @@
+"""Multi-account publish batches: accounts one after another versus fanned out across the worker pool."""
+from benchmarks.common import campaign_row, timed
+from benchmarks.fake_google_ads import FakeGoogleAdsClient
+
+
+def run(app, customers: int = 8, campaigns: int = 20, latency: float = 0.02) -> dict:
+    from app.core import fan_out
+    from app.models import Campaign
+    from app.services import GoogleAdsService
+    from app.services.google_ads_service import PublishDraft
+    from app.utils.google_ads_client import google_ads_clients
+    
+    def make_groups():
+        # Publishing records resource names on the drafts, so each run starts from fresh ones.
+        return {
+            f'{1000000000 + customer}': [
+                PublishDraft(Campaign(**campaign_row(customer * campaigns + index))) for index in range(campaigns)
+            ]
+            for customer in range(customers)
+        }
+    
+    results = {'customers': customers, 'campaigns_per_customer': campaigns, 'latency_s': latency}
+    
+    def publish(customer_id, drafts):
+        return GoogleAdsService.publish_campaigns(drafts, customer_id)
+    
+    with app.app_context():
+        fake = FakeGoogleAdsClient(latency=latency, seed=1)
+        google_ads_clients.set_client(fake)
+        groups = make_groups()
+        results['sequential'] = timed(lambda: [publish(customer_id, drafts) for customer_id, drafts in groups.items()])
+        results['sequential']['api_calls'] = fake.call_count()
+        
+        fake = FakeGoogleAdsClient(latency=latency, seed=1)
+        google_ads_clients.set_client(fake)
+        groups = make_groups()
+        fan_out.map(lambda customer_id, drafts: None, groups)  # start the pool outside the timed run
+        results['fan_out'] = timed(lambda: fan_out.map(publish, groups))
+        results['fan_out']['api_calls'] = fake.call_count()
+        results['speedup'] = results['sequential']['total_s'] / results['fan_out']['total_s']
+    
+    return results
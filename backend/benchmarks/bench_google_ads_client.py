@@ -0,0 +1,70 @@
+"""Compare raw GoogleAdsClient handle lookups with the cached wrapper.
+
+Run from backend/: python -m benchmarks.bench_google_ads_client
+"""
+import json
+import sys
+import time
+
+from google.ads.googleads.client import GoogleAdsClient
+from google.auth.credentials import AnonymousCredentials
+
+from app.utils.google_ads_client import GoogleAdsClientWrapper, WARM_UP_SERVICES, WARM_UP_TYPES
+
+
+def _offline_client():
+    return GoogleAdsClient(credentials=AnonymousCredentials(), developer_token='benchmark', use_proto_plus=True)
+
+
+def _wrapper():
+    wrapper = GoogleAdsClientWrapper()
+    wrapper._client = _offline_client()
+    return wrapper
+
+
+def _per_call_us(func, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def _publish_handles(client):
+    for service_name in WARM_UP_SERVICES:
+        client.get_service(service_name)
+    for type_name in WARM_UP_TYPES:
+        client.get_type(type_name)
+
+
+def run(iterations=2000):
+    raw = _offline_client()
+    start = time.perf_counter()
+    _publish_handles(raw)
+    raw_first_ms = (time.perf_counter() - start) * 1000
+    
+    cached = _wrapper()
+    start = time.perf_counter()
+    cached.warm_up()
+    warm_up_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    _publish_handles(cached)
+    warm_first_ms = (time.perf_counter() - start) * 1000
+    
+    return {
+        'benchmark': 'google_ads_client',
+        'iterations': iterations,
+        'first_publish_handles_ms': {'raw': raw_first_ms, 'after_warm_up': warm_first_ms, 'warm_up': warm_up_ms},
+        'get_service_us': {
+            'raw': _per_call_us(lambda: raw.get_service('CampaignService'), iterations // 10),
+            'cached': _per_call_us(lambda: cached.get_service('CampaignService'), iterations),
+        },
+        'get_type_us': {
+            'raw': _per_call_us(lambda: raw.get_type('CampaignOperation'), iterations),
+            'cached': _per_call_us(lambda: cached.get_type('CampaignOperation'), iterations),
+        },
+    }
+
+
+if __name__ == '__main__':
+    json.dump(run(), sys.stdout, indent=2)
+    sys.stdout.write('\n')
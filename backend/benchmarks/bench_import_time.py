@@ -0,0 +1,81 @@
+"""Cold-start cost of loading the app as reported by `python -X importtime`, checked against a budget.
+
+Each sample runs in a fresh interpreter and does what a worker, a `flask db` command or a test process does at
+start-up: import the app package and call create_app(). The report lists the most expensive top-level packages
+(self time summed over their modules) and any deferred module that was loaded anyway.
+"""
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from collections import defaultdict
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+# Only needed once the app talks to Google Ads or downloads an asset, so start-up must not import them.
+DEFERRED_MODULES = ('google.ads.googleads', 'grpc', 'google.protobuf', 'requests', 'PIL')
+SCRIPT = (
+    'import sys\n'
+    'from app import create_app\n'
+    'create_app()\n'
+    f'print(",".join(name for name in {DEFERRED_MODULES!r} if name in sys.modules))\n'
+)
+
+
+def _parse_importtime(report: str) -> tuple[int, dict]:
+    """Total microseconds spent importing, and self time per top-level package."""
+    total_us = 0
+    by_package = defaultdict(int)
+    for line in report.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        module = name[1:]
+        if not module.startswith(' '):
+            total_us += int(cumulative_us)
+        by_package[module.strip().split('.')[0]] += int(self_us)
+    return total_us, by_package
+
+
+def _sample(env: dict) -> tuple[int, dict, list]:
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', SCRIPT],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True
+    )
+    total_us, by_package = _parse_importtime(result.stderr)
+    lines = result.stdout.strip().splitlines()
+    loaded = [name for name in lines[-1].split(',') if name] if lines else []
+    return total_us, by_package, loaded
+
+
+def run(samples: int = 5, budget_ms: float = 1000.0, top: int = 10) -> dict:
+    env = dict(
+        os.environ,
+        DATABASE_URL=f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='pathik-bench-'), 'import.db')}",
+        CACHE_BACKEND='none',
+        GOOGLE_ADS_WARM_UP='False',
+        DEBUG='False'
+    )
+    _sample(env)  # compile bytecode and warm the OS file cache
+    
+    totals = []
+    packages = defaultdict(list)
+    loaded = set()
+    for _ in range(samples):
+        total_us, by_package, deferred_loaded = _sample(env)
+        totals.append(total_us / 1000)
+        for package, self_us in by_package.items():
+            packages[package].append(self_us / 1000)
+        loaded.update(deferred_loaded)
+    
+    median_ms = statistics.median(totals)
+    slowest = sorted(packages.items(), key=lambda item: statistics.median(item[1]), reverse=True)[:top]
+    return {
+        'samples': samples,
+        'budget_ms': budget_ms,
+        'import_ms': {'median': median_ms, 'min': min(totals), 'max': max(totals)},
+        'top_packages_ms': {package: statistics.median(times) for package, times in slowest},
+        'deferred_modules_loaded': sorted(loaded),
+        'within_budget': median_ms <= budget_ms and not loaded,
+    }
@@ -0,0 +1,90 @@
+"""Concurrent publishes and enables of the same campaign, with CAMPAIGN_LOCKING off and on.
+
+For each campaign, `contenders` client threads send the same request at once through the Flask test client,
+against FakeGoogleAdsClient with per-call latency so the requests overlap. Without locking every contender
+that passes the status check repeats the Google Ads work (duplicate_budgets, duplicate_enables); with locking
+one request does it and the rest get 409 straight away. Both passes share one fake client so the campaign ids it
+hands out stay unique, and any 500 response fails the run.
+"""
+import threading
+from collections import Counter
+
+from benchmarks.common import campaign_row, timed
+from benchmarks.fake_google_ads import FakeGoogleAdsClient
+
+CUSTOMER_ID = '1234567890'
+
+
+def _responses(statuses: Counter) -> dict:
+    if statuses[500]:
+        raise AssertionError(f'{statuses[500]} requests failed with 500')
+    return {str(code): count for code, count in sorted(statuses.items())}
+
+
+def _contend(client, method: str, paths: list, contenders: int) -> Counter:
+    statuses = Counter()
+    
+    def send(path: str, barrier: threading.Barrier):
+        barrier.wait()
+        response = getattr(client, method)(path)
+        statuses[response.status_code] += 1
+    
+    for path in paths:
+        barrier = threading.Barrier(contenders)
+        threads = [threading.Thread(target=send, args=(path, barrier)) for _ in range(contenders)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    return statuses
+
+
+def _scenario(app, fake: FakeGoogleAdsClient, campaigns: int, contenders: int) -> dict:
+    from app.core import db
+    from app.models import Campaign
+    
+    with app.app_context():
+        drafts = [dict(campaign_row(index), customer_id=CUSTOMER_ID) for index in range(campaigns)]
+        db.session.execute(db.insert(Campaign), drafts)
+        db.session.commit()
+    paths = [f"/api/v1/campaigns/{row['id']}" for row in drafts]
+    
+    client = app.test_client()
+    results = {}
+    
+    budgets_before = fake.call_count('mutate_campaign_budgets')
+    statuses = []
+    results['publish'] = timed(
+        lambda: statuses.append(_contend(client, 'post', [f'{path}/publish' for path in paths], contenders))
+    )
+    results['publish']['responses'] = _responses(statuses[0])
+    results['publish']['duplicate_budgets'] = fake.call_count('mutate_campaign_budgets') - budgets_before - campaigns
+    
+    calls_before = fake.call_count('mutate_campaigns')
+    statuses = []
+    results['enable'] = timed(
+        lambda: statuses.append(_contend(client, 'put', [f'{path}/enable' for path in paths], contenders))
+    )
+    results['enable']['responses'] = _responses(statuses[0])
+    results['enable']['duplicate_enables'] = fake.call_count('mutate_campaigns') - calls_before - campaigns
+    
+    with app.app_context():
+        results['left_locked'] = Campaign.query.filter(Campaign.lock_token.isnot(None)).count()
+    return results
+
+
+def run(app, campaigns: int = 20, contenders: int = 4, latency: float = 0.02) -> dict:
+    from app.core.config import Config
+    from app.utils.google_ads_client import google_ads_clients
+    
+    fake = FakeGoogleAdsClient(latency=latency, seed=1)
+    google_ads_clients.set_client(fake)
+    results = {'campaigns': campaigns, 'contenders': contenders, 'latency_s': latency}
+    locking_before = Config.CAMPAIGN_LOCKING
+    try:
+        for locking in (False, True):
+            Config.CAMPAIGN_LOCKING = locking
+            results['locking' if locking else 'no_locking'] = _scenario(app, fake, campaigns, contenders)
+    finally:
+        Config.CAMPAIGN_LOCKING = locking_before
+    return results
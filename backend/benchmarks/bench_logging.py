@@ -0,0 +1,85 @@
+"""Time a request thread spends per log call: synchronous handlers vs the LOG_QUEUE listener, text vs JSON.
+
+The sink sleeps sink_latency seconds per write to stand in for a slow stdout pipe or disk. drain_s is how long
+the listener needed afterwards to write the queued records, i.e. the work moved off the request thread.
+"""
+import logging
+import os
+import queue
+import tempfile
+import time
+from logging.handlers import QueueListener
+
+
+class _SlowFileHandler(logging.FileHandler):
+    def __init__(self, path: str, latency: float):
+        super().__init__(path)
+        self.latency = latency
+    
+    def emit(self, record):
+        super().emit(record)
+        if self.latency:
+            time.sleep(self.latency)
+
+
+def _log(logger: logging.Logger, records: int, sampled_debug: bool) -> float:
+    start = time.perf_counter()
+    for index in range(records):
+        if sampled_debug:
+            logger.debug("Google Ads call %s", index, extra={'sampled': True, 'duration_ms': 1.0, 'request_id': 'bench'})
+        else:
+            logger.info("Published campaign %s", index, extra={'campaign_id': str(index), 'request_id': 'bench'})
+    return time.perf_counter() - start
+
+
+def _scenario(records: int, sink_latency: float, json_format: bool, use_queue: bool,
+              debug_sample_rate: float = None) -> dict:
+    from app.utils.logger import ContextFilter, DeferredQueueHandler, JsonFormatter, SamplingFilter, TEXT_FORMAT
+    
+    path = os.path.join(tempfile.mkdtemp(prefix='pathik-bench-'), 'app.log')
+    sink = _SlowFileHandler(path, sink_latency)
+    sink.setFormatter(JsonFormatter() if json_format else logging.Formatter(TEXT_FORMAT))
+    listener = None
+    handler = sink
+    if use_queue:
+        listener = QueueListener(queue.SimpleQueue(), sink, respect_handler_level=True)
+        listener.start()
+        handler = DeferredQueueHandler(listener.queue)
+    handler.addFilter(SamplingFilter(debug_sample_rate or 1.0))
+    handler.addFilter(ContextFilter())
+    
+    logger = logging.getLogger(f'benchmarks.logging.{id(handler)}')
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(handler)
+    
+    elapsed = _log(logger, records, sampled_debug=debug_sample_rate is not None)
+    
+    drain_start = time.perf_counter()
+    if listener is not None:
+        listener.stop()
+    drain = time.perf_counter() - drain_start
+    logger.removeHandler(handler)
+    sink.close()
+    with open(path) as log_file:
+        written = sum(1 for _ in log_file)
+    
+    return {
+        'records': records,
+        'written': written,
+        'caller_total_s': elapsed,
+        'caller_per_record_us': elapsed / records * 1e6,
+        'drain_s': drain,
+    }
+
+
+def run(records: int = 2000, sink_latency: float = 0.0002) -> dict:
+    results = {'records': records, 'sink_latency_s': sink_latency}
+    results['sync_text'] = _scenario(records, sink_latency, json_format=False, use_queue=False)
+    results['sync_json'] = _scenario(records, sink_latency, json_format=True, use_queue=False)
+    results['queue_text'] = _scenario(records, sink_latency, json_format=False, use_queue=True)
+    results['queue_json'] = _scenario(records, sink_latency, json_format=True, use_queue=True)
+    results['queue_json_debug_sampled_10pct'] = _scenario(
+        records, sink_latency, json_format=True, use_queue=True, debug_sample_rate=0.1
+    )
+    return results
@@ -0,0 +1,74 @@
+"""GoogleAdsService publish paths end to end against FakeGoogleAdsClient."""
+from benchmarks.common import campaign_row, timed
+from benchmarks.fake_google_ads import FakeGoogleAdsClient
+
+CUSTOMER_ID = '1234567890'
+
+
+def run(app, campaigns: int = 50, latency: float = 0.0, error_rate: float = 0.0) -> dict:
+    from app.models import Campaign
+    from app.services import GoogleAdsService, PublishPlanService
+    from app.services.google_ads_service import PublishDraft
+    from app.services.publish_plan_service import PLAN_FIELDS
+    from app.utils.google_ads_client import google_ads_clients
+    
+    def make_drafts():
+        # Publishing writes resource names onto the drafts, so every scenario starts from fresh ones.
+        return [Campaign(**campaign_row(index)) for index in range(campaigns)]
+    
+    results = {'campaigns': campaigns, 'latency_s': latency, 'error_rate': error_rate}
+    
+    with app.app_context():
+        fake = FakeGoogleAdsClient(latency=latency, error_rate=error_rate, seed=1)
+        google_ads_clients.set_client(fake)
+        remaining = iter(make_drafts())
+        failures = []
+        
+        def publish_one():
+            try:
+                GoogleAdsService.publish_campaign(next(remaining), CUSTOMER_ID)
+            except Exception as e:
+                failures.append(str(e))
+        
+        results['publish_campaign'] = timed(publish_one, campaigns)
+        results['publish_campaign']['api_calls'] = fake.call_count()
+        results['publish_campaign']['failures'] = len(failures)
+        
+        # Fail every ad group once, then publish again: only the ad group and ad steps are re-sent.
+        drafts = make_drafts()
+        fake = FakeGoogleAdsClient(latency=latency, partial_failures={'mutate_ad_groups': {0}})
+        google_ads_clients.set_client(fake)
+        for campaign in drafts:
+            GoogleAdsService.publish_campaign(campaign, CUSTOMER_ID)
+        fake.partial_failures = {}
+        calls_before = fake.call_count()
+        remaining = iter(drafts)
+        results['publish_campaign_resume'] = timed(
+            lambda: GoogleAdsService.publish_campaign(next(remaining), CUSTOMER_ID), campaigns
+        )
+        results['publish_campaign_resume']['api_calls'] = fake.call_count() - calls_before
+        
+        fake = FakeGoogleAdsClient(latency=latency, error_rate=error_rate, seed=1)
+        google_ads_clients.set_client(fake)
+        drafts = [PublishDraft(campaign) for campaign in make_drafts()]
+        results['publish_campaigns_batch'] = timed(lambda: GoogleAdsService.publish_campaigns(drafts, CUSTOMER_ID))
+        results['publish_campaigns_batch']['api_calls'] = fake.call_count()
+        
+        # Building the four operations of every campaign: replaying stored plans vs compiling them each time.
+        client = FakeGoogleAdsClient()
+        fields = [{field: row[field] for field in PLAN_FIELDS} for row in map(campaign_row, range(campaigns))]
+        plans = [PublishPlanService.compile(row) for row in fields]
+        
+        def build_operations(plan):
+            GoogleAdsService._build_budget_operation(client, plan)
+            GoogleAdsService._build_campaign_operation(client, plan, 'customers/1/campaignBudgets/1')
+            GoogleAdsService._build_ad_group_operation(client, plan, 'customers/1/campaigns/1')
+            GoogleAdsService._build_ad_group_ad_operation(client, plan, 'customers/1/adGroups/1')
+        
+        results['compile_plans'] = timed(lambda: [PublishPlanService.compile(row) for row in fields])
+        results['build_operations_from_stored_plans'] = timed(lambda: [build_operations(plan) for plan in plans])
+        results['build_operations_compiling_plans'] = timed(
+            lambda: [build_operations(PublishPlanService.compile(row)) for row in fields]
+        )
+    
+    return results
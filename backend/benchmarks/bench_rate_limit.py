@@ -0,0 +1,69 @@
+"""Publishing under injected quota errors with the per-customer rate limiter and retry policy."""
+import threading
+
+import grpc
+
+from benchmarks.common import campaign_row, timed
+from benchmarks.fake_google_ads import FakeGoogleAdsClient
+
+CUSTOMER_ID = '1234567890'
+
+
+def run(app, campaigns: int = 50, workers: int = 8, qps: float = 20.0, error_rate: float = 0.2,
+        latency: float = 0.01, retry_delay: float = 0.05) -> dict:
+    from app.core.metrics import metrics
+    from app.models import Campaign
+    from app.services import GoogleAdsService
+    from app.utils.google_ads_client import google_ads_client, google_ads_clients
+    
+    results = {'campaigns': campaigns, 'workers': workers, 'qps': qps, 'error_rate': error_rate}
+    
+    limiter = google_ads_client.limiter
+    policy = google_ads_client.retry_policy
+    saved = (limiter.qps, limiter.burst, limiter.max_concurrency), (policy.max_retries, policy.base_delay, policy.max_delay)
+    limiter.configure(qps, max(1, int(qps)), workers)
+    policy.configure(8, 0.05, 2.0)
+    
+    try:
+        with app.app_context():
+            fake = FakeGoogleAdsClient(
+                latency=latency, error_rate=error_rate, error_code=grpc.StatusCode.RESOURCE_EXHAUSTED,
+                retry_delay=retry_delay, seed=7
+            )
+            google_ads_clients.set_client(fake)
+            drafts = iter([Campaign(**campaign_row(index)) for index in range(campaigns)])
+            lock = threading.Lock()
+            failures = []
+            
+            def worker():
+                while True:
+                    with lock:
+                        campaign = next(drafts, None)
+                    if campaign is None:
+                        return
+                    try:
+                        with app.app_context():
+                            GoogleAdsService.publish_campaign(campaign, CUSTOMER_ID)
+                    except Exception as e:
+                        failures.append(str(e))
+            
+            def publish_all():
+                threads = [threading.Thread(target=worker) for _ in range(workers)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+            
+            retries_before = sum(metrics.google_ads_retries._values.values())
+            results['publish_campaign_parallel'] = timed(publish_all)
+            results['publish_campaign_parallel'].update({
+                'api_calls': fake.call_count(),
+                'achieved_qps': fake.call_count() / results['publish_campaign_parallel']['total_s'],
+                'retries': sum(metrics.google_ads_retries._values.values()) - retries_before,
+                'failures': len(failures),
+            })
+    finally:
+        limiter.configure(*saved[0])
+        policy.configure(*saved[1])
+    
+    return results
@@ -0,0 +1,38 @@
+"""CampaignService.reconcile_statuses against a fake search_stream reporting drifted statuses."""
+from benchmarks.common import campaign_row, timed
+from benchmarks.fake_google_ads import FakeGoogleAdsClient
+
+CUSTOMER_ID = '1234567890'
+
+
+def run(app, campaigns: int = 50000, drift: float = 0.1) -> dict:
+    from app.core import db
+    from app.models import Campaign
+    from app.services import CampaignService
+    from app.utils.google_ads_client import google_ads_clients
+    
+    results = {'campaigns': campaigns, 'drift': drift}
+    
+    with app.app_context():
+        rows = []
+        remote = []
+        drift_every = max(1, int(1 / drift)) if drift else None
+        for index in range(campaigns):
+            row = campaign_row(index, status='ENABLED')
+            row['google_campaign_id'] = str(800000000 + index)
+            rows.append(row)
+            drifted = drift_every and index % drift_every == 0
+            remote.append({'campaign.id': int(row['google_campaign_id']), 'campaign.status': 'PAUSED' if drifted else 'ENABLED'})
+        for start in range(0, len(rows), 10000):
+            db.session.execute(db.insert(Campaign), rows[start:start + 10000])
+        db.session.commit()
+        
+        google_ads_clients.set_client(FakeGoogleAdsClient(search_rows=remote))
+        
+        summary = {}
+        results['reconcile'] = timed(lambda: summary.update(CampaignService.reconcile_statuses(CUSTOMER_ID)))
+        results['reconcile']['updated'] = summary['updated']
+        results['reconcile_no_drift'] = timed(lambda: summary.update(CampaignService.reconcile_statuses(CUSTOMER_ID)))
+        results['reconcile_no_drift']['updated'] = summary['updated']
+    
+    return results
@@ -0,0 +1,65 @@
+"""ReportingService metrics sync against a fake search_stream, and rollup reads afterwards."""
+import re
+from datetime import date, timedelta
+
+from benchmarks.common import campaign_row, timed
+from benchmarks.fake_google_ads import FakeGoogleAdsClient
+
+CUSTOMER_ID = '1234567890'
+
+
+def _metric_rows(google_campaign_ids: list, today: date, days: int):
+    """Build a search_rows callable that honours the date window in the GAQL query."""
+    def rows(customer_id, query):
+        date_from, date_to = (date.fromisoformat(value) for value in re.findall(r"'(\d{4}-\d{2}-\d{2})'", query))
+        for offset in range(days):
+            day = today - timedelta(days=offset)
+            if not date_from <= day <= date_to:
+                continue
+            for google_campaign_id in google_campaign_ids:
+                yield {
+                    'campaign.id': int(google_campaign_id),
+                    'segments.date': day.isoformat(),
+                    'metrics.impressions': 1000,
+                    'metrics.clicks': 40,
+                    'metrics.cost_micros': 25000000,
+                    'metrics.conversions': 1.5,
+                }
+    return rows
+
+
+def run(app, campaigns: int = 1000, days: int = 90) -> dict:
+    from app.core import db
+    from app.models import Campaign
+    from app.services import ReportingService
+    from app.utils.google_ads_client import google_ads_clients
+    
+    today = date.today()
+    results = {'campaigns': campaigns, 'days': days}
+    
+    with app.app_context():
+        rows = []
+        for index in range(campaigns):
+            row = campaign_row(index, status='PUBLISHED')
+            row['google_campaign_id'] = str(900000000 + index)
+            row['customer_id'] = CUSTOMER_ID
+            rows.append(row)
+        db.session.execute(db.insert(Campaign), rows)
+        db.session.commit()
+        google_campaign_ids = [row['google_campaign_id'] for row in rows]
+        
+        fake = FakeGoogleAdsClient(search_rows=_metric_rows(google_campaign_ids, today, days))
+        google_ads_clients.set_client(fake)
+        
+        summary = {}
+        results['initial_sync'] = timed(lambda: summary.update(ReportingService.sync_metrics(CUSTOMER_ID, today)))
+        results['initial_sync']['rows'] = summary['rows']
+        results['incremental_sync'] = timed(lambda: summary.update(ReportingService.sync_metrics(CUSTOMER_ID, today)))
+        results['incremental_sync']['rows'] = summary['rows']
+        
+        results['daily_rollups'] = timed(
+            lambda: ReportingService.get_daily_rollups(today - timedelta(days=days), today), 20
+        )
+        results['campaign_rollups'] = timed(ReportingService.get_campaign_rollups, 20)
+    
+    return results
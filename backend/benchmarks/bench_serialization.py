@@ -0,0 +1,36 @@
+"""Campaign serialization throughput: marshmallow + json versus the precompiled row serializer."""
+import json
+
+from benchmarks.common import campaign_row, timed
+
+
+def _throughput(func, rows: int, repeat: int) -> dict:
+    result = timed(func, repeat)
+    result['rows'] = rows
+    result['rows_per_s'] = rows / (result['total_s'] / repeat)
+    return result
+
+
+def run(rows: int = 10000, repeat: int = 3) -> dict:
+    from app.models import Campaign
+    from app.schemas import campaigns_schema, campaign_row_serializer
+    from app.utils import fast_json
+    
+    campaigns = [Campaign(**campaign_row(index)) for index in range(rows)]
+    attributes = [column.key for column in campaign_row_serializer.columns]
+    tuples = [tuple(getattr(campaign, attribute) for attribute in attributes) for campaign in campaigns]
+    
+    identical = campaigns_schema.dump(campaigns) == campaign_row_serializer.dump_rows(tuples)
+    
+    return {
+        'identical_output': identical,
+        'json_backend': 'orjson' if fast_json.orjson is not None else 'json',
+        'campaigns_schema_dump': _throughput(lambda: campaigns_schema.dump(campaigns), rows, repeat),
+        'row_serializer_dump': _throughput(lambda: campaign_row_serializer.dump_rows(tuples), rows, repeat),
+        'campaigns_schema_dump_json': _throughput(
+            lambda: json.dumps(campaigns_schema.dump(campaigns), separators=(',', ':'), sort_keys=True), rows, repeat
+        ),
+        'row_serializer_dump_json': _throughput(
+            lambda: fast_json.dumps(campaign_row_serializer.dump_rows(tuples)), rows, repeat
+        ),
+    }
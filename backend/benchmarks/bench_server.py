@@ -0,0 +1,91 @@
+"""Load test of production mode (run.py --mode production): list throughput as the worker count grows.
+
+The Flask development server is measured first as a baseline. Each run gets a fresh server process against the benchmark database. Clients run in separate
+processes so the load generator is not limited by this process's GIL.
+"""
+import http.client
+import importlib.util
+import os
+import socket
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from benchmarks.common import seed_campaigns
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+PATH = '/api/v1/campaigns?limit=50'
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _wait_ready(port: int, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            connection = http.client.HTTPConnection('127.0.0.1', port, timeout=2)
+            connection.request('GET', '/api/v1/health')
+            if connection.getresponse().status == 200:
+                return
+        except OSError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f'Server on port {port} did not become ready')
+
+
+def _client(port: int, requests: int) -> int:
+    """Send requests over one keep-alive connection; returns the number of non-200 responses."""
+    errors = 0
+    connection = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+    for _ in range(requests):
+        connection.request('GET', PATH)
+        response = connection.getresponse()
+        response.read()
+        if response.status != 200:
+            errors += 1
+    connection.close()
+    return errors
+
+
+def _load(port: int, clients: int, requests: int) -> dict:
+    with ProcessPoolExecutor(max_workers=clients) as pool:
+        list(pool.map(_client, [port] * clients, [1] * clients))  # connect and warm every worker first
+        start = time.perf_counter()
+        errors = sum(pool.map(_client, [port] * clients, [requests] * clients))
+        elapsed = time.perf_counter() - start
+    total = clients * requests
+    return {'requests': total, 'errors': errors, 'total_s': elapsed, 'requests_per_s': total / elapsed}
+
+
+def run(app, workers=(1, 2, 4), threads: int = 4, clients: int = 16, requests: int = 100, rows: int = 1000) -> dict:
+    if importlib.util.find_spec('gunicorn') is None:
+        return {'skipped': 'gunicorn is not installed'}
+    
+    with app.app_context():
+        seed_campaigns(rows)
+    
+    results = {'cpus': os.cpu_count(), 'threads': threads, 'clients': clients, 'rows': rows, 'path': PATH}
+    env = dict(os.environ, DATABASE_URL=app.config['SQLALCHEMY_DATABASE_URI'], CACHE_BACKEND='none', DEBUG='False')
+    runs = [('development', ['--mode', 'development'])]
+    runs += [(f'workers_{count}', ['--mode', 'production', '--workers', str(count), '--threads', str(threads)])
+             for count in workers]
+    for name, options in runs:
+        port = _free_port()
+        server = subprocess.Popen(
+            [sys.executable, 'run.py', '--host', '127.0.0.1', '--port', str(port), *options],
+            cwd=BACKEND_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        try:
+            _wait_ready(port)
+            results[name] = _load(port, clients, requests)
+        finally:
+            server.terminate()
+            server.wait(timeout=90)
+    
+    return results
@@ -0,0 +1,106 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from datetime import date, datetime, timedelta
+
+
+def timed(func, iterations: int = 1) -> dict:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    elapsed = time.perf_counter() - start
+    return {
+        'iterations': iterations,
+        'total_s': elapsed,
+        'per_op_ms': elapsed / iterations * 1000,
+        'ops_per_s': iterations / elapsed if elapsed else None,
+    }
+
+
+def make_app(database_url: str = None):
+    """Create the Flask app against the given database (a fresh SQLite file by default) with tables created."""
+    if database_url is None:
+        database_url = f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='pathik-bench-'), 'bench.db')}"
+    os.environ['DATABASE_URL'] = database_url
+    os.environ.setdefault('DEBUG', 'False')
+    os.environ.setdefault('CACHE_BACKEND', 'none')
+    
+    from app.core.config import Config
+    Config.SQLALCHEMY_DATABASE_URI = database_url
+    Config.DEBUG = os.environ['DEBUG'].lower() == 'true'
+    Config.CACHE_BACKEND = os.environ['CACHE_BACKEND']
+    
+    from app import create_app
+    from app.core import db
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+    return app
+
+
+def campaign_payload(index: int) -> dict:
+    return {
+        'name': f'Benchmark Campaign {index}',
+        'objective': 'Sales',
+        'campaign_type': 'Search',
+        'daily_budget': 5000000,
+        'start_date': date.today().isoformat(),
+        'end_date': (date.today() + timedelta(days=30)).isoformat(),
+        'ad_group_name': f'Ad Group {index}',
+        'ad_headline': 'Get 50% Off Today',
+        'ad_description': 'Limited time offer on all summer items. Shop now and save.',
+        'final_url': 'https://www.example.com/',
+        'asset_url': None,
+    }
+
+
+def campaign_row(index: int, status: str = 'DRAFT') -> dict:
+    now = datetime.utcnow()
+    row = campaign_payload(index)
+    row.update({
+        'id': uuid.uuid4(),
+        'status': status,
+        'start_date': date.today(),
+        'end_date': date.today() + timedelta(days=30),
+        'created_at': now - timedelta(seconds=index),
+        'updated_at': now,
+    })
+    return row
+
+
+def seed_campaigns(count: int, chunk_size: int = 10000) -> None:
+    """Bring the campaigns table up to count rows with bulk inserts (call inside an app context)."""
+    from app.core import db
+    from app.models import Campaign
+    
+    existing = db.session.query(db.func.count(Campaign.id)).scalar()
+    for start in range(existing, count, chunk_size):
+        rows = [campaign_row(index) for index in range(start, min(start + chunk_size, count))]
+        db.session.execute(db.insert(Campaign), rows)
+        db.session.commit()
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.check_output(['git', 'rev-parse', 'HEAD'], text=True, stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def emit(results: dict, output: str = None) -> None:
+    document = {
+        'revision': git_revision(),
+        'timestamp': datetime.utcnow().isoformat() + 'Z',
+        'python': sys.version.split()[0],
+        'results': results,
+    }
+    if output:
+        with open(output, 'w') as f:
+            json.dump(document, f, indent=2)
+    else:
+        json.dump(document, sys.stdout, indent=2)
+        sys.stdout.write('\n')
@@ -0,0 +1,172 @@
+"""In-process stand-in for GoogleAdsClient with configurable latency, error injection and search streams."""
+import itertools
+import random
+import threading
+import time
+from datetime import timedelta
+
+import grpc
+from google.ads.googleads.client import GoogleAdsClient
+from google.ads.googleads.errors import GoogleAdsException
+from google.auth.credentials import AnonymousCredentials
+from google.protobuf import any_pb2
+
+
+class FakeRpcError(grpc.RpcError):
+    def __init__(self, code: grpc.StatusCode):
+        self._code = code
+    
+    def code(self):
+        return self._code
+
+
+def _camel(snake: str) -> str:
+    return ''.join(part.title() for part in snake.split('_'))
+
+
+class FakeService:
+    def __init__(self, fake_client: 'FakeGoogleAdsClient', service_name: str):
+        self._fake = fake_client
+        self.service_name = service_name
+        base = service_name[:-len('Service')]
+        self._resource_segment = base[0].lower() + base[1:] + 's'
+    
+    def search_stream(self, request=None, customer_id=None, query=None):
+        if request is not None:
+            customer_id, query = request.customer_id, request.query
+        return self._fake._search_stream(customer_id, query)
+    
+    def __getattr__(self, method_name):
+        if not method_name.startswith('mutate_'):
+            raise AttributeError(method_name)
+        
+        def mutate(request=None, customer_id=None, operations=None):
+            partial_failure = False
+            if request is not None:
+                customer_id = request.customer_id
+                operations = list(request.operations)
+                partial_failure = request.partial_failure
+            return self._fake._mutate(self, method_name, customer_id, operations, partial_failure)
+        
+        return mutate
+
+
+class FakeGoogleAdsClient:
+    """Answers mutate calls locally, returning real response messages with generated resource names.
+    
+    latency: seconds slept per API call.
+    error_rate: probability that a call raises a GoogleAdsException with error_code.
+    retry_delay: seconds set as quota_error_details.retry_delay on injected errors (0 for none).
+    partial_failures: {method_name: {operation_index, ...}} failed as partial failures.
+    search_rows: rows returned by search_stream, as {'campaign.id': 1, 'metrics.clicks': 3, ...} dicts,
+        or a callable(customer_id, query) returning them. The query itself is not interpreted.
+    search_batch_size: rows per streamed response batch.
+    """
+    
+    def __init__(self, latency: float = 0.0, error_rate: float = 0.0,
+                 error_code: grpc.StatusCode = grpc.StatusCode.INTERNAL,
+                 retry_delay: float = 0.0, partial_failures: dict = None, seed: int = None,
+                 search_rows=None, search_batch_size: int = 10000):
+        self._types = GoogleAdsClient(
+            credentials=AnonymousCredentials(), developer_token='fake', use_proto_plus=True
+        )
+        self.enums = self._types.enums
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_code = error_code
+        self.retry_delay = retry_delay
+        self.partial_failures = partial_failures or {}
+        self.search_rows = search_rows or []
+        self.search_batch_size = search_batch_size
+        self.queries = []
+        self.calls = []
+        self._ids = itertools.count(1000)
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+    
+    def get_type(self, name, version=None):
+        return self._types.get_type(name)
+    
+    def get_service(self, name, version=None):
+        return FakeService(self, name)
+    
+    def make_exception(self, code: grpc.StatusCode, message: str = 'Injected error',
+                       retry_delay: float = 0.0) -> GoogleAdsException:
+        failure = self.get_type('GoogleAdsFailure')
+        error = type(failure).meta.fields['errors'].message()
+        error.message = message
+        if retry_delay:
+            error.details.quota_error_details.retry_delay = timedelta(seconds=retry_delay)
+        failure.errors.append(error)
+        return GoogleAdsException(FakeRpcError(code), None, failure, 'fake-request')
+    
+    def _mutate(self, service: FakeService, method_name: str, customer_id: str, operations: list, partial_failure: bool):
+        with self._lock:
+            self.calls.append((method_name, len(operations)))
+            should_fail = self.error_rate and self._random.random() < self.error_rate
+        if self.latency:
+            time.sleep(self.latency)
+        if should_fail:
+            raise self.make_exception(self.error_code, retry_delay=self.retry_delay)
+        
+        response = self.get_type(f'Mutate{_camel(method_name[len("mutate_"):])}Response')
+        result_type = type(response).meta.fields['results'].message
+        failed_indexes = self.partial_failures.get(method_name, set())
+        if failed_indexes and not partial_failure:
+            raise self.make_exception(grpc.StatusCode.INVALID_ARGUMENT, f'{method_name} rejected operation')
+        
+        for index, _ in enumerate(operations):
+            result = result_type()
+            if index not in failed_indexes:
+                result.resource_name = f'customers/{customer_id}/{service._resource_segment}/{next(self._ids)}'
+            response.results.append(result)
+        
+        if failed_indexes:
+            failure = self.get_type('GoogleAdsFailure')
+            for index in sorted(failed_indexes):
+                error = type(failure).meta.fields['errors'].message()
+                error.message = f'Injected partial failure at operation {index}'
+                element = type(error.location).meta.fields['field_path_elements'].message(
+                    field_name='operations', index=index
+                )
+                error.location.field_path_elements.append(element)
+                failure.errors.append(error)
+            response.partial_failure_error.code = grpc.StatusCode.INVALID_ARGUMENT.value[0]
+            response.partial_failure_error.details.append(
+                any_pb2.Any(value=type(failure).serialize(failure))
+            )
+        
+        return response
+    
+    def _make_row(self, values: dict):
+        row = self.get_type('GoogleAdsRow')
+        for path, value in values.items():
+            *parents, field = path.split('.')
+            target = row
+            for parent in parents:
+                target = getattr(target, parent)
+            setattr(target, field, value)
+        return row
+    
+    def _search_stream(self, customer_id: str, query: str):
+        with self._lock:
+            self.calls.append(('search_stream', 0))
+            self.queries.append(query)
+            should_fail = self.error_rate and self._random.random() < self.error_rate
+        if self.latency:
+            time.sleep(self.latency)
+        if should_fail:
+            raise self.make_exception(self.error_code, retry_delay=self.retry_delay)
+        
+        rows = self.search_rows(customer_id, query) if callable(self.search_rows) else self.search_rows
+        batch = self.get_type('SearchGoogleAdsStreamResponse')
+        for values in rows:
+            batch.results.append(self._make_row(values))
+            if len(batch.results) >= self.search_batch_size:
+                yield batch
+                batch = self.get_type('SearchGoogleAdsStreamResponse')
+        if batch.results:
+            yield batch
+    
+    def call_count(self, method_name: str = None) -> int:
+        return sum(1 for name, _ in self.calls if method_name is None or name == method_name)
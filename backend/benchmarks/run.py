@@ -0,0 +1,94 @@
+"""Run the benchmark suite and print machine-readable JSON.
+
+Run from backend/:
+    python -m benchmarks.run --rows 1000,100000,1000000 --output results.json
+    python -m benchmarks.run --only publish --latency 0.05 --error-rate 0.1
+    python -m benchmarks.run --only server --server-workers 1,2,4,8
+    python -m benchmarks.run --only assets --asset-images 32
+    python -m benchmarks.run --only locking --contenders 8
+    python -m benchmarks.run --only import_time --import-budget-ms 1000  # exits 1 when over budget
+"""
+import argparse
+
+from benchmarks import (
+    bench_assets, bench_campaign_service, bench_db_pool, bench_fan_out, bench_google_ads_client, bench_import_time,
+    bench_locking, bench_logging, bench_publish, bench_rate_limit, bench_reconcile, bench_reporting,
+    bench_serialization, bench_server
+)
+from benchmarks.common import emit, make_app
+
+SUITES = ('campaign_service', 'serialization', 'publish', 'google_ads_client', 'reporting', 'reconcile', 'rate_limit',
+          'fan_out', 'locking', 'logging', 'assets', 'server', 'db_pool', 'import_time')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--database-url', help='SQLAlchemy URL; defaults to a fresh SQLite file')
+    parser.add_argument('--rows', default='1000,100000,1000000', help='comma-separated table sizes for list benchmarks')
+    parser.add_argument('--serialize-rows', type=int, default=10000)
+    parser.add_argument('--publish-campaigns', type=int, default=50)
+    parser.add_argument('--report-campaigns', type=int, default=1000, help='published campaigns for the metrics sync')
+    parser.add_argument('--report-days', type=int, default=90, help='days of fake metrics per campaign')
+    parser.add_argument('--reconcile-campaigns', type=int, default=50000, help='published campaigns to reconcile')
+    parser.add_argument('--qps', type=float, default=20.0, help='per-customer QPS for the rate_limit suite')
+    parser.add_argument('--customers', type=int, default=8, help='Google Ads accounts for the fan_out suite')
+    parser.add_argument('--contenders', type=int, default=4,
+                        help='concurrent requests per campaign for the locking suite')
+    parser.add_argument('--asset-images', type=int, default=16, help='oversized images for the assets suite')
+    parser.add_argument('--server-workers', default='1,2,4', help='comma-separated worker counts for the server load test')
+    parser.add_argument('--server-clients', type=int, default=16, help='concurrent client processes for the server load test')
+    parser.add_argument('--import-budget-ms', type=float, default=1000.0,
+                        help='median cold-start import time allowed by the import_time suite')
+    parser.add_argument('--latency', type=float, default=0.0, help='fake Google Ads latency per call, in seconds')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of fake Google Ads calls that fail')
+    parser.add_argument('--only', action='append', choices=SUITES, help='run only the named suite (repeatable)')
+    parser.add_argument('--output', help='write JSON here instead of stdout')
+    args = parser.parse_args(argv)
+    
+    suites = args.only or SUITES
+    app = make_app(args.database_url)
+    results = {}
+    
+    if 'campaign_service' in suites:
+        rows = [int(size) for size in args.rows.split(',') if size]
+        results['campaign_service'] = bench_campaign_service.run(app, rows=rows)
+    if 'serialization' in suites:
+        results['serialization'] = bench_serialization.run(rows=args.serialize_rows)
+    if 'publish' in suites:
+        results['publish'] = bench_publish.run(
+            app, campaigns=args.publish_campaigns, latency=args.latency, error_rate=args.error_rate
+        )
+    if 'google_ads_client' in suites:
+        results['google_ads_client'] = bench_google_ads_client.run()
+    if 'reporting' in suites:
+        results['reporting'] = bench_reporting.run(app, campaigns=args.report_campaigns, days=args.report_days)
+    if 'reconcile' in suites:
+        results['reconcile'] = bench_reconcile.run(app, campaigns=args.reconcile_campaigns)
+    if 'rate_limit' in suites:
+        results['rate_limit'] = bench_rate_limit.run(
+            app, campaigns=args.publish_campaigns, qps=args.qps, error_rate=args.error_rate or 0.2
+        )
+    if 'fan_out' in suites:
+        results['fan_out'] = bench_fan_out.run(app, customers=args.customers, latency=args.latency or 0.02)
+    if 'locking' in suites:
+        results['locking'] = bench_locking.run(app, contenders=args.contenders, latency=args.latency or 0.02)
+    if 'logging' in suites:
+        results['logging'] = bench_logging.run()
+    if 'assets' in suites:
+        results['assets'] = bench_assets.run(images=args.asset_images)
+    if 'server' in suites:
+        workers = [int(count) for count in args.server_workers.split(',') if count]
+        results['server'] = bench_server.run(app, workers=workers, clients=args.server_clients)
+    if 'db_pool' in suites:
+        # Builds its own app against a primary and a replica database, so it runs last.
+        results['db_pool'] = bench_db_pool.run()
+    if 'import_time' in suites:
+        results['import_time'] = bench_import_time.run(budget_ms=args.import_budget_ms)
+    
+    emit(results, args.output)
+    if results.get('import_time', {}).get('within_budget') is False:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,18 +1,43 @@
 import os
+import argparse
 from app import create_app
+from app.core.server import default_workers, run_production
 
 
-def main():
-    app = create_app()
-    host = os.getenv('HOST', '0.0.0.0')
-    port = int(os.getenv('PORT', 8000))
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Pathik AI API server')
+    parser.add_argument('--mode', choices=['development', 'production'], default=os.getenv('SERVER_MODE', 'development'),
+                        help='development: Flask dev server; production: preforking gunicorn workers')
+    parser.add_argument('--host', default=os.getenv('HOST', '0.0.0.0'))
+    parser.add_argument('--port', type=int, default=int(os.getenv('PORT', 8000)))
+    parser.add_argument('--workers', type=int, default=int(os.getenv('WEB_WORKERS', default_workers())))
+    parser.add_argument('--threads', type=int, default=int(os.getenv('WEB_THREADS', 4)), help='threads per worker')
+    parser.add_argument('--timeout', type=int, default=int(os.getenv('WEB_TIMEOUT', 120)),
+                        help='seconds before a stuck worker is restarted')
+    parser.add_argument('--graceful-timeout', type=int, default=int(os.getenv('WEB_GRACEFUL_TIMEOUT', 60)),
+                        help='seconds workers get to finish in-flight work on shutdown')
+    parser.add_argument('--max-requests', type=int, default=int(os.getenv('WEB_MAX_REQUESTS', 0)),
+                        help='recycle a worker after this many requests (0 disables)')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
     
     print(f"\n{'='*50}")
-    print(f"Pathik AI API - http://localhost:{port}")
-    print(f"Health: http://localhost:{port}/api/v1/health")
+    print(f"Pathik AI API - http://localhost:{args.port} ({args.mode})")
+    print(f"Health: http://localhost:{args.port}/api/v1/health")
     print(f"{'='*50}\n")
     
-    app.run(host=host, port=port)
+    if args.mode == 'production':
+        run_production(
+            args.host, args.port, args.workers, args.threads,
+            args.timeout, args.graceful_timeout, args.max_requests
+        )
+        return
+    
+    app = create_app()
+    app.run(host=args.host, port=args.port)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,65 @@
+import pytest
+
+from app import create_app
+from app.core import db
+from app.core.config import Config
+from app.core.extensions import fan_out, job_queue
+from app.utils.google_ads_client import google_ads_client, google_ads_clients
+from benchmarks.common import campaign_payload
+from benchmarks.fake_google_ads import FakeGoogleAdsClient
+
+CUSTOMER_ID = '1234567890'
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    # Services read some settings from Config directly rather than app.config.
+    monkeypatch.setattr(Config, 'GOOGLE_ADS_CUSTOMER_ID', CUSTOMER_ID)
+    monkeypatch.setattr(Config, 'CACHE_BACKEND', 'none')
+    app = create_app(
+        SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'test.db'}",
+        CACHE_BACKEND='none',
+        GOOGLE_ADS_CUSTOMER_ID=CUSTOMER_ID,
+        TESTING=True
+    )
+    with app.app_context():
+        db.create_all()
+    yield app
+    job_queue.shutdown()
+    fan_out.shutdown()
+    with app.app_context():
+        db.engine.dispose()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def fake_ads():
+    fake = FakeGoogleAdsClient()
+    google_ads_clients.set_client(fake)
+    yield fake
+    google_ads_clients.set_client(None)
+
+
+@pytest.fixture
+def retry_sleeps(monkeypatch):
+    """Backoff delays the retry policy asked for, recorded instead of slept."""
+    sleeps = []
+    monkeypatch.setattr(google_ads_client.retry_policy, 'sleep', sleeps.append)
+    return sleeps
+
+
+@pytest.fixture
+def create_campaign(client):
+    """Create a draft through the API and return its id."""
+    counter = iter(range(10 ** 6))
+    
+    def create(**fields) -> str:
+        response = client.post('/api/v1/campaigns', json=dict(campaign_payload(next(counter)), **fields))
+        assert response.status_code == 201, response.get_json()
+        return response.get_json()['campaign']['id']
+    
+    return create
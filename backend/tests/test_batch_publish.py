@@ -0,0 +1,65 @@
+import uuid
+
+import grpc
+
+from app.core import db
+from app.models import Campaign
+
+OTHER_CUSTOMER_ID = '2222222222'
+
+
+def _campaign(app, campaign_id: str) -> Campaign:
+    with app.app_context():
+        return db.session.get(Campaign, uuid.UUID(campaign_id))
+
+
+def _publish_batch(client, campaign_ids: list) -> dict:
+    response = client.post('/api/v1/campaigns/publish-batch', json={'campaign_ids': campaign_ids})
+    assert response.status_code == 200, response.get_json()
+    return {result['id']: result for result in response.get_json()['results']}
+
+
+def test_accounts_publish_in_parallel_and_commit_on_request_thread(app, client, fake_ads, create_campaign):
+    ids = [create_campaign() for _ in range(3)] + [create_campaign(customer_id=OTHER_CUSTOMER_ID) for _ in range(2)]
+    
+    results = _publish_batch(client, ids)
+    
+    assert all(result['success'] for result in results.values()), results
+    assert fake_ads.call_count('mutate_campaign_budgets') == 2
+    for campaign_id in ids:
+        campaign = _campaign(app, campaign_id)
+        assert campaign.status == 'PUBLISHED'
+        assert campaign.ad_resource_name
+        assert campaign.google_campaign_id == campaign.campaign_resource_name.split('/')[-1]
+    assert _campaign(app, ids[-1]).customer_id == OTHER_CUSTOMER_ID
+
+
+def test_account_failing_outright_keeps_the_resources_it_created(app, client, fake_ads, create_campaign, monkeypatch):
+    failing_ids = [create_campaign(customer_id=OTHER_CUSTOMER_ID) for _ in range(2)]
+    ok_id = create_campaign()
+    
+    mutate = fake_ads._mutate
+    
+    def fail_other_account_campaigns(service, method_name, customer_id, operations, partial_failure):
+        if method_name == 'mutate_campaigns' and customer_id == OTHER_CUSTOMER_ID:
+            raise fake_ads.make_exception(grpc.StatusCode.INVALID_ARGUMENT, 'Campaigns rejected')
+        return mutate(service, method_name, customer_id, operations, partial_failure)
+    
+    monkeypatch.setattr(fake_ads, '_mutate', fail_other_account_campaigns)
+    results = _publish_batch(client, failing_ids + [ok_id])
+    
+    assert results[ok_id]['success']
+    for campaign_id in failing_ids:
+        assert not results[campaign_id]['success']
+        assert 'Campaigns rejected' in results[campaign_id]['error']
+        campaign = _campaign(app, campaign_id)
+        assert campaign.status == 'DRAFT'
+        assert campaign.budget_resource_name
+        assert campaign.campaign_resource_name is None
+    
+    # The retry reuses the committed budgets instead of creating new ones.
+    monkeypatch.setattr(fake_ads, '_mutate', mutate)
+    budgets_before = fake_ads.call_count('mutate_campaign_budgets')
+    results = _publish_batch(client, failing_ids)
+    assert all(result['success'] for result in results.values()), results
+    assert fake_ads.call_count('mutate_campaign_budgets') == budgets_before
@@ -0,0 +1,103 @@
+import csv
+import io
+import json
+
+from app.constants import BulkImport
+from app.core import db
+from app.models import Campaign
+from app.services import CampaignService
+from benchmarks.common import campaign_payload
+from tests.conftest import CUSTOMER_ID
+
+
+def _csv(rows: list) -> bytes:
+    out = io.StringIO()
+    writer = csv.DictWriter(out, fieldnames=list(campaign_payload(0)))
+    writer.writeheader()
+    writer.writerows(rows)
+    return out.getvalue().encode()
+
+
+def _ndjson(lines: list) -> bytes:
+    return '\n'.join(line if isinstance(line, str) else json.dumps(line) for line in lines).encode()
+
+
+def _campaign_names(app) -> list:
+    with app.app_context():
+        return sorted(db.session.scalars(db.select(Campaign.name)))
+
+
+def test_csv_rejects_invalid_rows_by_line_number(app, client):
+    rows = [campaign_payload(0), dict(campaign_payload(1), daily_budget='-5'), campaign_payload(2),
+            dict(campaign_payload(3), name='')]
+    
+    response = client.post('/api/v1/campaigns/bulk', data=_csv(rows), content_type='text/csv')
+    
+    assert response.status_code == 200
+    body = response.get_json()
+    assert (body['imported'], body['failed'], body['errors_truncated']) == (2, 2, False)
+    # The header is line 1, so the second and fourth records are lines 3 and 5.
+    assert [error['row'] for error in body['errors']] == [3, 5]
+    assert 'daily_budget' in body['errors'][0]['messages']
+    assert 'name' in body['errors'][1]['messages']
+    assert _campaign_names(app) == ['Benchmark Campaign 0', 'Benchmark Campaign 2']
+    with app.app_context():
+        assert set(db.session.scalars(db.select(Campaign.status))) == {'DRAFT'}
+        assert set(db.session.scalars(db.select(Campaign.customer_id))) == {CUSTOMER_ID}
+
+
+def test_csv_row_with_extra_values_is_rejected(client):
+    body = _csv([campaign_payload(0)]) + b'too,many,values,' + b','.join([b'x'] * 12) + b'\r\n'
+    
+    summary = client.post('/api/v1/campaigns/bulk', data=body, content_type='text/csv').get_json()
+    
+    assert (summary['imported'], summary['failed']) == (1, 1)
+    assert summary['errors'] == [{'row': 3, 'messages': {'_schema': ['Row has more values than the header']}}]
+
+
+def test_ndjson_reports_unparsable_lines_and_skips_blank_ones(app, client):
+    lines = [campaign_payload(0), '{not json', '', dict(campaign_payload(1), start_date='soon'), campaign_payload(2)]
+    
+    response = client.post('/api/v1/campaigns/bulk', data=_ndjson(lines), content_type='application/x-ndjson')
+    
+    body = response.get_json()
+    assert (body['imported'], body['failed']) == (2, 2)
+    assert [error['row'] for error in body['errors']] == [2, 4]
+    assert body['errors'][0]['messages']['_schema'][0].startswith('Invalid JSON')
+    assert 'start_date' in body['errors'][1]['messages']
+    assert _campaign_names(app) == ['Benchmark Campaign 0', 'Benchmark Campaign 2']
+
+
+def test_invalid_rows_are_counted_past_the_reported_error_cap(app, client, monkeypatch):
+    monkeypatch.setattr(BulkImport, 'MAX_REPORTED_ERRORS', 3)
+    lines = ['{bad'] * 5 + [campaign_payload(0)]
+    
+    body = client.post('/api/v1/campaigns/bulk', data=_ndjson(lines), content_type='application/x-ndjson').get_json()
+    
+    assert (body['imported'], body['failed'], body['errors_truncated']) == (1, 5, True)
+    assert [error['row'] for error in body['errors']] == [1, 2, 3]
+
+
+def test_rows_are_validated_across_chunks(app):
+    records = [(index + 2, campaign_payload(index)) for index in range(5)]
+    records[3][1]['daily_budget'] = 1
+    
+    with app.app_context():
+        summary = CampaignService.bulk_import(iter(records), chunk_size=2)
+    
+    assert (summary['imported'], summary['failed']) == (4, 1)
+    assert summary['errors'][0]['row'] == 5
+    assert len(_campaign_names(app)) == 4
+
+
+def test_unsupported_content_type_is_rejected(client):
+    response = client.post('/api/v1/campaigns/bulk', json=[campaign_payload(0)])
+    
+    assert response.status_code == 415
+
+
+def test_body_that_is_not_utf8_is_rejected(app, client):
+    response = client.post('/api/v1/campaigns/bulk', data=b'name\n\xff\xfe\n', content_type='text/csv')
+    
+    assert response.status_code == 400
+    assert _campaign_names(app) == []
@@ -0,0 +1,99 @@
+import threading
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.core import db
+from app.core.config import Config
+from app.models import Campaign
+
+CONTENDERS = 5
+
+
+@pytest.fixture(autouse=True)
+def locking(monkeypatch):
+    monkeypatch.setattr(Config, 'CAMPAIGN_LOCKING', True)
+
+
+@pytest.fixture
+def slow_ads(fake_ads):
+    # Long enough that every contender reaches the lock while the first request is still calling Google Ads.
+    fake_ads.latency = 0.1
+    return fake_ads
+
+
+def _contend(app, method: str, path: str) -> Counter:
+    statuses = Counter()
+    barrier = threading.Barrier(CONTENDERS)
+    
+    def send():
+        client = app.test_client()
+        barrier.wait()
+        statuses[getattr(client, method)(path).status_code] += 1
+    
+    threads = [threading.Thread(target=send) for _ in range(CONTENDERS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return statuses
+
+
+def _set_lock(app, campaign_id: str, locked_until: datetime):
+    with app.app_context():
+        campaign = db.session.get(Campaign, uuid.UUID(campaign_id))
+        campaign.lock_token = uuid.uuid4().hex
+        campaign.lock_operation = 'PUBLISH'
+        campaign.locked_until = locked_until
+        db.session.commit()
+
+
+def test_concurrent_publishes_do_the_work_once(app, slow_ads, create_campaign):
+    campaign_id = create_campaign()
+    
+    statuses = _contend(app, 'post', f'/api/v1/campaigns/{campaign_id}/publish')
+    
+    assert statuses == Counter({200: 1, 409: CONTENDERS - 1})
+    assert slow_ads.call_count('mutate_campaign_budgets') == 1
+    assert slow_ads.call_count('mutate_campaigns') == 1
+    with app.app_context():
+        assert db.session.get(Campaign, uuid.UUID(campaign_id)).lock_token is None
+
+
+def test_concurrent_enables_do_the_work_once(app, client, slow_ads, create_campaign):
+    campaign_id = create_campaign()
+    assert client.post(f'/api/v1/campaigns/{campaign_id}/publish').status_code == 200
+    campaign_mutates = slow_ads.call_count('mutate_campaigns')
+    
+    statuses = _contend(app, 'put', f'/api/v1/campaigns/{campaign_id}/enable')
+    
+    assert statuses == Counter({200: 1, 409: CONTENDERS - 1})
+    assert slow_ads.call_count('mutate_campaigns') == campaign_mutates + 1
+
+
+def test_held_lock_rejects_publish(app, client, fake_ads, create_campaign):
+    campaign_id = create_campaign()
+    _set_lock(app, campaign_id, datetime.utcnow() + timedelta(seconds=Config.CAMPAIGN_LOCK_TTL))
+    
+    response = client.post(f'/api/v1/campaigns/{campaign_id}/publish')
+    
+    assert response.status_code == 409
+    assert fake_ads.call_count() == 0
+
+
+def test_expired_lock_is_taken_over(app, client, fake_ads, create_campaign, monkeypatch):
+    monkeypatch.setattr(Config, 'CAMPAIGN_LOCK_TTL', 60)
+    campaign_id = create_campaign()
+    # Left behind by a process that died mid-publish more than CAMPAIGN_LOCK_TTL ago.
+    _set_lock(app, campaign_id, datetime.utcnow() - timedelta(seconds=1))
+    
+    response = client.post(f'/api/v1/campaigns/{campaign_id}/publish')
+    
+    assert response.status_code == 200, response.get_json()
+    assert fake_ads.call_count('mutate_campaigns') == 1
+    with app.app_context():
+        campaign = db.session.get(Campaign, uuid.UUID(campaign_id))
+        assert campaign.lock_token is None
+        assert campaign.status == 'PUBLISHED'
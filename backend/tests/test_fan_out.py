@@ -0,0 +1,138 @@
+import threading
+import uuid
+
+import grpc
+import pytest
+
+from app.core import db
+from app.core.config import Config
+from app.core.extensions import fan_out
+from app.models import Campaign
+from benchmarks.common import campaign_row
+from tests.conftest import CUSTOMER_ID
+
+OTHER_CUSTOMER_ID = '2222222222'
+
+
+@pytest.fixture
+def published(app):
+    """Two published campaigns in each of two accounts, keyed by account."""
+    rows = [
+        dict(campaign_row(index, status='PUBLISHED'), google_campaign_id=str(100 + index), customer_id=customer_id)
+        for index, customer_id in enumerate([CUSTOMER_ID, CUSTOMER_ID, OTHER_CUSTOMER_ID, OTHER_CUSTOMER_ID])
+    ]
+    with app.app_context():
+        db.session.execute(db.insert(Campaign), rows)
+        db.session.commit()
+    by_customer = {}
+    for row in rows:
+        by_customer.setdefault(row['customer_id'], []).append(str(row['id']))
+    return by_customer
+
+
+def _statuses(app, campaign_ids: list) -> list:
+    with app.app_context():
+        return [db.session.get(Campaign, uuid.UUID(campaign_id)).status for campaign_id in campaign_ids]
+
+
+def test_map_runs_groups_on_the_pool_and_keeps_errors_per_group(app):
+    def work(key, items):
+        if key == 'bad':
+            raise ValueError('bad account')
+        return key, sum(items), threading.current_thread().name
+    
+    with app.app_context():
+        outcomes = fan_out.map(work, {'a': [1, 2], 'b': [3], 'bad': [4]})
+    
+    assert outcomes['a'][0][:2] == ('a', 3) and outcomes['a'][1] is None
+    assert outcomes['b'][0][:2] == ('b', 3)
+    assert outcomes['bad'][0] is None and str(outcomes['bad'][1]) == 'bad account'
+    assert all(result[2].startswith('fan-out') for result, _ in (outcomes['a'], outcomes['b']))
+
+
+def test_single_group_runs_inline(app):
+    with app.app_context():
+        outcomes = fan_out.map(lambda key, items: threading.current_thread().name, {'only': []})
+    assert outcomes['only'] == (threading.current_thread().name, None)
+
+
+def test_bulk_status_failure_is_confined_to_its_account(app, client, fake_ads, published, monkeypatch):
+    mutate = fake_ads._mutate
+    
+    def fail_other_account(service, method_name, customer_id, operations, partial_failure):
+        if customer_id == OTHER_CUSTOMER_ID:
+            raise fake_ads.make_exception(grpc.StatusCode.PERMISSION_DENIED, 'No access to account')
+        return mutate(service, method_name, customer_id, operations, partial_failure)
+    
+    monkeypatch.setattr(fake_ads, '_mutate', fail_other_account)
+    ids = published[CUSTOMER_ID] + published[OTHER_CUSTOMER_ID]
+    
+    response = client.put('/api/v1/campaigns/status', json={'campaign_ids': ids, 'status': 'ENABLED'})
+    
+    assert response.status_code == 200
+    results = {result['id']: result for result in response.get_json()['results']}
+    assert all(results[campaign_id]['success'] for campaign_id in published[CUSTOMER_ID])
+    for campaign_id in published[OTHER_CUSTOMER_ID]:
+        assert not results[campaign_id]['success']
+        assert 'No access to account' in results[campaign_id]['error']
+    assert _statuses(app, published[CUSTOMER_ID]) == ['ENABLED', 'ENABLED']
+    assert _statuses(app, published[OTHER_CUSTOMER_ID]) == ['PUBLISHED', 'PUBLISHED']
+
+
+def test_reconcile_reports_a_failing_account_and_applies_the_others(app, client, fake_ads, published):
+    def statuses(customer_id, query):
+        if customer_id == OTHER_CUSTOMER_ID:
+            raise fake_ads.make_exception(grpc.StatusCode.PERMISSION_DENIED, 'No access to account')
+        return [{'campaign.id': 100, 'campaign.status': fake_ads.enums.CampaignStatusEnum.ENABLED},
+                {'campaign.id': 101, 'campaign.status': fake_ads.enums.CampaignStatusEnum.REMOVED}]
+    
+    fake_ads.search_rows = statuses
+    
+    response = client.post('/api/v1/campaigns/reconcile')
+    
+    assert response.status_code == 200
+    summary = response.get_json()
+    assert summary['customers'] == 2
+    assert summary['updated'] == 2
+    assert list(summary['errors']) == [OTHER_CUSTOMER_ID]
+    assert 'No access to account' in summary['errors'][OTHER_CUSTOMER_ID]
+    assert _statuses(app, published[CUSTOMER_ID]) == ['ENABLED', 'REMOVED']
+    assert _statuses(app, published[OTHER_CUSTOMER_ID]) == ['PUBLISHED', 'PUBLISHED']
+
+
+def test_reconcile_fails_when_every_account_fails(client, fake_ads, published):
+    def statuses(customer_id, query):
+        raise fake_ads.make_exception(grpc.StatusCode.PERMISSION_DENIED, 'No access to account')
+    
+    fake_ads.search_rows = statuses
+    
+    response = client.post('/api/v1/campaigns/reconcile')
+    
+    assert response.status_code == 500
+    assert 'No access to account' in response.get_json()['error']
+
+
+def test_dashed_default_customer_id_groups_legacy_campaigns_with_new_ones(app, client, fake_ads, monkeypatch):
+    monkeypatch.setattr(Config, 'GOOGLE_ADS_CUSTOMER_ID', '123-456-7890')
+    rows = [dict(campaign_row(index, status='PUBLISHED'), google_campaign_id=str(100 + index), customer_id=customer_id)
+            for index, customer_id in enumerate([None, CUSTOMER_ID])]
+    draft = dict(campaign_row(2), customer_id=None)
+    with app.app_context():
+        db.session.execute(db.insert(Campaign), rows + [draft])
+        db.session.commit()
+    customers = []
+    
+    def statuses(customer_id, query):
+        customers.append(customer_id)
+        return [{'campaign.id': 100, 'campaign.status': fake_ads.enums.CampaignStatusEnum.ENABLED}]
+    
+    fake_ads.search_rows = statuses
+    
+    summary = client.post('/api/v1/campaigns/reconcile').get_json()
+    assert (summary['customers'], summary['checked'], summary['updated']) == (1, 2, 1)
+    assert customers == [CUSTOMER_ID]
+    
+    response = client.post('/api/v1/campaigns/publish-batch', json={'campaign_ids': [str(draft['id'])]})
+    assert response.get_json()['published'] == 1
+    with app.app_context():
+        assert db.session.get(Campaign, draft['id']).customer_id == CUSTOMER_ID
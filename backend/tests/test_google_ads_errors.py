@@ -0,0 +1,104 @@
+import uuid
+
+import grpc
+import pytest
+
+from app.core import db
+from app.models import Campaign
+from app.utils.google_ads_client import google_ads_client
+
+
+def _fail_first_calls(fake, monkeypatch, method_name: str, failures: int, code: grpc.StatusCode,
+                      retry_delay: float = 0.0):
+    mutate = fake._mutate
+    remaining = [failures]
+    
+    def flaky(service, name, customer_id, operations, partial_failure):
+        if name == method_name and remaining[0]:
+            remaining[0] -= 1
+            fake.calls.append((name, len(operations)))
+            raise fake.make_exception(code, retry_delay=retry_delay)
+        return mutate(service, name, customer_id, operations, partial_failure)
+    
+    monkeypatch.setattr(fake, '_mutate', flaky)
+
+
+def _publish_batch(client, campaign_ids: list) -> dict:
+    response = client.post('/api/v1/campaigns/publish-batch', json={'campaign_ids': campaign_ids})
+    assert response.status_code == 200, response.get_json()
+    return {result['id']: result for result in response.get_json()['results']}
+
+
+def test_transient_errors_are_retried_with_the_server_hint(client, fake_ads, create_campaign, retry_sleeps,
+                                                           monkeypatch):
+    campaign_id = create_campaign()
+    _fail_first_calls(fake_ads, monkeypatch, 'mutate_campaign_budgets', 2, grpc.StatusCode.RESOURCE_EXHAUSTED,
+                      retry_delay=1.5)
+    
+    response = client.post(f'/api/v1/campaigns/{campaign_id}/publish')
+    
+    assert response.status_code == 200, response.get_json()
+    assert fake_ads.call_count('mutate_campaign_budgets') == 3
+    assert len(retry_sleeps) == 2
+    assert all(delay >= 1.5 for delay in retry_sleeps)
+
+
+def test_non_retryable_errors_fail_without_retrying(client, fake_ads, create_campaign, retry_sleeps, monkeypatch):
+    campaign_id = create_campaign()
+    _fail_first_calls(fake_ads, monkeypatch, 'mutate_campaign_budgets', 1, grpc.StatusCode.INVALID_ARGUMENT)
+    
+    response = client.post(f'/api/v1/campaigns/{campaign_id}/publish')
+    
+    assert response.status_code == 500
+    assert 'INVALID_ARGUMENT' in response.get_json()['error']
+    assert fake_ads.call_count('mutate_campaign_budgets') == 1
+    assert retry_sleeps == []
+
+
+def test_retries_stop_at_max_retries(client, fake_ads, create_campaign, retry_sleeps, monkeypatch):
+    monkeypatch.setattr(google_ads_client.retry_policy, 'max_retries', 3)
+    campaign_id = create_campaign()
+    _fail_first_calls(fake_ads, monkeypatch, 'mutate_campaign_budgets', 10, grpc.StatusCode.UNAVAILABLE)
+    
+    response = client.post(f'/api/v1/campaigns/{campaign_id}/publish')
+    
+    assert response.status_code == 500
+    assert fake_ads.call_count('mutate_campaign_budgets') == 4
+    assert len(retry_sleeps) == 3
+
+
+@pytest.mark.parametrize('method_name, error', [
+    ('mutate_campaign_budgets', 'Budget creation failed'),
+    ('mutate_campaigns', 'Campaign creation failed'),
+])
+def test_partial_failure_fails_only_that_campaign(app, client, fake_ads, create_campaign, method_name, error):
+    ids = [create_campaign() for _ in range(3)]
+    fake_ads.partial_failures = {method_name: {1}}
+    
+    results = _publish_batch(client, ids)
+    
+    assert [results[campaign_id]['success'] for campaign_id in ids] == [True, False, True]
+    assert results[ids[1]]['error'].startswith(error)
+    assert fake_ads.call_count(method_name) == 1
+    
+    # Publishing the failed campaign again only sends the steps it is missing.
+    fake_ads.partial_failures = {}
+    budgets_before = fake_ads.call_count('mutate_campaign_budgets')
+    results = _publish_batch(client, [ids[1]])
+    assert results[ids[1]]['success'], results
+    expected_budget_calls = 1 if method_name == 'mutate_campaign_budgets' else 0
+    assert fake_ads.call_count('mutate_campaign_budgets') - budgets_before == expected_budget_calls
+
+
+def test_partial_ad_group_failure_publishes_with_a_warning(app, client, fake_ads, create_campaign):
+    ids = [create_campaign() for _ in range(2)]
+    fake_ads.partial_failures = {'mutate_ad_groups': {0}}
+    
+    results = _publish_batch(client, ids)
+    
+    assert all(result['success'] for result in results.values())
+    assert results[ids[0]]['warnings'][0].startswith('Ad Group/Ad creation failed')
+    assert not results[ids[1]]['warnings']
+    with app.app_context():
+        campaign = db.session.get(Campaign, uuid.UUID(ids[0]))
+        assert campaign.campaign_resource_name and campaign.ad_group_resource_name is None
@@ -0,0 +1,99 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.core import db
+from app.models import Campaign
+from benchmarks.common import campaign_row
+
+
+def _seed(app, count: int, created_at=None, **fields) -> list:
+    rows = [dict(campaign_row(index), **fields) for index in range(count)]
+    if created_at is not None:
+        for row in rows:
+            row['created_at'] = created_at
+    with app.app_context():
+        db.session.execute(db.insert(Campaign), rows)
+        db.session.commit()
+    return [str(row['id']) for row in rows]
+
+
+def _walk(client, query: str = '') -> list:
+    """Follow next_cursor to the end; returns the ids of every page in order."""
+    pages = []
+    cursor = None
+    while True:
+        url = f'/api/v1/campaigns?{query}' + (f'&cursor={cursor}' if cursor else '')
+        response = client.get(url)
+        assert response.status_code == 200, response.get_json()
+        body = response.get_json()
+        pages.append([campaign['id'] for campaign in body['campaigns']])
+        cursor = body['next_cursor']
+        if cursor is None:
+            return pages
+
+
+def test_pages_cover_every_campaign_once_in_order(app, client):
+    ids = _seed(app, 7)
+    
+    pages = _walk(client, 'limit=3')
+    
+    assert [len(page) for page in pages] == [3, 3, 1]
+    # campaign_row makes each row a second older than the previous one.
+    assert [campaign_id for page in pages for campaign_id in page] == ids
+
+
+def test_last_full_page_has_no_cursor(app, client):
+    _seed(app, 6)
+    
+    assert [len(page) for page in _walk(client, 'limit=3')] == [3, 3]
+
+
+def test_equal_created_at_is_broken_by_id(app, client):
+    ids = _seed(app, 5, created_at=datetime(2026, 1, 1, 12, 0, 0))
+    
+    pages = _walk(client, 'limit=2')
+    
+    walked = [campaign_id for page in pages for campaign_id in page]
+    assert sorted(walked) == sorted(ids)
+    assert len(set(walked)) == len(ids)
+    with app.app_context():
+        expected = [str(campaign.id) for campaign in Campaign.query.order_by(Campaign.id.desc())]
+    assert walked == expected
+
+
+def test_rows_created_after_the_first_page_do_not_shift_later_pages(app, client):
+    ids = _seed(app, 4)
+    first = client.get('/api/v1/campaigns?limit=2').get_json()
+    
+    _seed(app, 2, created_at=datetime.utcnow() + timedelta(minutes=1))
+    second = client.get(f"/api/v1/campaigns?limit=2&cursor={first['next_cursor']}").get_json()
+    
+    assert [campaign['id'] for campaign in first['campaigns'] + second['campaigns']] == ids
+
+
+def test_cursor_combines_with_filters(app, client):
+    _seed(app, 3, status='DRAFT')
+    enabled = _seed(app, 3, status='ENABLED')
+    
+    pages = _walk(client, 'status=ENABLED&limit=2')
+    
+    assert sorted(campaign_id for page in pages for campaign_id in page) == sorted(enabled)
+
+
+@pytest.mark.parametrize('limit, expected', [('0', 1), ('-5', 1), ('100000', 3)])
+def test_limit_is_clamped(app, client, limit, expected):
+    _seed(app, 3)
+    
+    response = client.get(f'/api/v1/campaigns?limit={limit}')
+    
+    assert response.status_code == 200
+    assert response.get_json()['count'] == expected
+
+
+@pytest.mark.parametrize('cursor', ['not-a-cursor', 'WyJub3QtYS1kYXRlIiwieCJd', 'e30'])
+def test_invalid_cursor_is_rejected(client, cursor):
+    response = client.get(f'/api/v1/campaigns?cursor={cursor}')
+    
+    assert response.status_code == 400
+    assert response.get_json()['error'] == 'Invalid cursor'
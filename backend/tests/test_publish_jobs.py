@@ -0,0 +1,70 @@
+import time
+
+import grpc
+
+from app.constants import JobStatus
+
+
+def _wait_for_job(client, job_url: str, timeout: float = 10.0) -> dict:
+    deadline = time.monotonic() + timeout
+    while True:
+        job = client.get(job_url).get_json()
+        if job['status'] not in JobStatus.active() or time.monotonic() > deadline:
+            return job
+        time.sleep(0.05)
+
+
+def test_async_publish_runs_the_job(client, fake_ads, create_campaign):
+    campaign_id = create_campaign()
+    
+    response = client.post(f'/api/v1/campaigns/{campaign_id}/publish?async=true')
+    assert response.status_code == 202
+    assert response.get_json()['job']['status'] == JobStatus.QUEUED
+    
+    job = _wait_for_job(client, response.headers['Location'])
+    assert job['status'] == JobStatus.SUCCEEDED, job
+    assert job['error'] is None
+    assert job['campaign_id'] == campaign_id
+    assert job['progress'] == {'completed_steps': ['budget', 'campaign', 'ad_group', 'ad'], 'remaining_steps': []}
+    
+    campaign = client.get(f'/api/v1/campaigns/{campaign_id}').get_json()
+    assert campaign['status'] == 'PUBLISHED'
+    assert campaign['google_campaign_id']
+    assert fake_ads.call_count('mutate_campaigns') == 1
+
+
+def test_job_reports_the_steps_left_after_an_ad_group_failure(client, fake_ads, create_campaign, monkeypatch):
+    mutate = fake_ads._mutate
+    
+    def fail_ad_groups(service, method_name, customer_id, operations, partial_failure):
+        if method_name == 'mutate_ad_groups':
+            fake_ads.calls.append((method_name, len(operations)))
+            raise fake_ads.make_exception(grpc.StatusCode.INVALID_ARGUMENT, 'Ad group rejected')
+        return mutate(service, method_name, customer_id, operations, partial_failure)
+    
+    monkeypatch.setattr(fake_ads, '_mutate', fail_ad_groups)
+    campaign_id = create_campaign()
+    
+    response = client.post(f'/api/v1/campaigns/{campaign_id}/publish?async=true')
+    assert response.get_json()['job']['progress'] == {
+        'completed_steps': [], 'remaining_steps': ['budget', 'campaign', 'ad_group', 'ad']
+    }
+    
+    job = _wait_for_job(client, response.headers['Location'])
+    # Ad group and ad failures leave a published campaign with a warning; progress shows what a retry would finish.
+    assert job['status'] == JobStatus.SUCCEEDED
+    assert 'Ad group rejected' in job['warnings'][0]
+    assert job['progress'] == {'completed_steps': ['budget', 'campaign'], 'remaining_steps': ['ad_group', 'ad']}
+
+
+def test_async_publish_of_published_campaign_is_rejected(client, fake_ads, create_campaign):
+    campaign_id = create_campaign()
+    assert client.post(f'/api/v1/campaigns/{campaign_id}/publish').status_code == 200
+    
+    response = client.post(f'/api/v1/campaigns/{campaign_id}/publish?async=true')
+    assert response.status_code == 400
+    assert response.get_json()['error'] == 'Campaign already published'
+
+
+def test_unknown_job_is_404(client):
+    assert client.get('/api/v1/jobs/00000000-0000-0000-0000-000000000000').status_code == 404
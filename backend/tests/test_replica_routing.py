@@ -0,0 +1,109 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from app import create_app
+from app.core import db
+from app.core.config import Config
+from app.core.database import REPLICA_BIND
+from app.models import Campaign
+from benchmarks.common import campaign_payload, campaign_row
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def _make_app(tmp_path, cache_backend: str):
+    app = create_app(
+        SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'primary.db'}",
+        SQLALCHEMY_BINDS={REPLICA_BIND: dict(
+            Config.SQLALCHEMY_ENGINE_OPTIONS, url=f"sqlite:///{tmp_path / 'replica.db'}", pool_logging_name=REPLICA_BIND
+        )},
+        CACHE_BACKEND=cache_backend
+    )
+    with app.app_context():
+        db.create_all()
+        db.metadata.create_all(db.engines[REPLICA_BIND])
+    return app
+
+
+def _seed(app, engine_key, index: int) -> str:
+    """Insert a campaign into one database only, so a read shows which database served it."""
+    row = campaign_row(index)
+    with app.app_context():
+        with db.engines[engine_key].begin() as connection:
+            connection.execute(db.insert(Campaign), [row])
+    return str(row['id'])
+
+
+@pytest.fixture
+def databases(tmp_path, request):
+    app = _make_app(tmp_path, request.param)
+    yield app, _seed(app, None, 0), _seed(app, REPLICA_BIND, 1)
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose()
+    # init_app registers a metadata per bind on the shared db; later apps have no replica to create it on.
+    db.metadatas.pop(REPLICA_BIND, None)
+
+
+def _listed_ids(client) -> set:
+    response = client.get('/api/v1/campaigns')
+    assert response.status_code == 200
+    return {campaign['id'] for campaign in response.get_json()['campaigns']}
+
+
+@pytest.mark.parametrize('databases', ['none'], indirect=True)
+def test_reads_go_to_the_replica_without_a_cache(databases):
+    app, primary_id, replica_id = databases
+    client = app.test_client()
+    
+    assert _listed_ids(client) == {replica_id}
+    assert client.get(f'/api/v1/campaigns/{replica_id}').status_code == 200
+    assert client.get(f'/api/v1/campaigns/{primary_id}').status_code == 404
+    export = client.get('/api/v1/campaigns/export').get_data(as_text=True)
+    assert replica_id in export and primary_id not in export
+
+
+@pytest.mark.parametrize('databases', ['memory'], indirect=True)
+def test_cache_is_filled_from_the_primary(databases):
+    app, primary_id, replica_id = databases
+    client = app.test_client()
+    
+    assert _listed_ids(client) == {primary_id}
+    assert client.get(f'/api/v1/campaigns/{primary_id}').status_code == 200
+    # Export is never cached, so it still streams from the replica.
+    assert replica_id in client.get('/api/v1/campaigns/export').get_data(as_text=True)
+
+
+@pytest.mark.parametrize('databases', ['none'], indirect=True)
+def test_writes_go_to_the_primary(databases):
+    app, primary_id, replica_id = databases
+    client = app.test_client()
+    
+    response = client.post('/api/v1/campaigns', json=campaign_payload(2))
+    assert response.status_code == 201
+    created_id = response.get_json()['campaign']['id']
+    
+    with app.app_context():
+        for engine_key, expected in ((None, {primary_id, created_id}), (REPLICA_BIND, {replica_id})):
+            with db.engines[engine_key].connect() as connection:
+                ids = {str(row.id) for row in connection.execute(db.select(Campaign.id))}
+            assert ids == expected
+
+
+def test_replica_bind_copies_the_engine_options():
+    # Config reads the environment at import, so check it in a fresh interpreter.
+    code = 'import json; from app.core.config import Config; print(json.dumps(Config.SQLALCHEMY_BINDS))'
+    env = dict(os.environ, DATABASE_REPLICA_URL='postgresql://replica/db', DB_POOL_SIZE='7')
+    output = subprocess.run([sys.executable, '-c', code], env=env, cwd=BACKEND_DIR, capture_output=True,
+                            text=True, check=True).stdout
+    
+    replica = json.loads(output)[REPLICA_BIND]
+    assert replica['url'] == 'postgresql://replica/db'
+    assert replica['pool_size'] == 7
+    assert replica['pool_logging_name'] == REPLICA_BIND
+    assert set(replica) == set(Config.SQLALCHEMY_ENGINE_OPTIONS) | {'url'}
@@ -0,0 +1,110 @@
+import re
+from datetime import date, timedelta
+
+import pytest
+
+from app.constants import Reporting
+from app.core import db
+from app.models import Campaign, CampaignDailyMetric, CampaignMetricsRollup, DailyMetricsRollup, MetricsSyncState
+from app.services import ReportingService
+from benchmarks.common import campaign_row
+from tests.conftest import CUSTOMER_ID
+
+TODAY = date(2026, 6, 30)
+WINDOW = re.compile(r"BETWEEN '([\d-]+)' AND '([\d-]+)'")
+
+
+class AdsMetrics:
+    """Daily clicks per (google campaign id, day) as Google Ads currently reports them."""
+    
+    def __init__(self):
+        self.clicks = {}
+    
+    def rows(self, customer_id, query):
+        date_from, date_to = (date.fromisoformat(value) for value in WINDOW.search(query).groups())
+        return [
+            {'campaign.id': int(google_id), 'segments.date': day.isoformat(), 'metrics.impressions': clicks * 10,
+             'metrics.clicks': clicks, 'metrics.cost_micros': clicks * 1000, 'metrics.conversions': 0.0}
+            for (google_id, day), clicks in sorted(self.clicks.items()) if date_from <= day <= date_to
+        ]
+
+
+@pytest.fixture
+def ads_metrics(fake_ads):
+    metrics = AdsMetrics()
+    fake_ads.search_rows = metrics.rows
+    return metrics
+
+
+@pytest.fixture
+def campaigns(app):
+    with app.app_context():
+        rows = [dict(campaign_row(index, status='ENABLED'), google_campaign_id=str(100 + index),
+                     customer_id=CUSTOMER_ID) for index in range(2)]
+        db.session.execute(db.insert(Campaign), rows)
+        db.session.commit()
+    return {row['google_campaign_id']: row['id'] for row in rows}
+
+
+def _daily_clicks() -> dict:
+    return {(metric.campaign_id, metric.date): metric.clicks for metric in CampaignDailyMetric.query.all()}
+
+
+def _queried_window(fake_ads) -> tuple:
+    return tuple(date.fromisoformat(value) for value in WINDOW.search(fake_ads.queries[-1]).groups())
+
+
+def test_first_sync_fetches_the_initial_window(app, fake_ads, ads_metrics, campaigns):
+    ads_metrics.clicks = {('100', TODAY): 5, ('101', TODAY - timedelta(days=1)): 7, ('999', TODAY): 1}
+    
+    with app.app_context():
+        summary = ReportingService.sync_metrics(CUSTOMER_ID, today=TODAY)
+        
+        assert _queried_window(fake_ads) == (TODAY - timedelta(days=Reporting.INITIAL_SYNC_DAYS), TODAY)
+        # Campaigns Google Ads knows but we do not (999) are skipped.
+        assert summary['rows'] == 2
+        assert _daily_clicks() == {(campaigns['100'], TODAY): 5, (campaigns['101'], TODAY - timedelta(days=1)): 7}
+        assert db.session.get(MetricsSyncState, CUSTOMER_ID).last_synced_date == TODAY
+
+
+def test_resync_restates_the_lookback_window_only(app, fake_ads, ads_metrics, campaigns):
+    old_day = TODAY - timedelta(days=Reporting.LOOKBACK_DAYS + 1)
+    restated_day = TODAY - timedelta(days=1)
+    ads_metrics.clicks = {('100', old_day): 4, ('100', restated_day): 5, ('101', restated_day): 6, ('101', TODAY): 2}
+    tomorrow = TODAY + timedelta(days=1)
+    
+    with app.app_context():
+        ReportingService.sync_metrics(CUSTOMER_ID, today=TODAY)
+        
+        # Google Ads restates yesterday, drops a day to zero and changes a day outside the lookback window.
+        ads_metrics.clicks.update({('100', restated_day): 9, ('100', old_day): 40, ('100', tomorrow): 1})
+        del ads_metrics.clicks[('101', TODAY)]
+        ReportingService.sync_metrics(CUSTOMER_ID, today=tomorrow)
+        
+        assert _queried_window(fake_ads) == (TODAY - timedelta(days=Reporting.LOOKBACK_DAYS), tomorrow)
+        assert _daily_clicks() == {
+            (campaigns['100'], old_day): 4,
+            (campaigns['100'], restated_day): 9,
+            (campaigns['101'], restated_day): 6,
+            (campaigns['100'], tomorrow): 1,
+        }
+        
+        daily = {rollup.date: rollup.clicks for rollup in DailyMetricsRollup.query.all()}
+        assert daily == {old_day: 4, restated_day: 15, tomorrow: 1}
+        lifetime = {rollup.campaign_id: rollup.clicks for rollup in CampaignMetricsRollup.query.all()}
+        assert lifetime == {campaigns['100']: 14, campaigns['101']: 6}
+        assert db.session.get(MetricsSyncState, CUSTOMER_ID).last_synced_date == tomorrow
+
+
+def test_failed_sync_keeps_the_previous_metrics(app, fake_ads, ads_metrics, campaigns, retry_sleeps):
+    ads_metrics.clicks = {('100', TODAY): 5}
+    
+    with app.app_context():
+        ReportingService.sync_metrics(CUSTOMER_ID, today=TODAY)
+        fake_ads.error_rate = 1.0
+        
+        with pytest.raises(Exception):
+            ReportingService.sync_metrics(CUSTOMER_ID, today=TODAY + timedelta(days=1))
+        
+        assert _daily_clicks() == {(campaigns['100'], TODAY): 5}
+        assert db.session.get(MetricsSyncState, CUSTOMER_ID).last_synced_date == TODAY
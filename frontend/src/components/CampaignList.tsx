@@ -1,4 +1,4 @@
-import { useEffect, useState, useMemo } from 'react';
+import { useEffect, useState } from 'react';
 import type { Campaign } from '../types/campaign';
 import { campaignService } from '../services/campaignService';
 import { CAMPAIGN_STATUS } from '../lib/constants';
@@ -12,20 +12,24 @@ interface CampaignListProps {
 
 export default function CampaignList({ refresh, onError, onSuccess, onWarning }: CampaignListProps) {
   const [campaigns, setCampaigns] = useState<Campaign[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [filter, setFilter] = useState('');
   const [actionLoading, setActionLoading] = useState<Record<string, boolean>>({});
 
   useEffect(() => {
     loadCampaigns();
     // eslint-disable-next-line react-hooks/exhaustive-deps
-  }, [refresh]);
+  }, [refresh, filter]);
 
+  // Loads one page at a time; the status filter is applied by the API so pages only hold matching campaigns.
   const loadCampaigns = async () => {
     try {
       setLoading(true);
-      const data = await campaignService.getAllCampaigns();
-      setCampaigns(data);
+      const page = await campaignService.getCampaigns(null, filter);
+      setCampaigns(page.campaigns);
+      setNextCursor(page.nextCursor);
     } catch (err) {
       onError(err instanceof Error ? err.message : 'Failed to load campaigns');
     } finally {
@@ -33,11 +37,31 @@ export default function CampaignList({ refresh, onError, onSuccess, onWarning }:
     }
   };
 
+  const loadMore = async () => {
+    try {
+      setLoadingMore(true);
+      const page = await campaignService.getCampaigns(nextCursor, filter);
+      setCampaigns(prev => [...prev, ...page.campaigns]);
+      setNextCursor(page.nextCursor);
+    } catch (err) {
+      onError(err instanceof Error ? err.message : 'Failed to load campaigns');
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
+  const replaceCampaign = (updated: Campaign) => {
+    setCampaigns(prev => prev.flatMap(c => {
+      if (c.id !== updated.id) return [c];
+      return !filter || updated.status === filter ? [updated] : [];
+    }));
+  };
+
   const handlePublish = async (campaignId: string) => {
     try {
       setActionLoading(prev => ({ ...prev, [campaignId]: true }));
       const { campaign: updatedCampaign, warnings } = await campaignService.publishCampaign(campaignId);
-      setCampaigns(prev => prev.map(c => c.id === campaignId ? updatedCampaign : c));
+      replaceCampaign(updatedCampaign);
       
       if (warnings && warnings.length > 0) {
         onWarning(`Campaign published with warnings: ${warnings.join('; ')}`);
@@ -55,7 +79,7 @@ export default function CampaignList({ refresh, onError, onSuccess, onWarning }:
     try {
       setActionLoading(prev => ({ ...prev, [campaignId]: true }));
       const updatedCampaign = await campaignService.pauseCampaign(campaignId);
-      setCampaigns(prev => prev.map(c => c.id === campaignId ? updatedCampaign : c));
+      replaceCampaign(updatedCampaign);
       onSuccess('Campaign disabled successfully!');
     } catch (err) {
       onError(err instanceof Error ? err.message : 'Failed to disable campaign');
@@ -64,23 +88,11 @@ export default function CampaignList({ refresh, onError, onSuccess, onWarning }:
     }
   };
 
-  const filteredCampaigns = useMemo(() => 
-    filter ? campaigns.filter(c => c.status === filter) : campaigns,
-    [campaigns, filter]
-  );
-
-  const statusCounts = useMemo(() => ({
-    draft: campaigns.filter(c => c.status === CAMPAIGN_STATUS.DRAFT).length,
-    published: campaigns.filter(c => c.status === CAMPAIGN_STATUS.PUBLISHED).length,
-    enabled: campaigns.filter(c => c.status === CAMPAIGN_STATUS.ENABLED).length,
-    disabled: campaigns.filter(c => c.status === CAMPAIGN_STATUS.PAUSED).length
-  }), [campaigns]);
-
   const handleEnable = async (campaignId: string) => {
     try {
       setActionLoading(prev => ({ ...prev, [campaignId]: true }));
       const updatedCampaign = await campaignService.enableCampaign(campaignId);
-      setCampaigns(prev => prev.map(c => c.id === campaignId ? updatedCampaign : c));
+      replaceCampaign(updatedCampaign);
       onSuccess('Campaign enabled successfully! Billing is now active.');
     } catch (err) {
       onError(err instanceof Error ? err.message : 'Failed to enable campaign');
@@ -94,13 +106,15 @@ export default function CampaignList({ refresh, onError, onSuccess, onWarning }:
       DRAFT: '#6b7280',
       PUBLISHED: '#3b82f6',
       ENABLED: '#10b981',
-      PAUSED: '#dc2626'
+      PAUSED: '#dc2626',
+      REMOVED: '#9ca3af'
     };
     const labels: Record<string, string> = {
       DRAFT: 'Draft',
       PUBLISHED: 'Published',
       ENABLED: 'Enabled',
-      PAUSED: 'Disabled'
+      PAUSED: 'Disabled',
+      REMOVED: 'Removed'
     };
     return (
       <span style={{ color: colors[status], fontWeight: 600 }}>
@@ -121,23 +135,23 @@ export default function CampaignList({ refresh, onError, onSuccess, onWarning }:
   return (
     <div className="campaign-list">
       <div className="list-header">
-        <h2>Campaigns ({filteredCampaigns.length})</h2>
+        <h2>Campaigns ({campaigns.length}{nextCursor ? '+' : ''})</h2>
         <div className="filter-group">
           <label>Filter:</label>
           <select value={filter} onChange={(e) => setFilter(e.target.value)}>
-            <option value="">All ({campaigns.length})</option>
-            <option value={CAMPAIGN_STATUS.DRAFT}>Draft ({statusCounts.draft})</option>
-            <option value={CAMPAIGN_STATUS.PUBLISHED}>Published ({statusCounts.published})</option>
-            <option value={CAMPAIGN_STATUS.ENABLED}>Enabled ({statusCounts.enabled})</option>
-            <option value={CAMPAIGN_STATUS.PAUSED}>Disabled ({statusCounts.disabled})</option>
+            <option value="">All</option>
+            <option value={CAMPAIGN_STATUS.DRAFT}>Draft</option>
+            <option value={CAMPAIGN_STATUS.PUBLISHED}>Published</option>
+            <option value={CAMPAIGN_STATUS.ENABLED}>Enabled</option>
+            <option value={CAMPAIGN_STATUS.PAUSED}>Disabled</option>
           </select>
         </div>
       </div>
 
-      {filteredCampaigns.length === 0 ? (
+      {campaigns.length === 0 ? (
         <div className="empty-state">
           <p>
-            {campaigns.length === 0 
+            {!filter
               ? 'No campaigns found. Click "Create Campaign" to get started!' 
               : `No ${filter.toLowerCase()} campaigns found.`}
           </p>
@@ -154,7 +168,7 @@ export default function CampaignList({ refresh, onError, onSuccess, onWarning }:
               </tr>
             </thead>
             <tbody>
-              {filteredCampaigns.map((campaign) => (
+              {campaigns.map((campaign) => (
                 <tr key={campaign.id}>
                   <td>{campaign.name}</td>
                   <td>{getStatusText(campaign.status)}</td>
@@ -196,6 +210,13 @@ export default function CampaignList({ refresh, onError, onSuccess, onWarning }:
               ))}
             </tbody>
           </table>
+          {nextCursor && (
+            <div className="load-more">
+              <button className="btn-secondary" onClick={loadMore} disabled={loadingMore}>
+                {loadingMore ? 'Loading...' : 'Load more'}
+              </button>
+            </div>
+          )}
         </div>
       )}
     </div>
@@ -19,7 +19,8 @@ export const CAMPAIGN_STATUS = {
   DRAFT: 'DRAFT',
   PUBLISHED: 'PUBLISHED',
   ENABLED: 'ENABLED',
-  PAUSED: 'PAUSED'
+  PAUSED: 'PAUSED',
+  REMOVED: 'REMOVED'
 } as const;
 
 export type CampaignStatusType = typeof CAMPAIGN_STATUS[keyof typeof CAMPAIGN_STATUS];
@@ -1,4 +1,4 @@
-import type { Campaign, CreateCampaignRequest } from '../types/campaign';
+import type { Campaign, CampaignPage, CreateCampaignRequest } from '../types/campaign';
 import { API_BASE_URL } from '../lib/constants';
 import { formatApiError } from '../lib/apiErrors';
 
@@ -11,10 +11,14 @@ async function handleResponse(response: Response) {
 }
 
 export const campaignService = {
-  async getAllCampaigns(): Promise<Campaign[]> {
-    const response = await fetch(`${API_BASE_URL}/campaigns`);
+  async getCampaigns(cursor?: string | null, status?: string): Promise<CampaignPage> {
+    const params = new URLSearchParams();
+    if (cursor) params.set('cursor', cursor);
+    if (status) params.set('status', status);
+    const query = params.toString();
+    const response = await fetch(`${API_BASE_URL}/campaigns${query ? `?${query}` : ''}`);
     const data = await handleResponse(response);
-    return data.campaigns;
+    return { campaigns: data.campaigns, nextCursor: data.next_cursor };
   },
 
   async getCampaignById(id: string): Promise<Campaign> {
@@ -19,6 +19,11 @@ export interface Campaign {
   updated_at: string;
 }
 
+export interface CampaignPage {
+  campaigns: Campaign[];
+  nextCursor: string | null;
+}
+
 export interface CreateCampaignRequest {
   name: string;
   objective: string;